@@ -3,8 +3,8 @@ import inspect
 import numpy as np
 import matplotlib.pyplot as plt
 
-from lib32.NodeGraph import *
-import lib32.DataTools as dt
+from lib.NodeGraph import *
+import lib.DataTools as dt
 
 
 def meshgrid_linear(xmin, xmax, xsize, ymin, ymax, ysize):
@@ -77,7 +77,7 @@ def dim2_quarter_plane_sigmoid():
 	trainX, trainT = dt.addChannel(trainX, trainT)
 
 	# sset(2) ---> den1(2>2) ---> act1(Sigmoid) ---> den2(2>1) ---> act2(Sigmoid) ---> bce(1)
-	ng = NodeGraphAdaptive()
+	ng = NodeGraphAdaptive(precision='float32')
 	sset = ng.add(StartSet1D(2, name='sset'))
 	den1 = Dense1D(2, name='den1')
 	ng.add(den1, sset)
@@ -1,8 +1,8 @@
 from PIL import Image
 import numpy as np
 import matplotlib.pyplot as plt
-from lib32.NodeGraph import *
-import lib32.DataTools as dt
+from lib.NodeGraph import *
+import lib.DataTools as dt
 
 image = Image.open('../data/cat.bmp')
 pixel = np.array(image)
@@ -27,7 +27,7 @@ W2 = np.zeros((3, 3, 8, 8))
 for i in range(8):
 	W2[:, :, i] = W1[:, :, 0]
 
-ng = NodeGraphBatch()
+ng = NodeGraphBatch(precision='float32')
 sset = ng.add(StartSet2D((gray.shape[0], gray.shape[1]), 1))
 
 conv1 = ng.add(Conv2D((3, 3), 8), sset)
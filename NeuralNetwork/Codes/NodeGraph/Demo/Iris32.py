@@ -3,9 +3,9 @@ import warnings
 
 import matplotlib.pyplot as plt
 
-import lib32.DataTools as dt
-import lib32.PlotTools as pt
-from lib32.NodeGraph import *
+import lib.DataTools as dt
+import lib.PlotTools as pt
+from lib.NodeGraph import *
 
 from sklearn import datasets
 
@@ -27,11 +27,11 @@ trainX, trainT, testX, testT = dt.addChannel(trainX, trainT, testX, testT)
 def f0():
 	# sset(4) ---> den1(4>4) ---> act1(sigmoid) ---> den2(4>3) ---> act2(softmax) ---> cce
 	####### Batch ###############
-	# ng = NodeGraphBatch()
+	# ng = NodeGraphBatch(precision='float32')
 	# ng.lr = np.float32(.01)
 	# ng.epochMax = 100
 	####### Adaptive ###############
-	ng = NodeGraphAdaptive()
+	ng = NodeGraphAdaptive(precision='float32')
 	# ng.lrMin = np.float32(1.0e-2)
 	ng.epochMax = 1000
 	ng.lrInit = 0.01
@@ -53,11 +53,11 @@ def f1():
 	#		   \								  /
 	# 			-> den1(4>4) ---> act1(sigmoid) -
 	####### Batch ###############
-	# ng = NodeGraphBatch()
+	# ng = NodeGraphBatch(precision='float32')
 	# ng.lr = .01
 	# ng.epochMax = 100
 	####### Adaptive ###############
-	ng = NodeGraphAdaptive()
+	ng = NodeGraphAdaptive(precision='float32')
 	# ng.lrMin = np.float32(1.0e-2)
 	ng.epochMax = 10000
 	ng.lrInit = 0.05
@@ -2,10 +2,9 @@ import time
 
 import matplotlib.pyplot as plt
 
-import lib32.DataTools as dt
-import lib32.PlotTools as pt
-from lib32.NodeGraph import *
-from lib32.NodeSet import F1
+import lib.DataTools as dt
+import lib.PlotTools as pt
+from lib.NodeGraph import *
 
 
 def f0():
@@ -27,9 +26,9 @@ def f0():
 
 	# sset(13) ---> den0(13>20) ---> act0(sigmoid) ---> mp0(20>5) --> den1(5>3) ---> act1(softmax) ---> cce
 	####### Batch ###############
-	# ng = NodeGraphBatch()
+	# ng = NodeGraphBatch(precision='float32')
 	####### Adaptive ###############
-	ng = NodeGraphAdaptiveMinibatch()
+	ng = NodeGraphAdaptiveMinibatch(precision='float32')
 	ng.lrMin = np.float32(0.001)
 	ng.lrInit = np.float32(.1)
 	####### Common ###############
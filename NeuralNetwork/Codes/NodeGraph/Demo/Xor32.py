@@ -3,9 +3,9 @@ import time
 
 import matplotlib.pyplot as plt
 
-import lib32.DataTools as dt
-import lib32.PlotTools as pt
-from lib32.NodeGraph import *
+import lib.DataTools as dt
+import lib.PlotTools as pt
+from lib.NodeGraph import *
 
 
 def xor1(index=0):
@@ -23,9 +23,9 @@ def xor1(index=0):
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		# sset(2) ---> fset1(2>2) ---> act1(Sigmoid) ---> fset2(2>1) ---> act2(Sigmoid) ---> bce(1)
 		##### Adaptive ##########
-		ng = NodeGraphAdaptive()
+		ng = NodeGraphAdaptive(precision='float32')
 		##### Batch #############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		# ng.lr = np.float32(0.5)
 		# ng.mom = 0.0
 		##### Common ###############
@@ -57,11 +57,11 @@ def xor1(index=0):
 		#           --> fset12(2>2) --> act12(Relu) ---
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		ng = NodeGraphBatch()
+		ng = NodeGraphBatch(precision='float32')
 		ng.mom = np.float32(0.01)
 		ng.reg = Ridge(0.1)
 		####### Adaptive ###############
-		# ng = NodeGraphAdaptive()
+		# ng = NodeGraphAdaptive(precision='float32')
 		# ng.lrMin = np.float32(1.0e-2)
 		####### Common ###############
 		sset = ng.add(StartSet1D(2, name='sset'))
@@ -98,11 +98,11 @@ def xor1(index=0):
 		#			 -> fset12(2>5) ----> act12(Relu) ----
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		# ng.mom = np.float32(0.1)
 		# ng.reg = Ridge(0.01)
 		####### Adaptive ###############
-		ng = NodeGraphAdaptive()
+		ng = NodeGraphAdaptive(precision='float32')
 		ng.lrMin = np.float32(1.0e-2)
 		# ng.reg = Ridge(0.01)
 		####### Common ###############
@@ -148,9 +148,9 @@ def xor1(index=0):
 		#			 -> fset12(2>6) ----> act12(Relu) ----
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		####### Adaptive ###############
-		ng = NodeGraphAdaptiveMinibatch()
+		ng = NodeGraphAdaptiveMinibatch(precision='float32')
 		ng.lrMin = np.float32(1.0e-2)
 		####### Common ###############
 		sset = ng.add(StartSet1D(2, name='sset'))
@@ -218,9 +218,9 @@ def xor2(index=0):
 		# sset(2) ---> fset1(2>2) ---> act1(Sigmoid) ---> fset2(2>2) ---> act2(Softmax) ---> cce(2)
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		####### Adaptive ###############
-		ng = NodeGraphAdaptive()
+		ng = NodeGraphAdaptive(precision='float32')
 		####### Common ###############
 		sset = ng.add(StartSet1D(2, name='sset'))
 		fset1 = ng.add(Dense1D(2, name='fset1'), sset)
@@ -247,9 +247,9 @@ def xor2(index=0):
 		#           --> fset21(2->2) --> act21(Sigmoid) --> fset22(2->1) -
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		####### Adaptive ###############
-		ng = NodeGraphAdaptive()
+		ng = NodeGraphAdaptive(precision='float32')
 		####### Common ###############
 
 		sset = ng.add(StartSet1D(2, name='sset'))
@@ -283,10 +283,10 @@ def xor2(index=0):
 		# sset2(1) ----> fset21(1->2) --> act21(Sigmoid)  --
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		# ng.lr = .001
 		####### Adaptive ###############
-		ng = NodeGraphAdaptive()
+		ng = NodeGraphAdaptive(precision='float32')
 		ng.lrMin = .001
 		####### Common ###############
 		sset1 = ng.add(StartSet1D(1, name='sset1'))
@@ -323,10 +323,10 @@ def xor2(index=0):
 		#            -> fset21(2->12) --> act21(Relu) --> fset22(2->1) -----> act22(Sigmoid) ---/
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		# ng.lr = .01
 		####### Adaptive ###############
-		ng = NodeGraphAdaptive()
+		ng = NodeGraphAdaptive(precision='float32')
 		ng.lrInit = .5
 		ng.lrMin = .01
 		####### Common ###############
@@ -362,10 +362,10 @@ def xor2(index=0):
 		#            -> fset21(2->12) --> act21(Relu) --->  mp2(12->2) --
 		print(f'******************** {inspect.currentframe().f_code.co_name} ********************')
 		####### Batch ###############
-		# ng = NodeGraphBatch()
+		# ng = NodeGraphBatch(precision='float32')
 		# ng.lr = .01
 		####### Adaptive ###############
-		ng = NodeGraphAdaptiveMinibatch()
+		ng = NodeGraphAdaptiveMinibatch(precision='float32')
 		ng.lrInit = 1.0E-3
 		ng.lrMin = 1.0E-3
 		####### Common ###############
@@ -17,8 +17,8 @@ conv.W[0] = np.array([[[0, 0, 0], [.33, .33, .33], [0, 0, 0]], [[0, 0, 0], [0, 0
 conv.W[1] = np.array([[[0, 0, 0], [0, 0, 0], [0, 0, 0]], [[0, 0, 0], [.33, .33, .33], [0, 0, 0]], [[0, 0, 0], [0, 0, 0], [0, 0, 0]]], np.float)
 conv.W[2] = np.array([[[0, 0, 0], [0, 0, 0], [0, 0, 0]], [[0, 0, 0], [0, 0, 0], [0, 0, 0]], [[0, 0, 0], [0, 0, 0], [.33, .33, .33]]], np.float)
 conv.prePropTr(1)
-conv.resetForPush()
-sset.pushTr(trX)
+conv.xFrag('tr', 0)[:] = trX
+conv.pushTrX()
 
 # print(conv.trY.shape)
 im_out = dt.channelLast(conv.trY)[0]
@@ -129,8 +129,9 @@ def f2():
 	# te_img, te_lab = choose(test_images, test_labels, 10)
 	# trX, trT = dt.addChannel(tr_img / 255.0, dt.vectorizeTarget(tr_lab).astype(float))
 	# teX, teT = dt.addChannel(te_img / 255.0, dt.vectorizeTarget(te_lab).astype(float))
-	trX, trT = dt.addChannel(train_images / 255.0, dt.onehot(train_labels).astype(float))
-	teX, teT = dt.addChannel(test_images / 255.0, dt.onehot(test_labels).astype(float))
+	# float32 memory maps of images / 255 and one-hot labels cached on disk
+	trX, trT = dt.read_mnist_cached('train')
+	teX, teT = dt.read_mnist_cached('test')
 
 	# print(trX.shape, trT.shape)
 	# print(trX.dtype)
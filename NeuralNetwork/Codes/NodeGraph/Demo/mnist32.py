@@ -3,8 +3,8 @@ from cProfile import Profile
 from pstats import Stats
 
 import numpy as np
-import lib32.DataTools as dt
-from lib32.NodeGraph import *
+import lib.DataTools as dt
+from lib.NodeGraph import *
 import matplotlib.pyplot as plt
 
 train_labels, train_images = dt.read_mnist_train()
@@ -37,7 +37,7 @@ def f00():
 	# print(trX.shape, trT.shape)
 	# return
 	# sset(784) ---> flat ---> den1(784>100) ---> act1() ---> den2(100>10) ---> act2 ---> cce
-	ng = NodeGraphAdaptive()
+	ng = NodeGraphAdaptive(precision='float32')
 	sset = ng.add(StartSet2D((w, h)))
 	flat = ng.add(Flat2D(), sset)
 	den1 = ng.add(Dense1D(100), flat)
@@ -81,7 +81,7 @@ def f01():
 	teT = dt.addChannel(dt.onehot(test_labels))
 
 	# sset(784) ---> flat ---> den1(784>100) ---> act1() ---> den2(100>10) ---> act2 ---> cce
-	ng = NodeGraphAdaptiveMinibatch()
+	ng = NodeGraphAdaptiveMinibatch(precision='float32')
 	sset = ng.add(StartSet2D((w,h)))
 	flat = ng.add(Flat2D(), sset)
 	den1 = ng.add(Dense1D(128), flat)
@@ -129,11 +129,11 @@ def f10():
 	# print(trX.dtype)
 	# return
 	################################################
-	ng = NodeGraphAdaptive()
+	ng = NodeGraphAdaptive(precision='float32')
 	ng.lrMin = np.float32(1.0E-6)
 	ng.lrInit = np.float32(0.0001)
 	################################################
-	# ng = NodeGraphBatch()
+	# ng = NodeGraphBatch(precision='float32')
 	################################################
 	# sset(28,28) ---> conv((3,3), 32) ---> mp((2,2)) ---> flat ---> den1(100) ---> act1 ---> den2(10) ---> act2 ---> loss
 	sset = ng.add(StartSet2D((trX.shape[1], trX.shape[2]), trX.shape[3]))
@@ -182,11 +182,11 @@ def f11():
 	# print(trX.dtype)
 	# return
 	################################################
-	ng = NodeGraphAdaptive()
+	ng = NodeGraphAdaptive(precision='float32')
 	ng.lrMin = np.float32(1.0E-8)
 	ng.lrInit = np.float32(0.0001)
 	################################################
-	# ng = NodeGraphBatch()
+	# ng = NodeGraphBatch(precision='float32')
 	################################################
 	# sset(28,28) ---> conv1((3,3), 32) ---> act1 ---> mp1((2,2)) ---> conv2((3,3), 32) ---> act2 ---> mp2((2,2))
 	# 		---> flat ---> den1(100) ---> act1 ---> den2(10) ---> act2 ---> loss
@@ -242,11 +242,11 @@ def f20():
 	# print(trX.dtype)
 	# return
 	################################################
-	ng = NodeGraphAdaptiveMinibatch()
+	ng = NodeGraphAdaptiveMinibatch(precision='float32')
 	ng.lrMin = np.float32(1.0E-6)
 	ng.lrInit = np.float32(0.0001)
 	################################################
-	# ng = NodeGraphBatch()
+	# ng = NodeGraphBatch(precision='float32')
 	################################################
 	# sset(28,28) ---> conv((3,3), 32) ---> act1 ---> mp((2,2)) ---> flat ---> den1(100) ---> act1 ---> den2(10) ---> act2 ---> loss
 	sset = ng.add(StartSet2D((w,h)))
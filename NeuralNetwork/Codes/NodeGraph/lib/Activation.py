@@ -7,9 +7,22 @@ class Activation1D(MidSet1D, metaclass=ABCMeta):
 	"""Activation
 	"""
 
+	# whether the activation is elementwise, then it is computed in place by a fit set followed by it
+	#	activate(y) and derivate(y, grad) compute the activation and its derivative in place
+	fusible: bool = False
+
 	def __init__(self, name: str = None):
 		super().__init__(UNKNOWN, UNKNOWN, name)
 
+		# whether predictions are computed in place, prY is prX
+		#	set by NodeGraph.freeze()
+		self.inPlace: bool = False
+
+		# fit set computing this activation in place, set by compile()
+		self.fitSet: Union[MidSet1D, MidSet2D, None] = None
+		# loss function computing this activation with its gradient, set by compile()
+		self.lossFunc = None
+
 	def compile(self) -> bool:
 		if super().compile():
 			self.ydim = self.xdim
@@ -18,6 +31,42 @@ class Activation1D(MidSet1D, metaclass=ABCMeta):
 		else:
 			return False
 
+	def prePropPr(self, prSiz: int):
+		super().prePropPr(prSiz)
+		if self.inPlace:
+			self.prY = self.prX
+
+	def bindY(self, kind: str, y: np.ndarray) -> bool:
+		if self.fitSet is not None:
+			# outputs are the outputs of the fit set
+			if not self.fitSet.bindY(kind, y):
+				return False
+			setattr(self, kind + 'X', y)
+			setattr(self, kind + 'Y', y)
+			return True
+		if self.inPlace and kind == 'pr':
+			# prevSets write into y too
+			self.prX = self.prY = y
+			return True
+		return super().bindY(kind, y)
+
+	def bindGradY(self, gradY: np.ndarray) -> bool:
+		if self.fitSet is not None:
+			# gradients are gradY of the fit set
+			if not self.fitSet.bindGradY(gradY):
+				return False
+			self.gradX = self.gradY = gradY
+			return True
+		return super().bindGradY(gradY)
+
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		if self.fitSet is not None or self.inPlace and kind == 'pr':
+			return ()
+		if self.lossFunc is not None:
+			# inputs are read by the loss function after propagation
+			return ()
+		return super().plannedBuffers(kind)
+
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.ydim}, {self.ychs})'
 
@@ -35,6 +84,8 @@ class Activation1D(MidSet1D, metaclass=ABCMeta):
 
 
 class Identity1D(Activation1D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -54,9 +105,17 @@ class Identity1D(Activation1D):
 	def pullGradY(self):
 		self.gradX[:] = self.gradY
 
+	def activate(self, y: np.ndarray):
+		pass
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		pass
+
 
 class Relu1D(Activation1D):
 	EPSILON = 1.0e-300
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -81,8 +140,16 @@ class Relu1D(Activation1D):
 		"""
 		np.multiply(self.trX > Relu1D.EPSILON, self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		np.multiply(y > Relu1D.EPSILON, y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		np.multiply(y > Relu1D.EPSILON, grad, grad)
+
 
 class Sigmoid1D(Activation1D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -105,8 +172,16 @@ class Sigmoid1D(Activation1D):
 		"""
 		np.multiply((1 - self.trY) * self.trY, self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		expit(y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		grad *= (1 - y) * y
+
 
 class Softplus1D(Activation1D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -129,8 +204,17 @@ class Softplus1D(Activation1D):
 		"""
 		np.multiply(1 - np.exp(-self.trY), self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		np.logaddexp(0, y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		# sigmoid(x) = 1 - exp(-y)
+		grad *= -np.expm1(-y)
+
 
 class Tanh1D(Activation1D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -153,6 +237,12 @@ class Tanh1D(Activation1D):
 		"""
 		np.multiply(1 - self.trY * self.trY, self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		np.tanh(y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		grad *= 1 - y * y
+
 
 class Softmax1D(Activation1D):
 	def __init__(self, name: str = None):
@@ -209,9 +299,20 @@ class Activation2D(MidSet2D, metaclass=ABCMeta):
 	"""Activation
 	"""
 
+	# whether the activation is elementwise, then it is computed in place by a fit set followed by it
+	#	activate(y) and derivate(y, grad) compute the activation and its derivative in place
+	fusible: bool = False
+
 	def __init__(self, name: str = None):
 		super().__init__(UNKNOWN, UNKNOWN, name)
 
+		# whether predictions are computed in place, prY is prX
+		#	set by NodeGraph.freeze()
+		self.inPlace: bool = False
+
+		# fit set computing this activation in place, set by compile()
+		self.fitSet: Union[MidSet1D, MidSet2D, None] = None
+
 	def compile(self) -> bool:
 		if super().compile():
 			self.ydim:tuple = self.xdim
@@ -220,6 +321,39 @@ class Activation2D(MidSet2D, metaclass=ABCMeta):
 		else:
 			return False
 
+	def prePropPr(self, prSiz: int):
+		super().prePropPr(prSiz)
+		if self.inPlace:
+			self.prY = self.prX
+
+	def bindY(self, kind: str, y: np.ndarray) -> bool:
+		if self.fitSet is not None:
+			# outputs are the outputs of the fit set
+			if not self.fitSet.bindY(kind, y):
+				return False
+			setattr(self, kind + 'X', y)
+			setattr(self, kind + 'Y', y)
+			return True
+		if self.inPlace and kind == 'pr':
+			# prevSets write into y too
+			self.prX = self.prY = y
+			return True
+		return super().bindY(kind, y)
+
+	def bindGradY(self, gradY: np.ndarray) -> bool:
+		if self.fitSet is not None:
+			# gradients are gradY of the fit set
+			if not self.fitSet.bindGradY(gradY):
+				return False
+			self.gradX = self.gradY = gradY
+			return True
+		return super().bindGradY(gradY)
+
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		if self.fitSet is not None or self.inPlace and kind == 'pr':
+			return ()
+		return super().plannedBuffers(kind)
+
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, ({self.ydim[0]},{self.ydim[1]}), {self.ychs})'
 
@@ -237,6 +371,8 @@ class Activation2D(MidSet2D, metaclass=ABCMeta):
 
 
 class Identity2D(Activation2D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -256,9 +392,17 @@ class Identity2D(Activation2D):
 	def pullGradY(self):
 		self.gradX[:] = self.gradY
 
+	def activate(self, y: np.ndarray):
+		pass
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		pass
+
 
 class Relu2D(Activation2D):
 	EPSILON = 1.0e-300
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -283,8 +427,16 @@ class Relu2D(Activation2D):
 		"""
 		np.multiply(self.trX > Relu2D.EPSILON, self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		np.multiply(y > Relu2D.EPSILON, y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		np.multiply(y > Relu2D.EPSILON, grad, grad)
+
 
 class Sigmoid2D(Activation2D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -307,8 +459,16 @@ class Sigmoid2D(Activation2D):
 		"""
 		np.multiply((1 - self.trY) * self.trY, self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		expit(y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		grad *= (1 - y) * y
+
 
 class Softplus2D(Activation2D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -331,8 +491,17 @@ class Softplus2D(Activation2D):
 		"""
 		np.multiply(1 - np.exp(-self.trY), self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		np.logaddexp(0, y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		# sigmoid(x) = 1 - exp(-y)
+		grad *= -np.expm1(-y)
+
 
 class Tanh2D(Activation2D):
+	fusible = True
+
 	def __init__(self, name: str = None):
 		super().__init__(name)
 
@@ -355,6 +524,12 @@ class Tanh2D(Activation2D):
 		"""
 		np.multiply(1 - self.trY * self.trY, self.gradY, self.gradX)
 
+	def activate(self, y: np.ndarray):
+		np.tanh(y, y)
+
+	def derivate(self, y: np.ndarray, grad: np.ndarray):
+		grad *= 1 - y * y
+
 
 class Softmax2D(Activation2D):
 	def __init__(self, name: str = None):
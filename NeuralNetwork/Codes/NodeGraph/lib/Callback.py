@@ -0,0 +1,74 @@
+from typing import Dict, Union
+
+import numpy as np
+
+
+class Callback:
+	"""hooks called by trainers of NodeGraph
+		onFitStart after parameters are initialized, onEpochEnd after the metrics of each epoch are evaluated,
+		and onFitEnd after the last epoch
+		logs of an epoch are 'trLoss' and 'trAccuracy', and 'teLoss' and 'teAccuracy' if fitting with test data"""
+
+	def onFitStart(self, ng):
+		pass
+
+	def onEpochEnd(self, ng, epoch: int, logs: Dict[str, float]) -> bool:
+		"""
+		:return: whether fitting stops
+		"""
+		return False
+
+	def onFitEnd(self, ng):
+		pass
+
+
+class EarlyStopping(Callback):
+	"""stop fitting if the monitored log has not improved by minDelta for patience epochs
+		parameters of the best epoch are kept in memory, and restored at the end of fitting if restoreBest"""
+
+	def __init__(self, monitor: str = 'teLoss', patience: int = 10, minDelta: float = 0.0, restoreBest: bool = True):
+		"""
+		:param monitor: one of 'teLoss', 'teAccuracy', 'trLoss' and 'trAccuracy', accuracies are maximized
+		:param patience: the number of epochs without improvement before stopping
+		:param minDelta: the least change counted as improvement
+		"""
+		self.monitor: str = monitor
+		self.patience: int = patience
+		self.minDelta: float = minDelta
+		self.restoreBest: bool = restoreBest
+		self.maximize: bool = monitor.endswith('Accuracy')
+		self.best: float = np.nan
+		self.bestEpoch: int = -1
+		# epoch at which fitting was stopped, -1 if not stopped
+		self.stopEpoch: int = -1
+		self.__params: Union[np.ndarray, None] = None
+
+	def onFitStart(self, ng):
+		self.best = -np.inf if self.maximize else np.inf
+		self.bestEpoch = -1
+		self.stopEpoch = -1
+		self.__params = None
+
+	def onEpochEnd(self, ng, epoch: int, logs: Dict[str, float]) -> bool:
+		if self.monitor not in logs:
+			raise Exception(f'{self.monitor} is not evaluated, logs are {tuple(logs)}')
+		value = logs[self.monitor]
+		if np.isnan(value):
+			# not evaluated at this epoch
+			return False
+		if self.maximize and value > self.best + self.minDelta or not self.maximize and value < self.best - self.minDelta:
+			self.best = value
+			self.bestEpoch = epoch
+			if self.restoreBest:
+				self.__params = ng.flat.snapshot()
+		elif epoch - self.bestEpoch >= self.patience:
+			self.stopEpoch = epoch
+			return True
+		return False
+
+	def onFitEnd(self, ng):
+		if self.restoreBest and self.__params is not None:
+			ng.flat.restore(self.__params)
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({self.monitor}, {self.patience}, {self.minDelta})'
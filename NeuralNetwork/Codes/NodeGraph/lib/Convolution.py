@@ -1,18 +1,28 @@
-from threading import Thread
-
 from .FitSet import *
-from .Regularizer import *
+from .Util import windows1D, windows2D
+
+# computation methods of convolutions
+#	'im2col': strided windows are collected into one matrix and multiplied at once
+#	'loop': python loop over output positions, kept as a reference implementation
+CONV_METHODS = ('im2col', 'loop')
 
 
 class Conv1D(FitSet1D):
-	def __init__(self, filSiz: int, nFilter: int, biased: bool = True, padding: int = None, stride: int = 1, name: str = None):
+	def __init__(self, filSiz: int, nFilter: int, biased: bool = True, padding: int = None, stride: int = 1, name: str = None,
+				 method: str = 'im2col'):
 		""" nFilter = ychs: the number of output channels
-		    if padding is None, then padding = (kernelSize - 1) // 2 """
+		    if padding is None, then padding = (kernelSize - 1) // 2
+		    method: one of CONV_METHODS """
 		super().__init__(UNKNOWN, nFilter, name)
+		if method not in CONV_METHODS:
+			raise ValueError(f'unknown method {method}')
 		self.filSiz: int = filSiz
 		self.pad: int = (filSiz - 1) // 2 if padding is None else padding
 		self.stride: int = stride
 		self.biased: bool = biased
+		self.method: str = method
+		# minimum number of data in a chunk submitted to the executor
+		self.chunkMin: int = 1024
 		self.xdimExt: int = UNKNOWN
 		self.initB: Union[np.ndarray, None] = None
 		self.initW: Union[np.ndarray, None] = None
@@ -24,10 +34,6 @@ class Conv1D(FitSet1D):
 		self.gradW: Union[np.ndarray, None] = None
 		self.gradBPrev: Union[np.ndarray, None] = None
 		self.gradWPrev: Union[np.ndarray, None] = None
-		# regularizer
-		self.reg: Regularizer = RegNone()
-		# momentum
-		self.mom: float = 0.0
 
 	def compile(self) -> bool:
 		if super(Conv1D, self).compile():
@@ -38,8 +44,6 @@ class Conv1D(FitSet1D):
 			return False
 
 	def preFit(self, **kwargs):
-		self.reg = kwargs['regularizer']
-		self.mom = kwargs['momentum']
 		if self.initB is None:
 			self.initB = np.zeros(self.ychs)
 		if self.initW is None:
@@ -54,65 +58,30 @@ class Conv1D(FitSet1D):
 		self.gradWPrev = np.zeros_like(self.W)
 
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.zeros((trSiz, self.xdimExt, self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
+		self.trX = np.zeros((trSiz, self.xdimExt, self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
-		self.teX = np.zeros((teSiz, self.xdimExt, self.xchs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs))
+		self.teX = np.zeros((teSiz, self.xdimExt, self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype)
 
 	def prePropTr(self, trSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.zeros((trSiz, self.xdimExt, self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
+		self.trX = np.zeros((trSiz, self.xdimExt, self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
 
 	def prePropTe(self, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.teX = np.zeros((teSiz, self.xdimExt, self.xchs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs))
+		self.teX = np.zeros((teSiz, self.xdimExt, self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype)
 
 	def prePropPr(self, prSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.prX = np.zeros((prSiz, self.xdimExt, self.xchs))
-		self.prY = np.empty((prSiz, self.ydim, self.ychs))
+		self.prX = np.zeros((prSiz, self.xdimExt, self.xchs), self.dtype)
+		self.prY = np.empty((prSiz, self.ydim, self.ychs), self.dtype)
 
-	def pushBoth(self, index: int, trXFrag: np.ndarray, teXFrag: np.ndarray):
-		"""forward propagation
-		"""
-		self.trX[:, self.pad:self.pad + self.xdim, self.startXs[index]:self.endXs[index]] = trXFrag
-		self.teX[:, self.pad:self.pad + self.xdim, self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushBothX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushBoth(nind, self.trY, self.teY)
-
-	def pushTr(self, index: int, trXFrag: np.ndarray):
-		self.trX[:, self.pad:self.pad + self.xdim, self.startXs[index]:self.endXs[index]] = trXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTr(nind, self.trY)
-
-	def pushTe(self, index: int, teXFrag: np.ndarray):
-		self.teX[:, self.pad:self.pad + self.xdim, self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTeX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTe(nind, self.teY)
-
-	def pushPr(self, index: int, prXFrag: np.ndarray):
-		self.prX[:, self.pad:self.pad + self.xdim, self.startXs[index]:self.endXs[index]] = prXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushPrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushPr(nind, self.prY)
+	def xFrag(self, kind: str, index: int) -> np.ndarray:
+		"""inputs are written inside the padding"""
+		return getattr(self, kind + 'X')[:, self.pad:self.pad + self.xdim, self.startXs[index]:self.endXs[index]]
 
 	def __pushXPartial(self, x: np.ndarray, y: np.ndarray, start: int, end: int):
 		s = 0
@@ -120,27 +89,24 @@ class Conv1D(FitSet1D):
 			y[start:end, j] = np.tensordot(x[start:end, s:s + self.filSiz], self.W)
 			s += self.stride
 		y[start:end] += self.B
+		if self.act is not None:
+			self.act.activate(y[start:end])
+
+	def __pushXIm2col(self, x: np.ndarray, y: np.ndarray, start: int, end: int):
+		# cols[i * ydim + j] = x[start + i, j * stride:j * stride + filSiz].flatten()
+		cols = windows1D(x[start:end], self.filSiz, self.stride, self.ydim).reshape((-1, self.filSiz * self.xchs))
+		y = y[start:end]
+		if y.flags.c_contiguous:
+			np.matmul(cols, self.W.reshape((-1, self.ychs)), y.reshape((-1, self.ychs)))
+		else:
+			y[:] = np.matmul(cols, self.W.reshape((-1, self.ychs))).reshape(y.shape)
+		y += self.B
+		if self.act is not None:
+			self.act.activate(y)
 
 	def __pushX(self, x: np.ndarray, y: np.ndarray):
-		if y.shape[0] < 1024:  # number of data
-			self.__pushXPartial(x, y, 0, y.shape[0])
-			return
-		if y.shape[0] < 4096:
-			nth = 16
-		else:
-			# import multiprocessing
-			# nth = 2 * multiprocessing.cpu_count()
-			nth = 32  # number of threads
-		siz = (y.shape[0] - 1) // nth + 1
-		ths = []
-		start = 0
-		for i in range(nth):
-			th = Thread(target=self.__pushXPartial, args=(x, y, start, start + siz))
-			ths.append(th)
-			th.start()
-			start += siz
-		for th in ths:
-			th.join()
+		partial = self.__pushXIm2col if self.method == 'im2col' else self.__pushXPartial
+		self.executor.run(lambda start, end: partial(x, y, start, end), y.shape[0], self.chunkMin)
 
 	def pushTrX(self):
 		"""forward propagation
@@ -177,17 +143,8 @@ class Conv1D(FitSet1D):
 			obtain self.trY and self.teY from self.trX and self.teX resp.
 			inherited from MidSet
 		"""
-		if self.trY.shape[0] < 1024:  # number of data
-			s = 0
-			for j in range(self.ydim):
-				self.trY[:, j] = np.tensordot(self.trX[:, s:s + self.filSiz], self.W)
-				self.teY[:, j] = np.tensordot(self.teX[:, s:s + self.filSiz], self.W)
-				s += self.stride
-			self.trY += self.B
-			self.teY += self.B
-		else:
-			self.__pushX(self.trX, self.trY)
-			self.__pushX(self.teX, self.teY)
+		self.__pushX(self.trX, self.trY)
+		self.__pushX(self.teX, self.teY)
 
 	def pushTeX(self):
 		"""forward propagation
@@ -203,29 +160,33 @@ class Conv1D(FitSet1D):
 		"""
 		self.__pushX(self.prX, self.prY)
 
-	def resetForPull(self):
-		self.gradNeeds = len(self.nextSets)
-		# self.gradX.fill(0.0)
-		# self.gradW.fill(0.0)
-		self.gradY.fill(0.0)
+	def gradXFrag(self, index: int) -> np.ndarray:
+		return self.gradX[:, self.pad:self.pad + self.xdim, self.startXs[index]:self.endXs[index]]
 
-	def pullGrad(self, gradYFrag: np.ndarray):
-		"""backward propagation
-		"""
-		self.gradY += gradYFrag
-		self.gradNeeds -= 1
-		if self.gradNeeds == 0:
-			self.pullGradY()
-			for i, pset in enumerate(self.prevSets):
-				pset.pullGrad(self.gradX[:, self.pad:self.xdim + self.pad, self.startXs[i]:self.endXs[i]])
-
-	def __pullGradYPartial(self, w: np.ndarray, start: int, end: int):
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		# inputs keep zero padding, gradX is cleared by pullGradY
+		return ('gradX', 'gradY') if kind == 'grad' else (kind + 'Y',)
+
+	def __pullGradYPartial(self, start: int, end: int) -> np.ndarray:
+		w = np.zeros_like(self.W)
 		s = 0
 		for k in range(self.ydim):
 			t = s + self.filSiz
 			w += np.tensordot(self.trX[start:end, s:t], self.gradY[start:end, k], axes=(0, 0))
 			self.gradX[start:end, s:t] += np.tensordot(self.gradY[start:end, k], self.W, axes=(1, 2))
 			s += self.stride
+		return w
+
+	def __pullGradYIm2col(self, start: int, end: int) -> np.ndarray:
+		cols = windows1D(self.trX[start:end], self.filSiz, self.stride, self.ydim).reshape((-1, self.filSiz * self.xchs))
+		gradY = self.gradY[start:end].reshape((-1, self.ychs))
+		w = np.matmul(cols.T, gradY).reshape(self.W.shape)
+		# col2im: gradCols[:, j, k] is added to gradX[:, j * stride + k]
+		gradCols = np.matmul(gradY, self.W.reshape((-1, self.ychs)).T).reshape((-1, self.ydim, self.filSiz, self.xchs))
+		t = (self.ydim - 1) * self.stride + 1
+		for k in range(self.filSiz):
+			self.gradX[start:end, k:k + t:self.stride] += gradCols[:, :, k]
+		return w
 
 	def pullGradY(self):
 		############################### gradW ###################################################################
@@ -280,53 +241,18 @@ class Conv1D(FitSet1D):
 		# 	# self.gradX[:, s:s + self.filSiz] += np.tensordot(yt[k], self.W, axes=(1, 2))
 		# 	s += self.stride
 		################################################################################################
+		if self.act is not None:
+			self.act.derivate(self.trY, self.gradY)
 		if self.biased:
 			self.gradY.sum((0,1), out=self.gradB)
 		self.gradX.fill(0.0)
-		if self.trY.shape[0] < 1024:  # size of data
-			self.gradW.fill(0.0)
-			self.__pullGradYPartial(self.gradW, 0, self.trY.shape[0])
-			self.gradW += self.reg.grad(self.W)
-			return
-		if self.trY.shape[0] < 4096:
-			nth = 16  # number of threads
-		else:
-			# import multiprocessing
-			# nth = multiprocessing.cpu_count()
-			nth = 32  # number of threads
-		siz = (self.trY.shape[0] - 1) // nth + 1
-		ws = np.zeros((nth,) + self.W.shape)
-		ths = []
-		start = 0
-		for w in ws:
-			th = Thread(target=self.__pullGradYPartial, args=(w, start, start + siz))
-			ths.append(th)
-			th.start()
-			start += siz
-		for th in ths:
-			th.join()
-		ws.sum(0, out=self.gradW)
-		self.gradW += self.reg.grad(self.W)
-
-	def updateBatch(self, lr: float):
-		"""
-		:param lr: learning rate
-		"""
-		# self.gradBPrev = self.momentum * self.gradBPrev + lr * self.gradB
-		# self.gradWPrev = self.momentum * self.gradWPrev + lr * self.gradW
-		self.gradBPrev *= self.mom
-		self.gradWPrev *= self.mom
-		self.gradBPrev += lr * self.gradB
-		self.gradWPrev += lr * self.gradW
-		self.B -= self.gradBPrev
-		self.W -= self.gradWPrev
-
-	def updateAdaptive(self, lr: float):
-		"""
-		:param lr: learning rate
-		"""
-		np.subtract(self.BPrev, np.multiply(lr, self.gradBPrev, self.B), self.B)
-		np.subtract(self.WPrev, np.multiply(lr, self.gradWPrev, self.W), self.W)
+		partial = self.__pullGradYIm2col if self.method == 'im2col' else self.__pullGradYPartial
+		ws = self.executor.run(partial, self.trY.shape[0], self.chunkMin)
+		np.sum(ws, 0, out=self.gradW)
+
+	def params(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+		"""parameters with their gradients updated by optimizers"""
+		return [(self.B, self.gradB), (self.W, self.gradW)] if self.biased else [(self.W, self.gradW)]
 
 	def sendCurrToPrev(self):
 		self.B, self.BPrev = self.BPrev, self.B
@@ -335,9 +261,6 @@ class Conv1D(FitSet1D):
 		self.gradW, self.gradWPrev = self.gradWPrev, self.gradW
 
 	# noinspection PyTypeChecker
-	def gradDot(self) -> float:
-		return np.sum(self.gradB * self.gradBPrev) + np.sum(self.gradW * self.gradWPrev)
-
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.filSiz})'
 
@@ -349,7 +272,7 @@ class Conv1D(FitSet1D):
 		return s[:-1] + ')'
 
 	def saveStr(self) -> str:
-		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.filSiz}, {self.ychs}, {self.biased}, {self.pad}, {self.stride};'
+		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.filSiz}, {self.ychs}, {self.biased}, {self.pad}, {self.stride}, {self.method};'
 		for pset in self.prevSets:
 			s += f' {pset.Id},'
 		return s[:-1] + ')'
@@ -357,15 +280,21 @@ class Conv1D(FitSet1D):
 
 class Conv2D(FitSet2D):
 	def __init__(self, filSiz: Union[tuple, list], nFilter: int, biased: bool = True, padding: Union[int, tuple, list] = None,
-				 stride: Union[int, tuple, list] = 1, name: str = None):
+				 stride: Union[int, tuple, list] = 1, name: str = None, method: str = 'im2col'):
 		""" nFilter = ychs: the number of output channels
-		    if padding is None, then padding = ((filSiz[0] - 1) // 2, (filSiz[1] - 1) // 2) """
+		    if padding is None, then padding = ((filSiz[0] - 1) // 2, (filSiz[1] - 1) // 2)
+		    method: one of CONV_METHODS """
 		super().__init__(UNKNOWN, nFilter, name)
+		if method not in CONV_METHODS:
+			raise ValueError(f'unknown method {method}')
 		self.filSiz: tuple = tuple(filSiz)
 		self.pad: tuple = ((filSiz[0] - 1) // 2, (filSiz[1] - 1) // 2) if padding is None else \
 			(padding, padding) if isinstance(padding, int) else tuple(padding)
 		self.stride: tuple = (stride, stride) if isinstance(stride, int) else tuple(stride)
 		self.biased: bool = biased
+		self.method: str = method
+		# minimum number of data in a chunk submitted to the executor
+		self.chunkMin: int = 64
 		self.xdimExt: tuple = UNKNOWN
 		self.initB: Union[np.ndarray, None] = None
 		self.initW: Union[np.ndarray, None] = None
@@ -377,10 +306,6 @@ class Conv2D(FitSet2D):
 		self.gradW: Union[np.ndarray, None] = None
 		self.gradBPrev: Union[np.ndarray, None] = None
 		self.gradWPrev: Union[np.ndarray, None] = None
-		# regularizer
-		self.reg: Regularizer = RegNone()
-		# momentum
-		self.mom: float = 0.0
 
 	def compile(self) -> bool:
 		if super().compile():
@@ -391,8 +316,6 @@ class Conv2D(FitSet2D):
 			return False
 
 	def preFit(self, **kwargs):
-		self.reg = kwargs['regularizer']
-		self.mom = kwargs['momentum']
 		if self.initB is None:
 			self.initB = np.zeros(self.ychs)
 		if self.initW is None:
@@ -407,65 +330,31 @@ class Conv2D(FitSet2D):
 		self.gradWPrev = np.zeros_like(self.W)
 
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.zeros((trSiz, self.xdimExt[0], self.xdimExt[1], self.xchs))
-		self.trY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.trX = np.zeros((trSiz, self.xdimExt[0], self.xdimExt[1], self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
-		self.teX = np.zeros((teSiz, self.xdimExt[0], self.xdimExt[1], self.xchs))
-		self.teY = np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.teX = np.zeros((teSiz, self.xdimExt[0], self.xdimExt[1], self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
 	def prePropTr(self, trSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.zeros((trSiz, self.xdimExt[0], self.xdimExt[1], self.xchs))
-		self.trY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.trX = np.zeros((trSiz, self.xdimExt[0], self.xdimExt[1], self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
 
 	def prePropTe(self, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.teX = np.zeros((teSiz, self.xdimExt[0], self.xdimExt[1], self.xchs))
-		self.teY = np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.teX = np.zeros((teSiz, self.xdimExt[0], self.xdimExt[1], self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
 	def prePropPr(self, prSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.prX = np.zeros((prSiz, self.xdimExt[0], self.xdimExt[1], self.xchs))
-		self.prY = np.empty((prSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.prX = np.zeros((prSiz, self.xdimExt[0], self.xdimExt[1], self.xchs), self.dtype)
+		self.prY = np.empty((prSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
-	def pushBoth(self, index: int, trXFrag: np.ndarray, teXFrag: np.ndarray):
-		"""forward propagation
-		"""
-		self.trX[:, self.pad[0]:self.pad[0] + self.xdim[0], self.pad[1]:self.pad[1] + self.xdim[1], self.startXs[index]:self.endXs[index]] = trXFrag
-		self.teX[:, self.pad[0]:self.pad[0] + self.xdim[0], self.pad[1]:self.pad[1] + self.xdim[1], self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushBothX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushBoth(nind, self.trY, self.teY)
-
-	def pushTr(self, index: int, trXFrag: np.ndarray):
-		self.trX[:, self.pad[0]:self.pad[0] + self.xdim[0], self.pad[1]:self.pad[1] + self.xdim[1], self.startXs[index]:self.endXs[index]] = trXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTr(nind, self.trY)
-
-	def pushTe(self, index: int, teXFrag: np.ndarray):
-		self.teX[:, self.pad[0]:self.pad[0] + self.xdim[0], self.pad[1]:self.pad[1] + self.xdim[1], self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTeX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTe(nind, self.teY)
-
-	def pushPr(self, index: int, prXFrag: np.ndarray):
-		self.prX[:, self.pad[0]:self.pad[0] + self.xdim[0], self.pad[1]:self.pad[1] + self.xdim[1], self.startXs[index]:self.endXs[index]] = prXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushPrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushPr(nind, self.prY)
+	def xFrag(self, kind: str, index: int) -> np.ndarray:
+		"""inputs are written inside the padding"""
+		return getattr(self, kind + 'X')[:, self.pad[0]:self.pad[0] + self.xdim[0], self.pad[1]:self.pad[1] + self.xdim[1],
+			   self.startXs[index]:self.endXs[index]]
 
 	def __pushXPartial(self, x: np.ndarray, y: np.ndarray, start: int, end: int):
 		s0 = 0
@@ -476,30 +365,25 @@ class Conv2D(FitSet2D):
 				y[start:end, i, j] = np.tensordot(x[start:end, s0:t0, s1:s1 + self.filSiz[1]], self.W, axes=3)
 				s1 += self.stride[1]
 			s0 += self.stride[0]
-		self.trY[start:end] += self.B
+		y[start:end] += self.B
+		if self.act is not None:
+			self.act.activate(y[start:end])
+
+	def __pushXIm2col(self, x: np.ndarray, y: np.ndarray, start: int, end: int):
+		# cols[(i * ydim[0] + j) * ydim[1] + k] = x[start + i, j * stride[0]:j * stride[0] + filSiz[0], k * stride[1]:k * stride[1] + filSiz[1]].flatten()
+		cols = windows2D(x[start:end], self.filSiz, self.stride, self.ydim).reshape((-1, self.filSiz[0] * self.filSiz[1] * self.xchs))
+		y = y[start:end]
+		if y.flags.c_contiguous:
+			np.matmul(cols, self.W.reshape((-1, self.ychs)), y.reshape((-1, self.ychs)))
+		else:
+			y[:] = np.matmul(cols, self.W.reshape((-1, self.ychs))).reshape(y.shape)
+		y += self.B
+		if self.act is not None:
+			self.act.activate(y)
 
 	def __pushX(self, x: np.ndarray, y: np.ndarray):
-		if y.shape[0] < 64:  # number of data
-			self.__pushXPartial(x, y, 0, y.shape[0])
-			return
-		if y.shape[0] < 256:
-			nth = 2  # the number of threads
-		elif y.shape[0] < 512:
-			nth = 4
-		elif y.shape[0] < 1024:
-			nth = 7
-		else:
-			nth = 10
-		siz = (y.shape[0] - 1) // nth + 1
-		ths = []
-		start = 0
-		for i in range(nth):
-			th = Thread(target=self.__pushXPartial, args=(x, y, start, start + siz))
-			ths.append(th)
-			th.start()
-			start += siz
-		for th in ths:
-			th.join()
+		partial = self.__pushXIm2col if self.method == 'im2col' else self.__pushXPartial
+		self.executor.run(lambda start, end: partial(x, y, start, end), y.shape[0], self.chunkMin)
 
 	def pushTrX(self):
 		"""forward propagation
@@ -538,21 +422,8 @@ class Conv2D(FitSet2D):
 			obtain self.trY and self.teY from self.trX and self.teX resp.
 			inherited from MidSet
 		"""
-		if self.trY.shape[0] < 64:
-			s0 = 0
-			for i in range(self.ydim[0]):
-				t0 = s0 + self.filSiz[0]
-				s1 = 0
-				for j in range(self.ydim[1]):
-					self.trY[:, i, j] = np.tensordot(self.trX[:, s0:t0, s1:s1 + self.filSiz[1]], self.W, axes=3)
-					self.teY[:, i, j] = np.tensordot(self.teX[:, s0:t0, s1:s1 + self.filSiz[1]], self.W, axes=3)
-					s1 += self.stride[1]
-				s0 += self.stride[0]
-			self.trY += self.B
-			self.teY += self.B
-		else:
-			self.__pushX(self.trX, self.trY)
-			self.__pushX(self.teX, self.teY)
+		self.__pushX(self.trX, self.trY)
+		self.__pushX(self.teX, self.teY)
 
 	def pushTeX(self):
 		"""forward propagation
@@ -568,23 +439,15 @@ class Conv2D(FitSet2D):
 		"""
 		self.__pushX(self.prX, self.prY)
 
-	def resetForPull(self):
-		self.gradNeeds = len(self.nextSets)
-		# self.gradW.fill(0.0)
-		# self.gradX.fill(0.0)
-		self.gradY.fill(0.0)
+	def gradXFrag(self, index: int) -> np.ndarray:
+		return self.gradX[:, self.pad[0]:self.pad[0] + self.xdim[0], self.pad[1]:self.pad[1] + self.xdim[1], self.startXs[index]:self.endXs[index]]
 
-	def pullGrad(self, gradYFrag: np.ndarray):
-		"""backward propagation
-		"""
-		self.gradY += gradYFrag
-		self.gradNeeds -= 1
-		if self.gradNeeds == 0:
-			self.pullGradY()
-			for i, pset in enumerate(self.prevSets):
-				pset.pullGrad(self.gradX[:, self.pad[0]:self.xdim[0] + self.pad[0], self.pad[1]:self.xdim[1] + self.pad[1], self.startXs[i]:self.endXs[i]])
-
-	def __pullGradYPartial(self, w: np.ndarray, start: int, end: int):
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		# inputs keep zero padding, gradX is cleared by pullGradY
+		return ('gradX', 'gradY') if kind == 'grad' else (kind + 'Y',)
+
+	def __pullGradYPartial(self, start: int, end: int) -> np.ndarray:
+		w = np.zeros_like(self.W)
 		# xt = self.trX.transpose((1,2,3,0))
 		s0 = 0
 		for i in range(self.ydim[0]):
@@ -605,6 +468,20 @@ class Conv2D(FitSet2D):
 				# end either
 				s1 += self.stride[1]
 			s0 += self.stride[0]
+		return w
+
+	def __pullGradYIm2col(self, start: int, end: int) -> np.ndarray:
+		cols = windows2D(self.trX[start:end], self.filSiz, self.stride, self.ydim).reshape((-1, self.filSiz[0] * self.filSiz[1] * self.xchs))
+		gradY = self.gradY[start:end].reshape((-1, self.ychs))
+		w = np.matmul(cols.T, gradY).reshape(self.W.shape)
+		# col2im: gradCols[:, i, j, k, l] is added to gradX[:, i * stride[0] + k, j * stride[1] + l]
+		gradCols = np.matmul(gradY, self.W.reshape((-1, self.ychs)).T).reshape((end - start,) + self.ydim + self.W.shape[:3])
+		t0 = (self.ydim[0] - 1) * self.stride[0] + 1
+		t1 = (self.ydim[1] - 1) * self.stride[1] + 1
+		for k in range(self.filSiz[0]):
+			for l in range(self.filSiz[1]):
+				self.gradX[start:end, k:k + t0:self.stride[0], l:l + t1:self.stride[1]] += gradCols[:, :, :, k, l]
+		return w
 
 	def pullGradY(self):
 		############## gradX ##############################################################################################################
@@ -693,57 +570,18 @@ class Conv2D(FitSet2D):
 		# 	s0 += self.stride[0]
 		# self.gradW += self.reg.grad(self.W)
 		###################################################################################################################################
+		if self.act is not None:
+			self.act.derivate(self.trY, self.gradY)
 		if self.biased:
 			self.gradY.sum((0, 1, 2), out=self.gradB)
 		self.gradX.fill(0.0)
-		if self.trY.shape[0] < 64:  # number of data
-			self.gradW.fill(0.0)
-			self.__pullGradYPartial(self.gradW, 0, self.trY.shape[0])
-			self.gradW += self.reg.grad(self.W)
-			return
-		elif self.trY.shape[0] < 256:
-			nth = 4  # the number of threads
-		elif self.trY.shape[0] < 512:
-			nth = 6
-		elif self.trY.shape[0] < 1024:
-			nth = 8
-		elif self.trY.shape[0] < 2048:
-			nth = 14
-		else:
-			nth = 16
-		siz = (self.trY.shape[0] - 1) // nth + 1
-		ws = np.zeros((nth,) + self.W.shape)
-		ths = []
-		start = 0
-		for w in ws:
-			th = Thread(target=self.__pullGradYPartial, args=(w, start, start + siz))
-			ths.append(th)
-			th.start()
-			start += siz
-		for th in ths:
-			th.join()
-		ws.sum(0, out=self.gradW)
-		self.gradW += self.reg.grad(self.W)
-
-	def updateBatch(self, lr: float):
-		"""
-		:param lr: learning rate
-		"""
-		# self.gradBPrev = self.momentum * self.gradBPrev + lr * self.gradB
-		# self.gradWPrev = self.momentum * self.gradWPrev + lr * self.gradW
-		self.gradBPrev *= self.mom
-		self.gradWPrev *= self.mom
-		self.gradBPrev += lr * self.gradB
-		self.gradWPrev += lr * self.gradW
-		self.B -= self.gradBPrev
-		self.W -= self.gradWPrev
-
-	def updateAdaptive(self, lr: float):
-		"""
-		:param lr: learning rate
-		"""
-		np.subtract(self.BPrev, np.multiply(lr, self.gradBPrev, self.B), self.B)
-		np.subtract(self.WPrev, np.multiply(lr, self.gradWPrev, self.W), self.W)
+		partial = self.__pullGradYIm2col if self.method == 'im2col' else self.__pullGradYPartial
+		ws = self.executor.run(partial, self.trY.shape[0], self.chunkMin)
+		np.sum(ws, 0, out=self.gradW)
+
+	def params(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+		"""parameters with their gradients updated by optimizers"""
+		return [(self.B, self.gradB), (self.W, self.gradW)] if self.biased else [(self.W, self.gradW)]
 
 	def sendCurrToPrev(self):
 		self.B, self.BPrev = self.BPrev, self.B
@@ -752,9 +590,6 @@ class Conv2D(FitSet2D):
 		self.gradW, self.gradWPrev = self.gradWPrev, self.gradW
 
 	# noinspection PyTypeChecker
-	def gradDot(self) -> float:
-		return np.sum(self.gradB * self.gradBPrev) + np.sum(self.gradW * self.gradWPrev)
-
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.filSiz})'
 
@@ -766,7 +601,7 @@ class Conv2D(FitSet2D):
 		return s[:-1] + ')'
 
 	def saveStr(self) -> str:
-		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.filSiz}, {self.ychs}, {self.biased}, {self.pad}, {self.stride};'
+		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.filSiz}, {self.ychs}, {self.biased}, {self.pad}, {self.stride}, {self.method};'
 		for pset in self.prevSets:
 			s += f' {pset.Id},'
 		return s[:-1] + ')'
@@ -1,5 +1,6 @@
+import hashlib
 import os
-from typing import Union
+from typing import Tuple, Union
 
 import numpy as np
 
@@ -10,89 +11,173 @@ def addChannel(*x: Union[np.ndarray, list, tuple]) -> Union[np.ndarray, tuple]:
 	return tuple(o[..., np.newaxis] for o in x)
 
 def splitTrainTest(x: np.ndarray, t: np.ndarray = None, trainRate=.7, seed: int = None):
+	"""split data at random, in each class of rows of t at the rate if t is not None"""
 	rand = np.random.RandomState(seed)
 	if t is None:
 		trainSize = int(x.shape[0] * trainRate + .5)
 		perm = rand.permutation(x.shape[0])
 		return x[perm[:trainSize]], x[perm[trainSize:]]
 	else:
-		shapeX, shapeT = list(x.shape), list(t.shape)
-		shapeX[0] = shapeT[0] = 0
-		trainX = np.empty(shapeX, x.dtype)  # array with length 0
-		trainT = np.empty(shapeT, t.dtype)
-		testX = np.empty_like(trainX)
-		testT = np.empty_like(trainT)  # array with length 0
-		cls = np.unique(t, axis=0)
-		for c in cls:
-			ind = list(i for i, t1 in enumerate(t) if np.array_equal(t1, c))
-			trX, teX = splitTrainTest(x[ind], None, trainRate, seed)
-			trainX = np.concatenate((trainX, trX), 0)
-			testX = np.concatenate((testX, teX), 0)
-			trT = np.tile(c, [trX.shape[0]] + [1] * c.ndim)
-			trainT = np.concatenate((trainT, trT))
-			teT = np.tile(c, [teX.shape[0]] + [1] * c.ndim)
-			testT = np.concatenate((testT, teT))
-		permTrain = rand.permutation(trainT.shape[0])
-		permTest = rand.permutation(testT.shape[0])
-		return trainX[permTrain], trainT[permTrain], testX[permTest], testT[permTest]
+		order, bounds = classOrder(t)
+		trInd, teInd = [], []
+		for start, end in zip(bounds[:-1], bounds[1:]):
+			# members of a class are split as splitTrainTest(x[members], None, trainRate, seed)
+			trainSize = int((end - start) * trainRate + .5)
+			perm = np.random.RandomState(seed).permutation(end - start) + start
+			trInd.append(order[perm[:trainSize]])
+			teInd.append(order[perm[trainSize:]])
+		trInd, teInd = np.concatenate(trInd), np.concatenate(teInd)
+		trInd, teInd = trInd[rand.permutation(trInd.shape[0])], teInd[rand.permutation(teInd.shape[0])]
+		return x[trInd], t[trInd], x[teInd], t[teInd]
+
+
+def classOrder(t: np.ndarray, rand: np.random.RandomState = None) -> Tuple[np.ndarray, np.ndarray]:
+	"""indices of data sorted by classes, which are rows of t
+	:param rand: members of each class are in random order if not None, otherwise in the order of t
+	:return: the indices, and the bounds of classes in them, which is an array of the length (number of classes + 1)
+	"""
+	inverse = classIndex(t)
+	if rand is None:
+		order = np.argsort(inverse, kind='stable')
+	else:
+		perm = rand.permutation(inverse.shape[0])
+		order = perm[np.argsort(inverse[perm], kind='stable')]
+	bounds = np.concatenate(([0], np.cumsum(np.bincount(inverse))))
+	return order, bounds
+
+
+def classIndex(t: np.ndarray) -> np.ndarray:
+	"""index of the class of each datum, classes of which are distinct rows of t in lexicographic order
+		like the inverse of np.unique(t, return_inverse=True, axis=0),
+		but each row is reduced to one key, which is the position of 1 in one-hot rows or the bytes of the row otherwise
+	"""
+	if t.ndim == 1:
+		return np.unique(t, return_inverse=True)[1].reshape(-1)
+	rows = t.reshape(t.shape[0], -1)
+	if rows.shape[1] > 0 and np.all((rows == 0) | (rows == 1)) and np.all(np.count_nonzero(rows, 1) == 1):
+		key = rows.argmax(1)
+	else:
+		# + 0 makes -0.0 equal to 0.0 in bytes
+		rows = np.ascontiguousarray(rows + 0 if rows.dtype.kind in 'fc' else rows)
+		key = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).reshape(-1)
+	_, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+	# rank of each class in lexicographic order of rows, the first column of which is the primary key
+	rank = np.empty(first.shape[0], int)
+	rank[np.lexsort(rows[first].T[::-1])] = np.arange(first.shape[0])
+	return rank[inverse.reshape(-1)]
+
+
+def stratifiedKFold(t: np.ndarray, k: int = 5, seed: int = None):
+	"""k folds of data in which each class of rows of t is divided evenly
+		members of classes are dealt to the folds in turn, so that the sizes of the folds differ by one at most
+	:return: iterator of (training indices, test indices), test indices of which are those of each fold
+	"""
+	order, _ = classOrder(t, np.random.RandomState(seed))
+	fold = np.empty(order.shape[0], int)
+	fold[order] = np.arange(order.shape[0]) % k
+	for i in range(k):
+		yield np.flatnonzero(fold != i), np.flatnonzero(fold == i)
 
 
 def onehot(target: Union[np.ndarray, tuple, list], order: Union[np.ndarray, tuple, list] = None):
 	targets = (target,) if isinstance(target, np.ndarray) else target
 	if order is None:
 		order = np.unique(targets[0])
-	siz = order.shape[0] if isinstance(order, np.ndarray) else len(order)
-	vec = np.zeros(siz, int)
-	vec[0] = 1
-	m = {order[0]: vec.copy()}
-	for i in range(1, siz):
-		vec[i - 1] = 0
-		vec[i] = 1
-		m[order[i]] = vec.copy()
+	order = np.asarray(order)
+	sorter = np.argsort(order, kind='stable')
 	oh = ()
 	for t in targets:
-		oht = np.empty((t.shape[0], siz), int)
-		for i, v in enumerate(t):
-			oht[i] = m[v]
+		t = np.asarray(t)
+		# index of each label in order
+		ind = sorter[np.minimum(np.searchsorted(order, t, sorter=sorter), order.shape[0] - 1)]
+		if not np.all(order[ind] == t):
+			raise Exception(f'labels {np.unique(t[order[ind] != t])} are not in order')
+		oht = np.zeros((t.shape[0], order.shape[0]), int)
+		oht[np.arange(t.shape[0]), ind] = 1
 		oh += (oht,)
 	return oh if isinstance(target, tuple) else list(oh) if isinstance(target, list) else oh[0]
 
 
-def read_mnist_train():
-	path = os.path.abspath(os.path.dirname('../../../Data/MNIST/'))
-	with open(path + '/train-labels.idx1-ubyte', 'rb') as f:
-		f.seek(8, os.SEEK_SET)
-		data = f.read()
-	labels = np.frombuffer(data, np.uint8)
-
-	with open(path + '/train-images.idx3-ubyte', 'rb') as f:
-		f.seek(4, os.SEEK_SET)
-		b = f.read(4)
-		count = (b[0] << 24) + (b[1] << 16) + (b[2] << 8) + b[3]
-		b = f.read(4)
-		width = (b[0] << 24) + (b[1] << 16) + (b[2] << 8) + b[3]
-		b = f.read(4)
-		height = (b[0] << 24) + (b[1] << 16) + (b[2] << 8) + b[3]
-		data = f.read()
-	images = np.frombuffer(data, np.uint8).reshape(count, height, width)
-	return labels, images
-
-
-def read_mnist_test():
-	path = os.path.abspath(os.path.dirname('../../../Data/MNIST/'))
-	with open(path + '/t10k-labels.idx1-ubyte', 'rb') as f:
-		f.seek(8, os.SEEK_SET)
-		data = f.read()
-	labels = np.frombuffer(data, np.uint8)
-
-	with open(path + '/t10k-images.idx3-ubyte', 'rb') as f:
-		f.seek(4, os.SEEK_SET)
-		b = f.read(4)
-		count = (b[0] << 24) + (b[1] << 16) + (b[2] << 8) + b[3]
-		b = f.read(4)
-		width = (b[0] << 24) + (b[1] << 16) + (b[2] << 8) + b[3]
-		b = f.read(4)
-		height = (b[0] << 24) + (b[1] << 16) + (b[2] << 8) + b[3]
-		data = f.read()
-	images = np.frombuffer(data, np.uint8).reshape(count, height, width)
-	return labels, images
+# directory of the MNIST IDX files, relative to this file
+MNIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../Data/MNIST')
+MNIST_FILES = {'train': ('train-images.idx3-ubyte', 'train-labels.idx1-ubyte'),
+			   'test': ('t10k-images.idx3-ubyte', 't10k-labels.idx1-ubyte')}
+# types of IDX data by the third byte of the magic number
+IDX_TYPES = {0x08: np.uint8, 0x09: np.int8, 0x0B: '>i2', 0x0C: '>i4', 0x0D: '>f4', 0x0E: '>f8'}
+
+
+def readIdx(path: str) -> np.memmap:
+	"""read-only memory map of the data of an IDX file, whose header is the magic number and big-endian dimensions"""
+	with open(path, 'rb') as f:
+		magic = f.read(4)
+		if len(magic) < 4 or magic[:2] != b'\0\0' or magic[2] not in IDX_TYPES:
+			raise Exception(f'{path} is not an IDX file')
+		shape = tuple(int(d) for d in np.frombuffer(f.read(4 * magic[3]), '>u4'))
+	return np.memmap(path, IDX_TYPES[magic[2]], 'r', 4 + 4 * len(shape), shape)
+
+
+def fileHash(path: str) -> str:
+	h = hashlib.blake2b(digest_size=16)
+	with open(path, 'rb') as f:
+		for block in iter(lambda: f.read(1 << 22), b''):
+			h.update(block)
+	return h.hexdigest()
+
+
+def idxCache(imagesPath: str, labelsPath: str, cacheDir: str = None, chunk: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+	"""images / 255 and one-hot labels as float32 with the channel axis, like addChannel(images / 255, onehot(labels))
+		they are read-only memory maps of .npy files in cacheDir named by the hashes of the IDX files,
+		made in chunks of data if they do not exist
+	:param cacheDir: 'cache' in the directory of imagesPath if None
+	:return: images and labels
+	"""
+	if cacheDir is None:
+		cacheDir = os.path.join(os.path.dirname(os.path.abspath(imagesPath)), 'cache')
+	key = f'{fileHash(imagesPath)}_{fileHash(labelsPath)}'
+	paths = os.path.join(cacheDir, f'{key}_x.npy'), os.path.join(cacheDir, f'{key}_t.npy')
+	if not all(os.path.exists(p) for p in paths):
+		os.makedirs(cacheDir, exist_ok=True)
+		images, labels = readIdx(imagesPath), readIdx(labelsPath)
+		x = np.lib.format.open_memmap(f'{paths[0]}.tmp', 'w+', np.float32, images.shape + (1,))
+		for start in range(0, images.shape[0], chunk):
+			np.divide(images[start:start + chunk, ..., np.newaxis], np.float32(255), x[start:start + chunk])
+		x.flush()
+		del x
+		t = np.lib.format.open_memmap(f'{paths[1]}.tmp', 'w+', np.float32, labels.shape + (np.unique(labels).shape[0], 1))
+		t[..., 0] = onehot(np.asarray(labels))
+		t.flush()
+		del t
+		# renamed after written, so that an interrupted run leaves no broken cache
+		for p in paths:
+			os.replace(f'{p}.tmp', p)
+	return np.load(paths[0], 'r'), np.load(paths[1], 'r')
+
+
+def read_mnist(kind: str = 'train', path: str = None) -> Tuple[np.ndarray, np.ndarray]:
+	"""
+	:param kind: one of MNIST_FILES
+	:param path: directory of the IDX files, MNIST_DIR if None
+	:return: labels and images as read-only memory maps of uint8
+	"""
+	path = MNIST_DIR if path is None else path
+	images, labels = MNIST_FILES[kind]
+	return readIdx(os.path.join(path, labels)), readIdx(os.path.join(path, images))
+
+
+def read_mnist_train(path: str = None):
+	return read_mnist('train', path)
+
+
+def read_mnist_test(path: str = None):
+	return read_mnist('test', path)
+
+
+def read_mnist_cached(kind: str = 'train', path: str = None, cacheDir: str = None) -> Tuple[np.ndarray, np.ndarray]:
+	"""idxCache() of MNIST
+	:param kind: one of MNIST_FILES
+	:param path: directory of the IDX files, MNIST_DIR if None
+	:return: images of the shape (count, height, width, 1) and labels of the shape (count, 10, 1)
+	"""
+	path = MNIST_DIR if path is None else path
+	images, labels = MNIST_FILES[kind]
+	return idxCache(os.path.join(path, images), os.path.join(path, labels), cacheDir)
@@ -0,0 +1,151 @@
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from .Prefetch import Prefetcher
+from .Util import dataSize, dataSlice
+
+
+class Dataset(metaclass=ABCMeta):
+	"""training data of minibatch trainers in shards, which are read into memory in turn
+		so that data larger than memory are trained without changing the graph
+		in each epoch shards are in random order, the next shard is read by a background thread while one is trained,
+		and data of each shard are permuted if shuffle
+		minibatches do not span shards, data of each shard beyond a multiple of the batch size are not trained in the epoch"""
+
+	def __init__(self, shuffle: bool = True):
+		self.shuffle: bool = shuffle
+		# the number of data of each shard and the sum of the base of losses of targets, found by scan()
+		self.sizes: Union[np.ndarray, None] = None
+		self.lossBase: float = 0.0
+
+	@abstractmethod
+	def empty(self) -> Tuple[Union[np.ndarray, tuple], np.ndarray]:
+		"""inputs and targets of no data, with the shapes and types of the data"""
+		pass
+
+	@abstractmethod
+	def shards(self, order: np.ndarray) -> Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]:
+		"""inputs and targets of shards in memory
+		:param order: indices of shards made by order(), all shards in order if None
+		"""
+		pass
+
+	def targets(self) -> Iterator[np.ndarray]:
+		"""targets of all shards in order"""
+		for _, t in self.shards(None):
+			yield t
+
+	def order(self) -> np.ndarray:
+		"""indices of shards in an epoch, drawn by np.random so that they are restored with fit(resume=...)"""
+		return np.random.permutation(len(self.sizes)) if self.shuffle else np.arange(len(self.sizes))
+
+	def scan(self, lossFunc, dtype: type = float):
+		"""find sizes and lossBase by reading targets, called by NodeGraph.fit()"""
+		sizes, self.lossBase = [], 0.0
+		for t in self.targets():
+			sizes.append(t.shape[0])
+			self.lossBase += lossFunc.base(np.asarray(t, dtype))
+		self.sizes = np.array(sizes, int)
+
+	def batchCount(self, batchSize: int) -> int:
+		"""the number of minibatches in an epoch"""
+		return int(np.sum(self.sizes // batchSize))
+
+	def batches(self, prefetcher: Prefetcher) -> Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]:
+		"""minibatches of an epoch gathered by prefetcher, whose source is set to each shard"""
+		shards = self.shards(self.order())
+		with ThreadPoolExecutor(1) as reader:
+			future = reader.submit(next, shards, None)
+			while True:
+				shard = future.result()
+				if shard is None:
+					break
+				future = reader.submit(next, shards, None)
+				x, t = shard
+				prefetcher.source(x, t)
+				yield from prefetcher.batches(np.random.permutation(t.shape[0]) if self.shuffle else np.arange(t.shape[0]))
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({None if self.sizes is None else self.sizes.tolist()})'
+
+
+class ArrayDataset(Dataset):
+	"""shards of shardSize consecutive data of arrays, such as memory maps of np.load(path, mmap_mode='r')"""
+
+	def __init__(self, x: Union[np.ndarray, Tuple, List], t: np.ndarray, shardSize: int, shuffle: bool = True):
+		"""
+		:param x: either array, tuple of arrays or list of arrays
+		"""
+		super().__init__(shuffle)
+		self.x: Union[np.ndarray, tuple] = x if isinstance(x, np.ndarray) else tuple(x)
+		self.t: np.ndarray = t
+		siz = dataSize(x)
+		self.bounds: List[Tuple[int, int]] = [(start, min(start + shardSize, siz)) for start in range(0, siz, shardSize)]
+
+	def empty(self) -> Tuple[Union[np.ndarray, tuple], np.ndarray]:
+		return dataSlice(self.x, 0, 0), self.t[:0]
+
+	def shards(self, order: np.ndarray) -> Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]:
+		for i in range(len(self.bounds)) if order is None else order:
+			start, end = self.bounds[i]
+			x = np.array(self.x[start:end]) if isinstance(self.x, np.ndarray) else tuple(np.array(a[start:end]) for a in self.x)
+			yield x, np.array(self.t[start:end])
+
+	def targets(self) -> Iterator[np.ndarray]:
+		for start, end in self.bounds:
+			yield self.t[start:end]
+
+
+class NpyShards(Dataset):
+	"""shards in .npy files, each of which is read by np.load()"""
+
+	def __init__(self, xFiles: List[Union[str, Tuple[str, ...]]], tFiles: List[str], shuffle: bool = True):
+		"""
+		:param xFiles: a file of inputs of each shard, or a tuple of files if the graph has several start sets
+		:param tFiles: a file of targets of each shard
+		"""
+		super().__init__(shuffle)
+		if len(xFiles) != len(tFiles):
+			raise Exception(f'{len(xFiles)} files of inputs and {len(tFiles)} files of targets')
+		self.xFiles: List[Union[str, Tuple[str, ...]]] = list(xFiles)
+		self.tFiles: List[str] = list(tFiles)
+
+	def empty(self) -> Tuple[Union[np.ndarray, tuple], np.ndarray]:
+		xf = self.xFiles[0]
+		x = np.load(xf, 'r')[:0] if isinstance(xf, str) else tuple(np.load(f, 'r')[:0] for f in xf)
+		return x, np.load(self.tFiles[0], 'r')[:0]
+
+	def shards(self, order: np.ndarray) -> Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]:
+		for i in range(len(self.tFiles)) if order is None else order:
+			xf = self.xFiles[i]
+			yield np.load(xf) if isinstance(xf, str) else tuple(np.load(f) for f in xf), np.load(self.tFiles[i])
+
+	def targets(self) -> Iterator[np.ndarray]:
+		for f in self.tFiles:
+			yield np.load(f, 'r')
+
+
+class GeneratorDataset(Dataset):
+	"""shards made by a generator, in the order in which they are made
+		scan() makes all shards once before fitting, and empty() makes the first one"""
+
+	def __init__(self, make: Callable[[], Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]], shuffle: bool = True):
+		"""
+		:param make: make() returns an iterator of (inputs, targets) of shards, which is called in each epoch
+			it is iterated by a background thread, and should not draw from np.random if fitting is resumed
+		"""
+		super().__init__(shuffle)
+		self.make: Callable[[], Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]] = make
+
+	def empty(self) -> Tuple[Union[np.ndarray, tuple], np.ndarray]:
+		x, t = next(iter(self.make()))
+		return dataSlice(x, 0, 0), t[:0]
+
+	def shards(self, order: np.ndarray) -> Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]:
+		return iter(self.make())
+
+	def order(self) -> np.ndarray:
+		return np.arange(len(self.sizes))
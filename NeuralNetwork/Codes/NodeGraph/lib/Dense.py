@@ -1,5 +1,4 @@
 from .FitSet import *
-from .Regularizer import RegNone, Regularizer
 
 
 class Dense1D(FitSet1D):
@@ -31,12 +30,6 @@ class Dense1D(FitSet1D):
 		self.gradW: Union[np.ndarray, None] = None
 		self.gradWPrev: Union[np.ndarray, None] = None
 
-		# regularizer
-		self.reg: Regularizer = RegNone()
-
-		# momentum
-		self.mom: float = 0.0
-
 	def compile(self) -> bool:
 		if not super(Dense1D, self).compile():
 			return False
@@ -57,64 +50,55 @@ class Dense1D(FitSet1D):
 		self.gradBPrev = np.zeros_like(self.B)
 		self.gradWPrev = np.zeros_like(self.W)
 
-		self.reg = kwargs['regularizer']
-		self.mom = kwargs['momentum']
-
 	def pushTrX(self):
 		# self.trY = self.B + np.matmul(self.trX, self.W)
 		# for i in range(self.ychs):
 		# 	np.matmul(self.trX[:, :, i], self.W[:, :, i], self.trY[:, :, i])
 		np.matmul(self.trX.transpose((2, 0, 1)), self.W.transpose((2, 0, 1)), self.trY.transpose((2, 0, 1)))
 		np.add(self.B, self.trY, self.trY)
+		if self.act is not None:
+			self.act.activate(self.trY)
 
 	def pushTeX(self):
 		np.matmul(self.teX.transpose((2, 0, 1)), self.W.transpose((2, 0, 1)), self.teY.transpose((2, 0, 1)))
 		np.add(self.B, self.teY, self.teY)
+		if self.act is not None:
+			self.act.activate(self.teY)
 
 	def pushPrX(self):
 		np.matmul(self.prX.transpose((2, 0, 1)), self.W.transpose((2, 0, 1)), self.prY.transpose((2, 0, 1)))
 		np.add(self.B, self.prY, self.prY)
+		if self.act is not None:
+			self.act.activate(self.prY)
 
 	def pushBothX(self):
 		np.matmul(self.trX.transpose((2, 0, 1)), self.W.transpose((2, 0, 1)), self.trY.transpose((2, 0, 1)))
 		np.add(self.B, self.trY, self.trY)
+		if self.act is not None:
+			self.act.activate(self.trY)
 		np.matmul(self.teX.transpose((2, 0, 1)), self.W.transpose((2, 0, 1)), self.teY.transpose((2, 0, 1)))
 		np.add(self.B, self.teY, self.teY)
+		if self.act is not None:
+			self.act.activate(self.teY)
+
+	def bindY(self, kind: str, y: np.ndarray) -> bool:
+		# matmul writes into strided outputs without BLAS
+		return y.flags.c_contiguous and super().bindY(kind, y)
+
+	def bindGradY(self, gradY: np.ndarray) -> bool:
+		return gradY.flags.c_contiguous and super().bindGradY(gradY)
 
 	def pullGradY(self):
-		# for i in range(self.ychs):
-		# 	np.matmul(self.gradY[:, :, i], self.W[:, :, i].T, self.gradX[:, :, i])
-		# 	if self.biased:
-		# 		np.sum(self.gradY[:, :, i], axis=0, out=self.gradB[:, i])
-		# 	np.matmul(self.trX[:, :, i].T, self.gradY[:, :, i], self.gradW[:, :, i])
-		# 	self.gradW[:, :, i] += self.reg.grad(self.W[:, :, i])
+		if self.act is not None:
+			self.act.derivate(self.trY, self.gradY)
 		np.matmul(self.gradY.transpose((2, 0, 1)), self.W.transpose((2, 1, 0)), self.gradX.transpose((2, 0, 1)))
 		if self.biased:
 			np.sum(self.gradY, axis=0, out=self.gradB)
 		np.matmul(self.trX.transpose((2, 1, 0)), self.gradY.transpose((2, 0, 1)), self.gradW.transpose((2, 0, 1)))
-		self.gradW += self.reg.grad(self.W)
-
-	def updateBatch(self, lr: float):
-		"""
-		:param lr: learning rate
-		"""
-		# self.gradBPrev = self.momentum * self.gradBPrev + lr * self.gradB
-		# self.gradWPrev = self.momentum * self.gradWPrev + lr * self.gradW
-		self.gradBPrev *= self.mom
-		self.gradWPrev *= self.mom
-		self.gradBPrev += lr * self.gradB
-		self.gradWPrev += lr * self.gradW
-		self.B -= self.gradBPrev
-		self.W -= self.gradWPrev
-
-	def updateAdaptive(self, lr: float):
-		"""
-		:param lr: learning rate
-		"""
-		# self.B = self.BPrev - lr * self.gradBPrev
-		# self.W = self.WPrev - lr * self.gradWPrev
-		np.subtract(self.BPrev, np.multiply(lr, self.gradBPrev, self.B), self.B)
-		np.subtract(self.WPrev, np.multiply(lr, self.gradWPrev, self.W), self.W)
+
+	def params(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+		"""parameters with their gradients updated by optimizers"""
+		return [(self.B, self.gradB), (self.W, self.gradW)] if self.biased else [(self.W, self.gradW)]
 
 	def sendCurrToPrev(self):
 		self.B, self.BPrev = self.BPrev, self.B
@@ -122,10 +106,6 @@ class Dense1D(FitSet1D):
 		self.gradB, self.gradBPrev = self.gradBPrev, self.gradB
 		self.gradW, self.gradWPrev = self.gradWPrev, self.gradW
 
-	def gradDot(self) -> float:
-		# return np.tensordot(self.gradB, self.gradBPrev, 3) + np.tensordot(self.gradW, self.gradWPrev, 3)
-		return np.sum(self.gradB * self.gradBPrev) + np.sum(self.gradW * self.gradWPrev)
-
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.ydim}, {self.ychs})'
 
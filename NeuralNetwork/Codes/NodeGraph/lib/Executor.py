@@ -0,0 +1,87 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple, Union
+
+
+def blasThreads() -> int:
+	"""the number of threads used by BLAS for one product
+		threadpoolctl is used if it is installed, otherwise environment variables are read"""
+	try:
+		from threadpoolctl import threadpool_info
+		counts = [info['num_threads'] for info in threadpool_info() if info.get('user_api') == 'blas']
+		if counts:
+			return max(counts)
+	except ImportError:
+		pass
+	for var in ('OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'OMP_NUM_THREADS'):
+		try:
+			return max(1, int(os.environ[var]))
+		except (KeyError, ValueError):
+			pass
+	# the products submitted by node sets are mostly small, and BLAS runs them in one thread
+	return 1
+
+
+class Executor:
+	"""persistent pool of worker threads shared by all node sets of a NodeGraph
+		node sets split work over data into chunks and submit them by run()
+		the pool is created at the first parallel run and re-created after fork"""
+
+	def __init__(self, nThreads: int = None):
+		"""
+		:param nThreads: the number of worker threads
+			if None, os.cpu_count() // blasThreads() so that workers and BLAS do not oversubscribe cores
+		"""
+		self.nThreads: Union[int, None] = nThreads
+		self.__pool: Union[ThreadPoolExecutor, None] = None
+		self.__pid: int = -1
+		# size when nThreads is None, BLAS threads are looked up once
+		self.__autoSize: Union[int, None] = None
+
+	@property
+	def size(self) -> int:
+		if self.nThreads is not None:
+			return max(1, self.nThreads)
+		if self.__autoSize is None:
+			self.__autoSize = max(1, (os.cpu_count() or 1) // blasThreads())
+		return self.__autoSize
+
+	def chunks(self, n: int, minChunk: int = 1) -> List[Tuple[int, int]]:
+		"""split range(n) into at most self.size chunks of size >= minChunk"""
+		count = max(1, min(self.size, n // max(1, minChunk)))
+		siz, rem = divmod(n, count)
+		chunks = []
+		start = 0
+		for i in range(count):
+			end = start + siz + (1 if i < rem else 0)
+			chunks.append((start, end))
+			start = end
+		return chunks
+
+	def run(self, func: Callable, n: int, minChunk: int = 1) -> list:
+		"""execute func(start, end) over the chunks of range(n)
+		:return: list of return values in the order of chunks
+		"""
+		chunks = self.chunks(n, minChunk)
+		if len(chunks) == 1:
+			return [func(0, n)]
+		if self.__pool is None or self.__pid != os.getpid():
+			self.__pool = ThreadPoolExecutor(self.size)
+			self.__pid = os.getpid()
+		futures = [self.__pool.submit(func, start, end) for start, end in chunks]
+		return [f.result() for f in futures]
+
+	def shutdown(self):
+		if self.__pool is not None and self.__pid == os.getpid():
+			self.__pool.shutdown()
+		self.__pool = None
+
+	def __getstate__(self):
+		# threads can not be copied
+		return {'nThreads': self.nThreads}
+
+	def __setstate__(self, state):
+		self.__init__(state['nThreads'])
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({self.size})'
@@ -5,24 +5,28 @@ class FitSet1D(MidSet1D, metaclass=ABCMeta):
 	def __init__(self, ydim: int, ychs: int, name: str):
 		super().__init__(ydim, ychs, name)
 
-	@abstractmethod
-	def preFit(self, **kwargs):
-		pass
+		# elementwise activation computed in place by the kernels of this set, set by compile()
+		self.act: Union[MidSet1D, None] = None
 
-	@abstractmethod
-	def updateBatch(self, learningRate: float):
-		pass
+	def fuse(self, act: Union[MidSet1D, None]) -> bool:
+		if self.act is not None:
+			self.act.fitSet = None
+		self.act = act
+		if act is not None:
+			act.fitSet = self
+		return True
 
 	@abstractmethod
-	def updateAdaptive(self, learningRate: float):
+	def preFit(self, **kwargs):
 		pass
 
 	@abstractmethod
-	def sendCurrToPrev(self):
+	def params(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+		"""parameters with their gradients updated by optimizers"""
 		pass
 
 	@abstractmethod
-	def gradDot(self) -> float:
+	def sendCurrToPrev(self):
 		pass
 
 
@@ -30,22 +34,26 @@ class FitSet2D(MidSet2D, metaclass=ABCMeta):
 	def __init__(self, ydim: Union[Tuple, List], ychs: int, name: str):
 		super().__init__(ydim, ychs, name)
 
-	@abstractmethod
-	def preFit(self, **kwargs):
-		pass
+		# elementwise activation computed in place by the kernels of this set, set by compile()
+		self.act: Union[MidSet2D, None] = None
 
-	@abstractmethod
-	def updateBatch(self, learningRate: float):
-		pass
+	def fuse(self, act: Union[MidSet2D, None]) -> bool:
+		if self.act is not None:
+			self.act.fitSet = None
+		self.act = act
+		if act is not None:
+			act.fitSet = self
+		return True
 
 	@abstractmethod
-	def updateAdaptive(self, learningRate: float):
+	def preFit(self, **kwargs):
 		pass
 
 	@abstractmethod
-	def sendCurrToPrev(self):
+	def params(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+		"""parameters with their gradients updated by optimizers"""
 		pass
 
 	@abstractmethod
-	def gradDot(self) -> float:
+	def sendCurrToPrev(self):
 		pass
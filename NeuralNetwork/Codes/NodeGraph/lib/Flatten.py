@@ -14,41 +14,54 @@ class Flat1D(MidSet1D):
 			return False
 
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.empty((trSiz, self.xdim, self.xchs))
-		self.gradY = np.empty((trSiz, self.ydim, 1))
-		# self.gradY = np.empty((trSiz, self.ydim))
-		self.teX = np.empty((teSiz, self.xdim, self.xchs))
+		self.prePropTr(trSiz)
+		self.prePropTe(teSiz)
 
 	def prePropTr(self, trSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.empty((trSiz, self.xdim, self.xchs))
-		# self.gradY = np.empty((trSiz, self.ydim))
-		self.gradY = np.empty((trSiz, self.ydim, 1))
+		# outputs are views of inputs and gradX is a view of gradY
+		self.trX = np.empty((trSiz, self.xdim, self.xchs), self.dtype)
+		self.trY = self.trX.reshape((trSiz, -1, 1))
+		self.gradY = np.empty((trSiz, self.ydim, 1), self.dtype)
+		self.gradX = self.gradY.reshape(self.trX.shape)
 
 	def prePropTe(self, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.teX = np.empty((teSiz, self.xdim, self.xchs))
+		self.teX = np.empty((teSiz, self.xdim, self.xchs), self.dtype)
+		self.teY = self.teX.reshape((teSiz, -1, 1))
 
 	def prePropPr(self, prSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.prX = np.empty((prSiz, self.xdim, self.xchs))
+		self.prX = np.empty((prSiz, self.xdim, self.xchs), self.dtype)
+		self.prY = self.prX.reshape((prSiz, -1, 1))
+
+	def bindY(self, kind: str, y: np.ndarray) -> bool:
+		# outputs are views of inputs
+		return False
+
+	def bindGradY(self, gradY: np.ndarray) -> bool:
+		# gradX must be a view of gradY
+		if not gradY.flags.c_contiguous:
+			return False
+		self.gradY = gradY
+		self.gradX = gradY.reshape(self.trX.shape)
+		return True
+
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		# outputs are views of inputs
+		return ()
 
 	def pushBothX(self):
-		self.trY = self.trX.reshape((self.trX.shape[0], -1, 1))
-		self.teY = self.teX.reshape((self.teX.shape[0], -1, 1))
+		pass
 
 	def pushTrX(self):
-		self.trY = self.trX.reshape((self.trX.shape[0], -1, 1))
+		pass
 
 	def pushTeX(self):
-		self.teY = self.teX.reshape((self.teX.shape[0], -1, 1))
+		pass
 
 	def pushPrX(self):
-		self.prY = self.prX.reshape((self.prX.shape[0], -1, 1))
+		pass
 
 	def pullGradY(self):
-		self.gradX = self.gradY.reshape(self.trX.shape)
+		pass
 
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.ydim})'
@@ -79,39 +92,54 @@ class Flat2D(MidSet2D):
 			return False
 
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.gradY = np.empty((trSiz, self.ydim, 1))
-		self.teX = np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs))
+		self.prePropTr(trSiz)
+		self.prePropTe(teSiz)
 
 	def prePropTr(self, trSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.trX = np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.gradY = np.empty((trSiz, self.ydim, 1))
+		# outputs are views of inputs and gradX is a view of gradY
+		self.trX = np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.trY = self.trX.reshape((trSiz, -1, 1))
+		self.gradY = np.empty((trSiz, self.ydim, 1), self.dtype)
+		self.gradX = self.gradY.reshape(self.trX.shape)
 
 	def prePropTe(self, teSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.teX = np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs))
+		self.teX = np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.teY = self.teX.reshape((teSiz, -1, 1))
 
 	def prePropPr(self, prSiz: int):
-		self.xNeeds = len(self.prevSets)
-		self.prX = np.empty((prSiz, self.xdim[0], self.xdim[1], self.xchs))
+		self.prX = np.empty((prSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.prY = self.prX.reshape((prSiz, -1, 1))
+
+	def bindY(self, kind: str, y: np.ndarray) -> bool:
+		# outputs are views of inputs
+		return False
+
+	def bindGradY(self, gradY: np.ndarray) -> bool:
+		# gradX must be a view of gradY
+		if not gradY.flags.c_contiguous:
+			return False
+		self.gradY = gradY
+		self.gradX = gradY.reshape(self.trX.shape)
+		return True
+
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		# outputs are views of inputs
+		return ()
 
 	def pushBothX(self):
-		self.trY = self.trX.reshape((self.trX.shape[0], -1, 1))
-		self.teY = self.teX.reshape((self.teX.shape[0], -1, 1))
+		pass
 
 	def pushTrX(self):
-		self.trY = self.trX.reshape((self.trX.shape[0], -1, 1))
+		pass
 
 	def pushTeX(self):
-		self.teY = self.teX.reshape((self.teX.shape[0], -1, 1))
+		pass
 
 	def pushPrX(self):
-		self.prY = self.prX.reshape((self.prX.shape[0], -1, 1))
+		pass
 
 	def pullGradY(self):
-		self.gradX = self.gradY.reshape(self.trX.shape)
+		pass
 
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.ydim})'
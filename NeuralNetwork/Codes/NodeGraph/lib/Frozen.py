@@ -0,0 +1,86 @@
+import copy
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from .Activation import Activation1D, Activation2D
+from .Plan import ExecutionPlan
+from .Util import dataSize, dataSlice
+
+# attributes of node sets used only by training
+TRAIN_ATTRS = ('trX', 'trY', 'teX', 'teY', 'prX', 'prY', 'gradX', 'gradY', 'trT', 'teT',
+			   'initB', 'initW', 'BPrev', 'WPrev', 'gradB', 'gradW', 'gradBPrev', 'gradWPrev',
+			   'trWin', 'trLse', 'teLse', 'prLse', 'ind')
+
+
+class FrozenGraph:
+	"""inference only graph made by NodeGraph.freeze()
+		node sets are copies keeping weights only
+		buffers for maxBatch data are allocated once, and views of them are used by every call
+		activations are computed in place"""
+
+	def __init__(self, graph, maxBatch: int):
+		"""
+		:param graph: compiled and fitted NodeGraph
+		:param maxBatch: the maximum number of data propagated at once
+		"""
+		nodeSets = graph.startSets + graph.midSets + (graph.lossFunc,)
+		# training buffers are not copied
+		memo = {id(getattr(nset, name)): None for nset in nodeSets for name in TRAIN_ATTRS if getattr(nset, name, None) is not None}
+		self.startSets, self.midSets, self.lossFunc = copy.deepcopy((graph.startSets, graph.midSets, graph.lossFunc), memo)
+		for mset in self.midSets:
+			if isinstance(mset, Activation1D) or isinstance(mset, Activation2D):
+				mset.inPlace = True
+		self.plan: ExecutionPlan = ExecutionPlan(self.startSets, self.midSets, self.lossFunc)
+
+		self.maxBatch: int = maxBatch
+		for mset in self.midSets:
+			mset.prePropPr(maxBatch)
+		self.lossFunc.prePropPr(maxBatch)
+		self.plan.bind('pr')
+		self.plan.place('pr')
+		# buffers for maxBatch data
+		#	views of the first n data of them are bound to propagate n data
+		self.__buffers: List[tuple] = [(nset, name, getattr(nset, name)) for nset in self.midSets + (self.lossFunc,)
+									   for name in ('prX', 'prY', 'prLse') if getattr(nset, name, None) is not None]
+		self.__siz: int = maxBatch
+
+	def __bind(self, siz: int):
+		if siz != self.__siz:
+			for nset, name, buf in self.__buffers:
+				setattr(nset, name, buf[:siz])
+			self.plan.bind('pr')
+			self.__siz = siz
+
+	def predict(self, prX: Union[np.ndarray, Tuple, List]) -> np.ndarray:
+		"""
+		:param prX: either array, tuple of arrays or list of arrays
+		:return: prediction
+		"""
+		prSiz = dataSize(prX)
+		if prSiz <= self.maxBatch:
+			self.__bind(prSiz)
+			self.plan.push('pr', prX)
+			return self.lossFunc.prY.copy()
+		# the last chunk overlaps the previous one
+		self.__bind(self.maxBatch)
+		prY = np.empty((prSiz,) + self.lossFunc.prY.shape[1:])
+		for start in range(0, prSiz, self.maxBatch):
+			end = min(start + self.maxBatch, prSiz)
+			self.plan.push('pr', dataSlice(prX, end - self.maxBatch, end))
+			prY[start:end] = self.lossFunc.prY[self.maxBatch - (end - start):]
+		return prY
+
+	def memoryBytes(self) -> int:
+		"""bytes of weights and buffers"""
+		arrays = {}
+		for nset in self.midSets + (self.lossFunc,):
+			for v in vars(nset).values():
+				if isinstance(v, np.ndarray):
+					while isinstance(v.base, np.ndarray):
+						v = v.base
+					arrays[id(v)] = v.nbytes
+		return sum(arrays.values())
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({self.maxBatch}; {self.plan})'
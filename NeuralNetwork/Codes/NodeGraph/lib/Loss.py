@@ -2,6 +2,7 @@ from typing import List
 
 import numpy as np
 
+from .Activation import Softmax1D
 from .MidSet import *
 from .NodeSet import *
 from .StartSet import *
@@ -49,6 +50,17 @@ def oneHotCce(t: np.ndarray, y: np.ndarray) -> float:
 	return -np.sum(np.log(y[t.nonzero()]))
 
 
+# softmax of x over axis 1 into y, and the log of the sum of exp(x) into lse
+#	x is shifted by its maximum first
+def softmaxLse(x: np.ndarray, y: np.ndarray, lse: np.ndarray):
+	np.max(x, 1, keepdims=True, out=lse)
+	np.subtract(x, lse, y)
+	np.exp(y, y)
+	s = np.sum(y, 1, keepdims=True)
+	y /= s
+	lse += np.log(s)
+
+
 class LossFunc1D(NodeSet, metaclass=ABCMeta):
 	def __init__(self, name: str = None):
 		super().__init__(name)
@@ -77,6 +89,14 @@ class LossFunc1D(NodeSet, metaclass=ABCMeta):
 		#	trY[:, startYs[i]:endYs[i]] = prevSets[i].trY
 		self.endYs: Union[np.ndarray, None] = None
 
+		# activation followed by this only, computed by this with its gradient, set by compile()
+		#	then trY = act(act.trX) and evalGrad() obtains act.gradX
+		self.act: Union[MidSet1D, None] = None
+		# log of the sum of exp of act.trX, act.teX and act.prX for softmax
+		self.trLse: Union[np.ndarray, None] = None
+		self.teLse: Union[np.ndarray, None] = None
+		self.prLse: Union[np.ndarray, None] = None
+
 	@abstractmethod
 	def base(self, t: np.ndarray) -> float:
 		pass
@@ -96,6 +116,13 @@ class LossFunc1D(NodeSet, metaclass=ABCMeta):
 	def trLossMean(self) -> float:
 		return self.trLoss() / self.trT.shape[0]
 
+	@staticmethod
+	def accurateCount(t: np.ndarray, y: np.ndarray) -> int:
+		if t.shape[1] == 1:
+			return np.sum((y > 0.5) == (t > 0.5))
+		else:
+			return np.sum(y.argmax(1) == t.argmax(1))
+
 	def trAccurateCount(self):
 		if self.trT.shape[1] == 1:
 			return np.sum((self.trY > 0.5) == (self.trT > 0.5))
@@ -151,42 +178,59 @@ class LossFunc1D(NodeSet, metaclass=ABCMeta):
 			self.endYs[i] = self.ychs
 		return True
 
+	def fuse(self, act: Union[MidSet1D, None]) -> bool:
+		"""let act, the activation followed by this only, be computed by this with its gradient
+			return False if this can not compute act"""
+		return False
+
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs))
-		self.gradY = np.empty_like(self.trY)
+		self.prePropTr(trSiz)
+		self.prePropTe(teSiz)
 
 	def prePropTr(self, trSiz: int):
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype)
 		self.gradY = np.empty_like(self.trY)
+		if self.act is not None:
+			self.trLse = np.empty((trSiz, 1, self.ychs), self.dtype)
 
 	def prePropTe(self, teSiz: int):
-		self.teY = np.empty((teSiz, self.ydim, self.ychs))
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype)
+		if self.act is not None:
+			self.teLse = np.empty((teSiz, 1, self.ychs), self.dtype)
 
 	def prePropPr(self, prSiz: int):
-		self.prY = np.empty((prSiz, self.ydim, self.ychs))
+		self.prY = np.empty((prSiz, self.ydim, self.ychs), self.dtype)
+		if self.act is not None:
+			self.prLse = np.empty((prSiz, 1, self.ychs), self.dtype)
 
-	def pushTr(self, index: int, trYFrag: np.ndarray):
-		"""forward propagation
-		"""
-		self.trY[:, :, self.startYs[index]:self.endYs[index]] = trYFrag
+	def pushBothX(self):
+		self.pushTrX()
+		self.pushTeX()
 
-	def pushTe(self, index: int, teYFrag: np.ndarray):
-		self.teY[:, :, self.startYs[index]:self.endYs[index]] = teYFrag
+	def pushTrX(self):
+		if self.act is not None:
+			softmaxLse(self.act.trX, self.trY, self.trLse)
 
-	def pushPr(self, index: int, prYFrag: np.ndarray):
-		self.prY[:, :, self.startYs[index]:self.endYs[index]] = prYFrag
+	def pushTeX(self):
+		if self.act is not None:
+			softmaxLse(self.act.teX, self.teY, self.teLse)
 
-	def pushBoth(self, index: int, trYFrag: np.ndarray, teYFrag: np.ndarray):
-		"""forward propagation
-		"""
-		self.trY[:, :, self.startYs[index]:self.endYs[index]] = trYFrag
-		self.teY[:, :, self.startYs[index]:self.endYs[index]] = teYFrag
+	def pushPrX(self):
+		if self.act is not None:
+			softmaxLse(self.act.prX, self.prY, self.prLse)
 
-	def pullGrad(self):
-		self.evalGrad()
-		for i, pset in enumerate(self.prevSets):
-			pset.pullGrad(self.gradY[:, :, self.startYs[i]:self.endYs[i]])
+	def teLossSum(self, t: np.ndarray, start: int = 0) -> float:
+		"""the sum of losses of teY[start:], t is the target of them"""
+		return np.sum(self.lossVec(t, self.teY[start:]))
+
+	def xFrag(self, kind: str, index: int) -> np.ndarray:
+		"""the part of the output buffer of kind('tr', 'te' or 'pr') where prevSets[index] writes
+			xFrag('tr', i) == trY[:, :, startYs[i]:endYs[i]]"""
+		return getattr(self, kind + 'Y')[..., self.startYs[index]:self.endYs[index]]
+
+	def gradXFrag(self, index: int) -> np.ndarray:
+		"""the part of gradY which is the gradient fragment of prevSets[index]"""
+		return self.gradY[..., self.startYs[index]:self.endYs[index]]
 
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.ydim}, {self.ychs})'
@@ -307,16 +351,38 @@ class Cce1D(LossFunc1D):
 	def lossVec(self, t: np.ndarray, y: np.ndarray) -> np.ndarray:
 		return -np.sum(t * np.log(y + LOSS_E0), (1, 2))
 
+	def fuse(self, act: Union[MidSet1D, None]) -> bool:
+		# log(softmax(x)) = x - lse
+		if self.act is not None:
+			self.act.lossFunc = None
+		self.act = act if isinstance(act, Softmax1D) else None
+		if self.act is not None:
+			self.act.lossFunc = self
+		return self.act is not None
+
 	def trLoss(self):
+		if self.act is not None:
+			return np.sum(self.trT * (self.trLse - self.act.trX))
 		# log_loss is too slow
 		# from sklearn.metrics import log_loss
 		# return log_loss(self.trT, self.trY) * self.trT.shape[0]
 		return -np.sum(self.trT * np.log(self.trY + LOSS_E0))
 
 	def teLoss(self):
+		if self.act is not None:
+			return np.sum(self.teT * (self.teLse - self.act.teX))
 		return -np.sum(self.teT * np.log(self.teY + LOSS_E0))
 
+	def teLossSum(self, t: np.ndarray, start: int = 0) -> float:
+		if self.act is not None:
+			return np.sum(t * (self.teLse[start:] - self.act.teX[start:]))
+		return super().teLossSum(t, start)
+
 	def evalGrad(self):
+		if self.act is not None:
+			# gradient of softmax inputs, y * sum(t) - t
+			np.subtract(self.trY * np.sum(self.trT, 1, keepdims=True), self.trT, self.act.gradX)
+			return
 		# t / (E0 + y)
 		# self.gradY = -self.trT / (E0 + self.trY)
 		np.divide(-self.trT, self.trY + LOSS_E0, self.gradY)
@@ -337,13 +403,38 @@ class OneHotCce1D(LossFunc1D):
 	def lossVec(self, t: np.ndarray, y: np.ndarray) -> np.ndarray:
 		return -np.log(y[t.nonzero()])
 
+	def fuse(self, act: Union[MidSet1D, None]) -> bool:
+		# log(softmax(x)) = x - lse
+		if self.act is not None:
+			self.act.lossFunc = None
+		self.act = act if isinstance(act, Softmax1D) else None
+		if self.act is not None:
+			self.act.lossFunc = self
+		return self.act is not None
+
 	def trLoss(self):
+		if self.act is not None:
+			ind = self.trT.nonzero()
+			return np.sum(self.trLse[ind[0], 0, ind[2]] - self.act.trX[ind])
 		return -np.sum(np.log(self.trY[self.trT.nonzero()]))
 
 	def teLoss(self):
+		if self.act is not None:
+			ind = self.teT.nonzero()
+			return np.sum(self.teLse[ind[0], 0, ind[2]] - self.act.teX[ind])
 		return -np.sum(np.log(self.teY[self.teT.nonzero()]))
 
+	def teLossSum(self, t: np.ndarray, start: int = 0) -> float:
+		if self.act is not None:
+			ind = t.nonzero()
+			return np.sum(self.teLse[start:][ind[0], 0, ind[2]] - self.act.teX[start:][ind])
+		return super().teLossSum(t, start)
+
 	def evalGrad(self):
+		if self.act is not None:
+			# gradient of softmax inputs, y - t
+			np.subtract(self.trY, self.trT, self.act.gradX)
+			return
 		self.gradY.fill(0.0)
 		ind = self.trT.nonzero()
 		self.gradY[ind] = -1 / self.trY[ind]
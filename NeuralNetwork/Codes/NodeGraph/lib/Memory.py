@@ -0,0 +1,75 @@
+from typing import List, Union
+
+import numpy as np
+
+
+class Buffer:
+	"""buffer owner.name which is used from time first to time last"""
+
+	def __init__(self, owner, name: str, first: int, last: int):
+		self.owner = owner
+		self.name: str = name
+		self.shape: tuple = getattr(owner, name).shape
+		self.dtype: np.dtype = getattr(owner, name).dtype
+		self.size: int = int(np.prod(self.shape))
+		self.first: int = first
+		self.last: int = last
+		self.offset: int = 0
+
+	def overlaps(self, other) -> bool:
+		return self.first <= other.last and other.first <= self.last
+
+
+class MemoryPlan:
+	"""arena of buffers placed by their lifetimes
+		buffers whose lifetimes do not overlap share memory of the arena
+		buffers must be of the same type, which is the type of the arena
+		buffers requiring fixed values like zero padding must not be requested"""
+
+	# offsets are aligned to 64 bytes
+	ALIGN: int = 8
+
+	def __init__(self):
+		self.buffers: List[Buffer] = []
+		self.arena: Union[np.ndarray, None] = None
+
+	def request(self, owner, name: str, first: int, last: int):
+		"""request buffer owner.name which is used from time first to time last"""
+		self.buffers.append(Buffer(owner, name, first, last))
+
+	def place(self):
+		"""place buffers, larger ones first, at the lowest offset free during their lifetimes,
+			then replace the buffers of owners by views of the arena"""
+		dtypes = {buf.dtype for buf in self.buffers}
+		if len(dtypes) > 1:
+			raise Exception(f'buffers of types {dtypes} can not share an arena')
+		placed = []
+		size = 0
+		for buf in sorted(self.buffers, key=lambda b: -b.size):
+			offset = 0
+			for other in sorted((p for p in placed if p.overlaps(buf)), key=lambda p: p.offset):
+				if offset + buf.size <= other.offset:
+					break
+				offset = max(offset, MemoryPlan.align(other.offset + other.size))
+			buf.offset = offset
+			placed.append(buf)
+			size = max(size, offset + buf.size)
+		self.arena = np.empty(size, dtypes.pop() if dtypes else float)
+		for buf in self.buffers:
+			setattr(buf.owner, buf.name, self.arena[buf.offset:buf.offset + buf.size].reshape(buf.shape))
+
+	@staticmethod
+	def align(offset: int) -> int:
+		return -(-offset // MemoryPlan.ALIGN) * MemoryPlan.ALIGN
+
+	@property
+	def naiveBytes(self) -> int:
+		"""bytes of the buffers if every buffer were allocated separately"""
+		return sum(buf.size * buf.dtype.itemsize for buf in self.buffers)
+
+	@property
+	def arenaBytes(self) -> int:
+		return 0 if self.arena is None else self.arena.nbytes
+
+	def __str__(self) -> str:
+		return f'{len(self.buffers)} buffers, {self.naiveBytes / 2 ** 20:.2f}MB in {self.arenaBytes / 2 ** 20:.2f}MB arena'
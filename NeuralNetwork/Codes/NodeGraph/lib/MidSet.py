@@ -1,5 +1,6 @@
 from typing import Tuple
 
+from .Executor import Executor
 from .StartSet import *
 
 
@@ -56,9 +57,6 @@ class MidSet1D(NodeSet, metaclass=ABCMeta):
 		#	trX[:, startX[i]:endX[i]] = prevSet[i].trY
 		self.endXs: Union[np.ndarray, None] = None
 
-		# the number of trX fragment's that are not forwardly propagated
-		self.xNeeds: int = 0
-
 		# next NodeSets: MidSets and/or LossFunc
 		#	self.nextSet[i].prevSet[nextInd[i]] == self
 		self.nextSets: Tuple = ()
@@ -66,8 +64,9 @@ class MidSet1D(NodeSet, metaclass=ABCMeta):
 		# index of self in each next MidSets
 		self.nextInd: np.ndarray = np.array([], int)
 
-		# the number of gradY fragment's that are not backward propagated
-		self.gradNeeds: int = 0
+		# worker pool to which chunked work is submitted
+		#	NodeGraph.compile() replaces it with the pool of the graph
+		self.executor: Executor = Executor(1)
 
 	def addPrevSets(self, *prevSets):
 		for pset in prevSets:
@@ -92,64 +91,31 @@ class MidSet1D(NodeSet, metaclass=ABCMeta):
 		return True
 
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.trX = np.empty((trSiz, self.xdim, self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
+		self.trX = np.empty((trSiz, self.xdim, self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
-		self.teX = np.empty((teSiz, self.xdim, self.xchs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs))
+		self.teX = np.empty((teSiz, self.xdim, self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype)
 
 	def prePropTr(self, trSiz: int):
-		self.trX = np.empty((trSiz, self.xdim, self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
+		self.trX = np.empty((trSiz, self.xdim, self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
 
 	def prePropTe(self, teSiz: int):
-		self.teX = np.empty((teSiz, self.xdim, self.xchs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs))
+		self.teX = np.empty((teSiz, self.xdim, self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype)
 
 	def prePropPr(self, prSiz: int):
-		self.prX = np.empty((prSiz, self.xdim, self.xchs))
-		self.prY = np.empty((prSiz, self.ydim, self.ychs))
-
-	def resetForPush(self):
-		self.xNeeds = len(self.prevSets)
+		self.prX = np.empty((prSiz, self.xdim, self.xchs), self.dtype)
+		self.prY = np.empty((prSiz, self.ydim, self.ychs), self.dtype)
 
-	def pushBoth(self, index: int, trXFrag: np.ndarray, teXFrag: np.ndarray):
-		"""forward propagation
-		"""
-		self.trX[:, :, self.startXs[index]:self.endXs[index]] = trXFrag
-		self.teX[:, :, self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushBothX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushBoth(nind, self.trY, self.teY)
-
-	def pushTr(self, index: int, trXFrag: np.ndarray):
-		self.trX[:, :, self.startXs[index]:self.endXs[index]] = trXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTr(nind, self.trY)
-
-	def pushTe(self, index: int, teXFrag: np.ndarray):
-		self.teX[:, :, self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTeX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTe(nind, self.teY)
-
-	def pushPr(self, index: int, prXFrag: np.ndarray):
-		self.prX[:, :, self.startXs[index]:self.endXs[index]] = prXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushPrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushPr(nind, self.prY)
+	def xFrag(self, kind: str, index: int) -> np.ndarray:
+		"""the part of the input buffer of kind('tr', 'te' or 'pr') where prevSets[index] writes
+			xFrag('tr', i) == trX[:, :, startXs[i]:endXs[i]]"""
+		return getattr(self, kind + 'X')[..., self.startXs[index]:self.endXs[index]]
 
 	@abstractmethod
 	def pushBothX(self):
@@ -179,19 +145,31 @@ class MidSet1D(NodeSet, metaclass=ABCMeta):
 		"""
 		pass
 
-	def resetForPull(self):
-		self.gradNeeds = len(self.nextSets)
-		self.gradY.fill(0.0)
+	def gradXFrag(self, index: int) -> np.ndarray:
+		"""the part of gradX which is the gradient fragment of prevSets[index]"""
+		return self.gradX[..., self.startXs[index]:self.endXs[index]]
 
-	def pullGrad(self, gradYFrag: np.ndarray):
-		"""backward propagation
-		"""
-		self.gradY += gradYFrag
-		self.gradNeeds -= 1
-		if self.gradNeeds == 0:
-			self.pullGradY()
-			for i, pset in enumerate(self.prevSets):
-				pset.pullGrad(self.gradX[:, :, self.startXs[i]:self.endXs[i]])
+	def bindY(self, kind: str, y: np.ndarray) -> bool:
+		"""use y, a part of the input buffer of the next set, as the output buffer of kind('tr', 'te' or 'pr')
+			return False if the output can not be written into y directly"""
+		setattr(self, kind + 'Y', y)
+		return True
+
+	def bindGradY(self, gradY: np.ndarray) -> bool:
+		"""use gradY, a part of gradX of the next set, as the buffer of gradY
+			return False if gradY can not be read directly"""
+		self.gradY = gradY
+		return True
+
+	def fuse(self, act) -> bool:
+		"""let act, an elementwise activation of outputs, be computed in place by the kernels of this set
+			return False if this set can not compute act"""
+		return False
+
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		"""names of buffers of kind('te', 'pr' or 'grad') which the memory planner may place on an arena
+			the values of the buffers are not kept between propagations"""
+		return kind + 'X', kind + 'Y'
 
 	@abstractmethod
 	def pullGradY(self):
@@ -255,9 +233,6 @@ class MidSet2D(NodeSet, metaclass=ABCMeta):
 		#	trX[:, startX[i]:endX[i]] = prevSet[i].trY
 		self.endXs: Union[np.ndarray, None] = None
 
-		# the number of trX fragment's that are not forwardly propagated
-		self.xNeeds: int = 0
-
 		# next NodeSets: MidSets and/or LossFunc
 		#	self.nextSet[i].prevSet[nextInd[i]] == self
 		self.nextSets: Tuple = ()
@@ -265,8 +240,9 @@ class MidSet2D(NodeSet, metaclass=ABCMeta):
 		# index of self in each next MidSets
 		self.nextInd: np.ndarray = np.array([], int)
 
-		# the number of gradY fragment's that are not backward propagated
-		self.gradNeeds: int = 0
+		# worker pool to which chunked work is submitted
+		#	NodeGraph.compile() replaces it with the pool of the graph
+		self.executor: Executor = Executor(1)
 
 	def addPrevSets(self, *prevSets):
 		for pset in prevSets:
@@ -291,74 +267,41 @@ class MidSet2D(NodeSet, metaclass=ABCMeta):
 		return True
 
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.trX = np.empty((trSiz, self.xdim, self.xchs)) if isinstance(self.xdim, int) else \
-			np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs)) if isinstance(self.ydim, int) else \
-			np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.trX = np.empty((trSiz, self.xdim, self.xchs), self.dtype) if isinstance(self.xdim, int) else \
+			np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype) if isinstance(self.ydim, int) else \
+			np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
-		self.teX = np.empty((teSiz, self.xdim, self.xchs)) if isinstance(self.xdim, int) else \
-			np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs)) if isinstance(self.ydim, int) else \
-			np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.teX = np.empty((teSiz, self.xdim, self.xchs), self.dtype) if isinstance(self.xdim, int) else \
+			np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype) if isinstance(self.ydim, int) else \
+			np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
 	def prePropTr(self, trSiz: int):
-		self.trX = np.empty((trSiz, self.xdim, self.xchs)) if isinstance(self.xdim, int) else \
-			np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs)) if isinstance(self.ydim, int) else \
-			np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.trX = np.empty((trSiz, self.xdim, self.xchs), self.dtype) if isinstance(self.xdim, int) else \
+			np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype) if isinstance(self.ydim, int) else \
+			np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 		self.gradX = np.empty_like(self.trX)
 		self.gradY = np.empty_like(self.trY)
 
 	def prePropTe(self, teSiz: int):
-		self.teX = np.empty((teSiz, self.xdim, self.xchs)) if isinstance(self.xdim, int) else \
-			np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs)) if isinstance(self.ydim, int) else \
-			np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs))
+		self.teX = np.empty((teSiz, self.xdim, self.xchs), self.dtype) if isinstance(self.xdim, int) else \
+			np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype) if isinstance(self.ydim, int) else \
+			np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
 	def prePropPr(self, prSiz: int):
-		self.prX = np.empty((prSiz, self.xdim, self.xchs)) if isinstance(self.xdim, int) else \
-			np.empty((prSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.prY = np.empty((prSiz, self.ydim, self.ychs)) if isinstance(self.ydim, int) else \
-			np.empty((prSiz, self.ydim[0], self.ydim[1], self.ychs))
-
-	def resetForPush(self):
-		self.xNeeds = len(self.prevSets)
+		self.prX = np.empty((prSiz, self.xdim, self.xchs), self.dtype) if isinstance(self.xdim, int) else \
+			np.empty((prSiz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		self.prY = np.empty((prSiz, self.ydim, self.ychs), self.dtype) if isinstance(self.ydim, int) else \
+			np.empty((prSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
-	def pushBoth(self, index: int, trXFrag: np.ndarray, teXFrag: np.ndarray):
-		"""forward propagation
-		"""
-		self.trX[:, :, :, self.startXs[index]:self.endXs[index]] = trXFrag
-		self.teX[:, :, :, self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushBothX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushBoth(nind, self.trY, self.teY)
-
-	def pushTr(self, index: int, trXFrag: np.ndarray):
-		self.trX[:, :, :, self.startXs[index]:self.endXs[index]] = trXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTr(nind, self.trY)
-
-	def pushTe(self, index: int, teXFrag: np.ndarray):
-		self.teX[:, :, :, self.startXs[index]:self.endXs[index]] = teXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushTeX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushTe(nind, self.teY)
-
-	def pushPr(self, index: int, prXFrag: np.ndarray):
-		self.prX[:, :, :, self.startXs[index]:self.endXs[index]] = prXFrag
-		self.xNeeds -= 1
-		if self.xNeeds == 0:
-			self.pushPrX()
-			for nset, nind in zip(self.nextSets, self.nextInd):
-				nset.pushPr(nind, self.prY)
+	def xFrag(self, kind: str, index: int) -> np.ndarray:
+		"""the part of the input buffer of kind('tr', 'te' or 'pr') where prevSets[index] writes
+			xFrag('tr', i) == trX[:, :, :, startXs[i]:endXs[i]]"""
+		return getattr(self, kind + 'X')[..., self.startXs[index]:self.endXs[index]]
 
 	@abstractmethod
 	def pushBothX(self):
@@ -388,19 +331,31 @@ class MidSet2D(NodeSet, metaclass=ABCMeta):
 		"""
 		pass
 
-	def resetForPull(self):
-		self.gradNeeds = len(self.nextSets)
-		self.gradY.fill(0.0)
+	def gradXFrag(self, index: int) -> np.ndarray:
+		"""the part of gradX which is the gradient fragment of prevSets[index]"""
+		return self.gradX[..., self.startXs[index]:self.endXs[index]]
 
-	def pullGrad(self, gradYFrag: np.ndarray):
-		"""backward propagation
-		"""
-		self.gradY += gradYFrag
-		self.gradNeeds -= 1
-		if self.gradNeeds == 0:
-			self.pullGradY()
-			for i, pset in enumerate(self.prevSets):
-				pset.pullGrad(self.gradX[:, :, :, self.startXs[i]:self.endXs[i]])
+	def bindY(self, kind: str, y: np.ndarray) -> bool:
+		"""use y, a part of the input buffer of the next set, as the output buffer of kind('tr', 'te' or 'pr')
+			return False if the output can not be written into y directly"""
+		setattr(self, kind + 'Y', y)
+		return True
+
+	def bindGradY(self, gradY: np.ndarray) -> bool:
+		"""use gradY, a part of gradX of the next set, as the buffer of gradY
+			return False if gradY can not be read directly"""
+		self.gradY = gradY
+		return True
+
+	def fuse(self, act) -> bool:
+		"""let act, an elementwise activation of outputs, be computed in place by the kernels of this set
+			return False if this set can not compute act"""
+		return False
+
+	def plannedBuffers(self, kind: str) -> Tuple[str, ...]:
+		"""names of buffers of kind('te', 'pr' or 'grad') which the memory planner may place on an arena
+			the values of the buffers are not kept between propagations"""
+		return kind + 'X', kind + 'Y'
 
 	@abstractmethod
 	def pullGradY(self):
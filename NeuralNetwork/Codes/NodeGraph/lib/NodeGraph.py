@@ -1,17 +1,74 @@
-from typing import Tuple
+import threading
+import time
+from ast import literal_eval
+from typing import Callable, Dict, Tuple
 
 from .Activation import *
+from .Callback import *
 from .Dense import *
 from .Flatten import *
 from .Loss import *
 from .Convolution import *
+from .Dataset import *
+from .Executor import Executor
+from .Frozen import FrozenGraph
+from .Optimizer import *
+from .Parallel import DataParallel
+from .Params import FlatParams
+from .Plan import ExecutionPlan
 from .Pooling import *
+from .Prefetch import Prefetcher
 from .Regularizer import *
+from .Schedule import *
 from .Util import *
 
+# type of buffers and parameters, and type in which losses, dot products and norms of gradients are accumulated
+PRECISIONS = {'float64': (np.float64, np.float64), 'float32': (np.float32, np.float32), 'mixed': (np.float32, np.float64)}
+
+
+def nodeSetFromStr(s: str) -> Tuple[NodeSet, int, List[int]]:
+	"""node set made from its saveStr()
+	:return: the node set, its saved Id and the saved Ids of its prevSets
+	"""
+	name, args, prevIds = parseSaveStr(s)
+	cls = globals().get(name)
+	if not (isinstance(cls, type) and issubclass(cls, NodeSet)):
+		raise Exception(f'unknown node set {name}')
+	v = []
+	for a in args:
+		try:
+			v.append(literal_eval(a))
+		except (ValueError, SyntaxError):
+			# names
+			v.append(a)
+	if issubclass(cls, (StartSet1D, StartSet2D)):
+		# Id, ydim, ychs, name
+		nset = cls(v[1], v[2], args[3])
+	elif issubclass(cls, Dense1D):
+		# Id, ydim, ychs, biased, name
+		nset = cls(v[1], v[3], args[4])
+	elif issubclass(cls, (Conv1D, Conv2D)):
+		# Id, name, filSiz, ychs, biased, pad, stride, method, which is not saved by earlier versions
+		nset = cls(v[2], v[3], v[4], v[5], v[6], args[1], *args[7:8])
+	elif issubclass(cls, (MaxPool1D, MaxPool2D)):
+		# Id, name, step, stride
+		nset = cls(v[2], args[1], v[3])
+	else:
+		# Id, name
+		nset = cls(args[1])
+	return nset, v[0], prevIds
+
 
 class NodeGraph(metaclass=ABCMeta):
-	def __init__(self):
+	def __init__(self, precision: str = 'float64'):
+		"""
+		:param precision: one of PRECISIONS
+			'mixed' computes in float32 while losses and the gradDot sign test of adaptive trainers are accumulated in float64
+		"""
+		if precision not in PRECISIONS:
+			raise Exception(f'precision must be one of {tuple(PRECISIONS)}')
+		self.precision: str = precision
+		self.dtype, self.accDtype = PRECISIONS[precision]
 		self.startSets: Tuple = ()
 		self.fitSets: Tuple = ()
 		self.acts: Tuple = ()
@@ -22,6 +79,47 @@ class NodeGraph(metaclass=ABCMeta):
 		self.lossMax: float = 0.0001
 		self.epochMax: int = 1000
 		self.reg: Regularizer = RegNone()  # regularizer
+		# gradients are scaled so that their norm is at most clipNorm if not None
+		self.clipNorm: Union[float, None] = None
+		# parameters and gradients of fit sets as views of contiguous vectors, made by preFit()
+		self.flat: Union[FlatParams, None] = None
+		# called by trainers at the start and the end of fitting and of each epoch, like EarlyStopping
+		self.callbacks: List[Callback] = []
+
+		# worker pool shared by all mid sets
+		#	the number of threads is set by NodeGraph.executor.nThreads
+		self.executor: Executor = Executor()
+
+		# flat execution plan built by compile()
+		self.plan: Union[ExecutionPlan, None] = None
+		# whether compile() fuses elementwise activations into the fit sets followed by them
+		self.fuseActs: bool = True
+		# whether compile() fuses Softmax1D into Cce1D or OneHotCce1D followed by it only
+		self.fuseLoss: bool = True
+
+		# the number of data propagated at once by predict() and evaluate(), all data if None
+		self.evalChunk: Union[int, None] = 1000
+		# the number of data propagated at once by propagateGrad(), whose gradients are summed, all data if None
+		self.microBatch: Union[int, None] = None
+		# trainers evaluate test data every evalEvery epochs and at the last epoch, teLosses and teAccuracy are NaN otherwise
+		self.evalEvery: int = 1
+		# the number of test data evaluated by trainers, a random subset fixed during fitting, all test data if None
+		self.evalSample: Union[int, None] = None
+		# trainers write a checkpoint to checkpointPath every checkpointEvery epochs or checkpointSeconds seconds,
+		#	from which fit(resume=checkpointPath) continues
+		self.checkpointPath: Union[str, None] = None
+		self.checkpointEvery: Union[int, None] = None
+		self.checkpointSeconds: Union[float, None] = None
+		self.__checkpointTime: float = 0.0
+		# thread writing the last checkpoint, and its error if any
+		self.__writer: Union[threading.Thread, None] = None
+		self.__writeError: Union[BaseException, None] = None
+		# arrays of the history of epochs registered by startEpoch()
+		self.__history: Dict[str, np.ndarray] = {}
+		# checkpoint given to fit(resume=...), restored by startEpoch()
+		self.__resumeState: Union[Dict[str, np.ndarray], None] = None
+		# indices of the test data chosen by testSample(), None if all
+		self.__sampleInd: Union[np.ndarray, None] = None
 
 		self.trX: Union[np.ndarray, Tuple, List, None] = None
 		self.trT: Union[np.ndarray, None] = None
@@ -56,102 +154,354 @@ class NodeGraph(metaclass=ABCMeta):
 		return nodeSet
 
 	def compile(self):
-		compiled = False
-		while not compiled:
-			compiled = True
-			for mset in self.midSets:
-				if not mset.compile():
-					compiled = False
-			if not self.lossFunc.compile():
-				compiled = False
+		self.plan = ExecutionPlan(self.startSets, self.midSets, self.lossFunc, self.fuseActs, self.fuseLoss)
+		# every node set is compiled after its prevSets
+		for nset in self.plan.steps:
+			if not nset.compile():
+				raise Exception(f'{nset.name} can not be compiled')
+		for mset in self.midSets:
+			mset.executor = self.executor
+		for nset in self.plan.steps:
+			nset.dtype = self.dtype
 
 	def prePropBoth(self, trSiz, teSiz):
 		for mset in self.midSets:
 			mset.prePropBoth(trSiz, teSiz)
 		self.lossFunc.prePropBoth(trSiz, teSiz)
+		self.plan.bind('tr')
+		self.plan.bind('te')
+		self.plan.place('both')
 
 	def prePropTr(self, trSiz):
 		for mset in self.midSets:
 			mset.prePropTr(trSiz)
 		self.lossFunc.prePropTr(trSiz)
+		self.plan.bind('tr')
+		self.plan.place('tr')
 
 	def prePropTe(self, teSiz):
 		for mset in self.midSets:
 			mset.prePropTe(teSiz)
 		self.lossFunc.prePropTe(teSiz)
+		self.plan.bind('te')
+		self.plan.place('te')
 
 	def prePropPr(self, prSiz):
 		for mset in self.midSets:
 			mset.prePropPr(prSiz)
 		self.lossFunc.prePropPr(prSiz)
+		self.plan.bind('pr')
+		self.plan.place('pr')
 
 	def pushBoth(self, trXFrag: Union[np.ndarray, Tuple, List], teXFrag: Union[np.ndarray, Tuple, List]):
-		for mset in self.midSets:
-			mset.resetForPush()
-		if isinstance(trXFrag, np.ndarray):
-			for sset in self.startSets:
-				sset.pushBoth(trXFrag, teXFrag)
-		else:
-			for sset, trx, tex in zip(self.startSets, trXFrag, teXFrag):
-				sset.pushBoth(trx, tex)
+		self.plan.push('both', trXFrag, teXFrag)
 
 	def pushTr(self, trXFrag: Union[np.ndarray, Tuple, List]):
-		for mset in self.midSets:
-			mset.resetForPush()
-		if isinstance(trXFrag, np.ndarray):
-			for sset in self.startSets:
-				sset.pushTr(trXFrag)
-		else:
-			for sset, trx in zip(self.startSets, trXFrag):
-				sset.pushTr(trx)
+		self.plan.push('tr', trXFrag)
 
 	def pushTe(self, teXFrag: Union[np.ndarray, Tuple, List]):
-		for mset in self.midSets:
-			mset.resetForPush()
-		if isinstance(teXFrag, np.ndarray):
-			for sset in self.startSets:
-				sset.pushTe(teXFrag)
-		else:
-			for sset, trx in zip(self.startSets, teXFrag):
-				sset.pushTe(trx)
+		self.plan.push('te', teXFrag)
 
 	def pushPr(self, prX: Union[np.ndarray, Tuple, List]):
-		for mset in self.midSets:
-			mset.resetForPush()
-		if isinstance(prX, np.ndarray):
-			for sset in self.startSets:
-				sset.pushPr(prX)
-		else:
-			for sset, prx in zip(self.startSets, prX):
-				sset.pushPr(prx)
+		self.plan.push('pr', prX)
 
 	def pullGrad(self):
-		for mset in self.midSets:
-			mset.resetForPull()
-		self.lossFunc.pullGrad()
+		self.plan.pull()
+		self.adjustGrad()
+
+	def microSize(self, siz: int) -> int:
+		"""the number of data propagated at once by propagateGrad() for siz data"""
+		return siz if self.microBatch is None else min(self.microBatch, siz)
+
+	def propagateGrad(self, x: Union[np.ndarray, Tuple, List], t: np.ndarray) -> Tuple[float, int]:
+		"""propagate x forward and backward in micro-batches of microSize() data, and sum gradients of fit sets
+			buffers of training must be of microSize() data, and the gradients are not adjusted by adjustGrad()
+		:return: the sum of losses and the number of accurate outputs
+		"""
+		siz = t.shape[0]
+		micro = self.microSize(siz)
+		if siz % micro != 0:
+			raise Exception(f'{siz} data can not be divided into micro-batches of {micro} data')
+		loss, count = 0.0, 0
+		gradSum = None
+		for start in range(0, siz, micro):
+			self.lossFunc.trT = t[start:start + micro]
+			self.pushTr(dataSlice(x, start, start + micro))
+			self.plan.pull()
+			loss += self.lossFunc.trLoss()
+			count += self.lossFunc.trAccurateCount()
+			if micro == siz:
+				pass
+			elif gradSum is None:
+				gradSum = self.flat.grad.copy()
+			else:
+				gradSum += self.flat.grad
+		if gradSum is not None:
+			np.copyto(self.flat.grad, gradSum)
+		return loss, count
+
+	def adjustGrad(self):
+		"""add the gradient of the regularizer, and clip gradients by clipNorm"""
+		if self.flat is not None:
+			self.flat.regularize(self.reg)
+			if self.clipNorm is not None:
+				self.flat.clip(self.clipNorm)
+
+	def preFit(self):
+		"""initialize parameters of fit sets, and make them views of contiguous vectors
+			the regularizer is applied to the vectors by pullGrad()"""
+		for fset in self.fitSets:
+			fset.preFit()
+		self.flat = FlatParams(self.fitSets, self.dtype, self.accDtype)
+		for callback in self.callbacks:
+			callback.onFitStart(self)
+
+	def epochEnd(self, epoch: int, **logs: float) -> bool:
+		"""call callbacks with the metrics of an epoch
+		:return: whether any callback stops fitting
+		"""
+		stop = False
+		for callback in self.callbacks:
+			stop = callback.onEpochEnd(self, epoch, logs) or stop
+		return stop
+
+	def postFit(self):
+		self.waitCheckpoint()
+		for callback in self.callbacks:
+			callback.onFitEnd(self)
+
+	def trainState(self) -> Dict[str, np.ndarray]:
+		"""state of fitting written by checkpoint(), trainers add their own state
+			arrays may be views, which are copied by checkpoint()"""
+		_, keys, pos, hasGauss, gauss = np.random.get_state()
+		state = {'graph': np.array(self.__class__.__name__), 'rngKeys': keys, 'rngPos': np.array([pos, hasGauss]),
+				 'rngGauss': np.array(gauss)}
+		for key, vec in self.flat.vectors.items():
+			state[f'flat.{key}'] = vec
+		if self.__sampleInd is not None:
+			state['sampleInd'] = self.__sampleInd
+		return state
+
+	def setTrainState(self, state: Dict[str, np.ndarray]):
+		"""restore trainState(), including the random state of permutations of minibatches"""
+		if str(state['graph']) != self.__class__.__name__:
+			raise Exception(f'checkpoint of {state["graph"]} can not be resumed by {self.__class__.__name__}')
+		for key, vec in self.flat.vectors.items():
+			np.copyto(vec, state[f'flat.{key}'])
+		pos, hasGauss = state['rngPos']
+		np.random.set_state(('MT19937', state['rngKeys'], int(pos), int(hasGauss), float(state['rngGauss'])))
+
+	def startEpoch(self, **history: np.ndarray) -> int:
+		"""register arrays of the history of epochs, and restore the checkpoint of fit(resume=...) if any
+			called by trainers after buffers are prepared
+		:return: the first epoch, the one following the checkpoint if resumed
+		"""
+		self.__history = history
+		self.__checkpointTime = time.perf_counter()
+		state, self.__resumeState = self.__resumeState, None
+		if state is None:
+			return 0
+		epoch = int(state['epoch'])
+		if epoch >= self.epochMax:
+			raise Exception(f'checkpoint at epoch {epoch} is not before epochMax {self.epochMax}')
+		self.setTrainState(state)
+		for name, arr in history.items():
+			arr[:epoch + 1] = state[f'history.{name}']
+		return epoch + 1
+
+	def checkpoint(self, epoch: int):
+		"""write arrays of save(), trainState() and the history up to epoch to checkpointPath by a background thread
+			if checkpointEvery epochs or checkpointSeconds seconds have passed, called by trainers at the end of each epoch
+			the file is replaced atomically, and an error of writing is raised by the next checkpoint() or postFit()
+		"""
+		if self.checkpointPath is None:
+			return
+		if not (self.checkpointEvery is not None and (epoch + 1) % self.checkpointEvery == 0 or
+				self.checkpointSeconds is not None and time.perf_counter() - self.__checkpointTime >= self.checkpointSeconds):
+			return
+		self.waitCheckpoint()
+		state = {**self.saveArrays(), **self.trainState(), 'epoch': epoch}
+		for name, arr in self.__history.items():
+			state[f'history.{name}'] = arr[:epoch + 1]
+		# copies, since training goes on while they are written
+		state = {k: np.array(v) for k, v in state.items()}
+
+		def write():
+			try:
+				savezAtomic(self.checkpointPath, state)
+			except BaseException as e:
+				self.__writeError = e
+
+		self.__writer = threading.Thread(target=write)
+		self.__writer.start()
+		self.__checkpointTime = time.perf_counter()
+
+	def waitCheckpoint(self):
+		"""wait for the checkpoint being written"""
+		if self.__writer is not None:
+			self.__writer.join()
+			self.__writer = None
+		if self.__writeError is not None:
+			e, self.__writeError = self.__writeError, None
+			raise Exception(f'checkpoint could not be written to {self.checkpointPath}') from e
 
 	def fit(self, trX: Union[np.ndarray, Tuple, List], trT: np.ndarray,
 			teX: Union[np.ndarray, Tuple, List] = None, teT: np.ndarray = None,
-			**kwargs):
-		self.trX, self.trT, self.teX, self.teT = trX, trT, teX, teT
+			resume: str = None, **kwargs):
+		"""
+		:param resume: checkpoint written by checkpoint(), from whose epoch fitting continues
+		"""
+		# losses are accumulated in the type of targets
+		if isinstance(trX, Dataset):
+			# targets of the shards are read once for their sizes and the base of losses
+			trX.scan(self.lossFunc, self.accDtype)
+			self.trX, self.trT = trX, None
+		else:
+			self.trX, self.trT = trX, np.asarray(trT, self.accDtype)
+		self.teX, self.teT = teX, None if teT is None else np.asarray(teT, self.accDtype)
+		if resume is None:
+			self.__resumeState = None
+		else:
+			with np.load(resume, allow_pickle=False) as f:
+				self.__resumeState = dict(f)
 
 		# set attributes:learnType, lossMax, and so on if any
 		for k, v in kwargs.items():
 			if v is not None:
 				self.__setattr__(k, v)
 
-	def predict(self, prX: Union[np.ndarray, tuple, list], clear: bool = False) -> np.ndarray:
+	def trainArrays(self) -> Tuple[Union[np.ndarray, Tuple, List], np.ndarray]:
+		"""training data, or data of no rows with the shapes of the data if trX is a Dataset"""
+		if isinstance(self.trX, Dataset):
+			x, t = self.trX.empty()
+			return x, np.asarray(t, self.accDtype)
+		return self.trX, self.trT
+
+	def trainLossBase(self) -> float:
+		return self.trX.lossBase if isinstance(self.trX, Dataset) else self.lossFunc.base(self.trT)
+
+	def batchCount(self, batchSize: int) -> int:
+		"""the number of minibatches of training data in an epoch"""
+		return self.trX.batchCount(batchSize) if isinstance(self.trX, Dataset) else dataSize(self.trX) // batchSize
+
+	def trainBatches(self, prefetcher: Prefetcher):
+		"""minibatches of training data of an epoch in random order, read by shards if trX is a Dataset"""
+		if isinstance(self.trX, Dataset):
+			return self.trX.batches(prefetcher)
+		return prefetcher.batches(np.random.permutation(dataSize(self.trX)))
+
+	def params(self) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+		"""parameters of fit sets and their gradients updated by optimizers, valid after preFit()"""
+		return [self.flat.param], [self.flat.grad]
+
+	def evalSize(self, siz: int) -> int:
+		"""the number of data propagated at once by predict() and evaluate() for siz data"""
+		return siz if self.evalChunk is None else min(self.evalChunk, siz)
+
+	def evalChunks(self, siz: int):
+		"""chunks of siz data of the same size evalSize(siz)
+			the last chunk overlaps the previous one so that buffers are reused
+		:return: iterator of (lower, start, end), data[lower:end] are propagated and data[start:end] are new
 		"""
+		chunk = self.evalSize(siz)
+		for start in range(0, siz, chunk):
+			end = min(start + chunk, siz)
+			yield end - chunk, start, end
+
+	def testSample(self) -> Tuple[Union[np.ndarray, Tuple], np.ndarray]:
+		"""test data evaluated by trainers, evalSample data of teX and teT chosen at random"""
+		siz = self.teT.shape[0]
+		if self.evalSample is None or self.evalSample >= siz:
+			self.__sampleInd = None
+			return self.teX, self.teT
+		if self.__resumeState is not None and 'sampleInd' in self.__resumeState:
+			# the same test data as the checkpoint
+			ind = self.__resumeState['sampleInd']
+		else:
+			ind = np.sort(np.random.choice(siz, self.evalSample, replace=False))
+		self.__sampleInd = ind
+		return dataTake(self.teX, ind), self.teT[ind]
+
+	def evalDue(self, epoch: int, trLoss: float) -> bool:
+		"""whether trainers evaluate test data at epoch"""
+		return epoch % self.evalEvery == 0 or epoch == self.epochMax or trLoss < self.lossMax
+
+	def predict(self, prX: Union[np.ndarray, tuple, list], clear: bool = False) -> np.ndarray:
+		"""prX is propagated in chunks of evalChunk data
 		:param prX: either array, tuple of arrays or list of arrays
 		:param clear: clear data for predict
 		:return: prediction
 		"""
-		prSiz = prX.shape[0] if isinstance(prX, np.ndarray) else prX[0].shape[0]
-		self.prePropPr(prSiz)
-		self.pushPr(prX)
+		prSiz = dataSize(prX)
+		chunk = self.evalSize(prSiz)
+		if self.lossFunc.prY is None or self.lossFunc.prY.shape[0] != chunk:
+			self.prePropPr(chunk)
+		prY = np.empty((prSiz,) + self.lossFunc.prY.shape[1:])
+		for lower, start, end in self.evalChunks(prSiz):
+			self.pushPr(dataSlice(prX, lower, end))
+			prY[start:end] = self.lossFunc.prY[start - lower:]
 		if clear:
 			self.clearPredict()
-		return self.lossFunc.prY
+		return prY
+
+	def evaluate(self, x: Union[np.ndarray, tuple, list], t: np.ndarray) -> Tuple[int, float]:
+		"""x is propagated in chunks of evalChunk data by test buffers
+		:param x: either array, tuple of arrays or list of arrays
+		:param t: target
+		:return: the number of accurate outputs and the sum of losses
+		"""
+		siz = t.shape[0]
+		chunk = self.evalSize(siz)
+		if self.lossFunc.teY is None or self.lossFunc.teY.shape[0] != chunk:
+			self.prePropTe(chunk)
+		count, loss = 0, 0.0
+		for lower, start, end in self.evalChunks(siz):
+			self.pushTe(dataSlice(x, lower, end))
+			y = self.lossFunc.teY[start - lower:]
+			count += self.lossFunc.accurateCount(t[start:end], y)
+			loss += self.lossFunc.teLossSum(t[start:end], start - lower)
+		return count, loss
+
+	def freeze(self, maxBatch: int = None) -> FrozenGraph:
+		"""inference only copy of the graph
+		:param maxBatch: the maximum number of data propagated at once, evalChunk or 1000 if None
+		"""
+		if maxBatch is None:
+			maxBatch = 1000 if self.evalChunk is None else self.evalChunk
+		return FrozenGraph(self, maxBatch)
+
+	def saveArrays(self) -> Dict[str, np.ndarray]:
+		"""arrays written by save(), parameters are views of the fit sets"""
+		sets = [nset.saveStr() for nset in self.startSets + self.midSets + (self.lossFunc,)]
+		arrays = {'graph': np.array(self.__class__.__name__), 'precision': np.array(self.precision),
+				  'fuse': np.array([self.fuseActs, self.fuseLoss]), 'sets': np.array(sets)}
+		for i, fset in enumerate(self.fitSets):
+			arrays[f'W{i}'], arrays[f'B{i}'] = fset.W, fset.B
+		return arrays
+
+	def save(self, path: str):
+		"""save the graph by saveStr() of its node sets and parameters of its fit sets to an uncompressed .npz file
+			parameters are saved in the type of the precision, valid after preFit()
+		"""
+		np.savez(path, **self.saveArrays())
+
+	@staticmethod
+	def load(path: str) -> 'NodeGraph':
+		"""graph saved by save() or checkpoint(), compiled with the saved parameters
+			they are also initW and initB of the fit sets, so that fit() continues from them
+		"""
+		with np.load(path, allow_pickle=False) as f:
+			ng = globals()[str(f['graph'])](str(f['precision']))
+			ng.fuseActs, ng.fuseLoss = (bool(b) for b in f['fuse'])
+			nsets = [nodeSetFromStr(s) for s in f['sets']]
+			byId = {Id: nset for nset, Id, _ in nsets}
+			for nset, _, prevIds in nsets:
+				ng.add(nset, *(byId[Id] for Id in prevIds))
+			ng.compile()
+			for i, fset in enumerate(ng.fitSets):
+				fset.initW, fset.initB = f[f'W{i}'], f[f'B{i}']
+		ng.preFit()
+		return ng
 
 	def clearPredict(self):
 		for sset in self.startSets:
@@ -161,15 +511,35 @@ class NodeGraph(metaclass=ABCMeta):
 			mset.prY = None
 		self.lossFunc.prY = None
 
+	def memoryInfo(self) -> str:
+		"""memory of buffers and parameters of node sets after prePropTr, prePropTe, ..."""
+		arrays = {}
+		for nset in self.midSets + (self.lossFunc,):
+			for v in vars(nset).values():
+				if isinstance(v, np.ndarray):
+					while isinstance(v.base, np.ndarray):
+						v = v.base
+					arrays[id(v)] = v.nbytes
+		c = f'planned memory: {sum(arrays.values()) / 2 ** 20:.2f}MB'
+		for kind, memory in self.plan.memory.items():
+			c += f'\n    {kind}: {memory}'
+		return c
+
 	def graphInfo(self, form: str = 'short') -> str:
 		"""
 		:param form: one of 'long', 'save', 'short'
 		:return: string of graph information
 		"""
 
-		c = f'loss maximum: {getFloatStr(self.lossMax)}\n'
+		c = f'precision: {self.precision}\n'
+		c += f'loss maximum: {getFloatStr(self.lossMax)}\n'
 		c += f'regularizer: {str(self.reg)}\n'
 		c += f'epoch maximum: {self.epochMax}\n'
+		if self.callbacks:
+			c += f'callbacks: {", ".join(str(callback) for callback in self.callbacks)}\n'
+		c += f'threads: {self.executor.size}\n'
+		if self.checkpointPath is not None:
+			c += f'checkpoint: {self.checkpointPath}, epochs: {self.checkpointEvery}, seconds: {self.checkpointSeconds}\n'
 		if form == 'save':
 			s = ''
 			for sset in self.startSets:
@@ -233,34 +603,39 @@ class NodeGraph(metaclass=ABCMeta):
 		trStr = 'train result\n'
 		trStr += f'    last accuracy(average if minibatch): {self.trAccuracy[-1]}\n'
 		trStr += f'    last loss(average if minibatch): {self.trLosses[-1]}\n'
-		trY = self.predict(self.trX)
-		self.lossFunc.trT = self.trT
-		if categorical:
-			if self.trT.shape[1] == 1:
-				trStr += cat1DY(trY, self.trT)
-			else:
-				trStr += catNDY(trY, self.trT)
+		if isinstance(self.trX, Dataset):
+			# training data are not in memory
+			trStr += f'    data: {self.trX}'
 		else:
-			trStr += fitting(trY, self.trT, self.lossFunc.lossVec(self.trT, trY) - self.lossFunc.baseVec(self.trT))
+			trY = self.predict(self.trX)
+			self.lossFunc.trT = self.trT
+			if categorical:
+				if self.trT.shape[1] == 1:
+					trStr += cat1DY(trY, self.trT)
+				else:
+					trStr += catNDY(trY, self.trT)
+			else:
+				trStr += fitting(trY, self.trT, self.lossFunc.lossVec(self.trT, trY) - self.lossFunc.baseVec(self.trT))
 		if self.teT is None:
 			teStr = ''
 		else:
 			teStr = '\ntest result\n'
 			trStr += f'    last accuracy: {self.teAccuracy[-1]}\n'
 			teStr += f'    last loss: {self.teLosses[-1]}\n'
+			teY = self.predict(self.teX)
 			if categorical:
-				if self.trT.shape[1] == 1:
-					teStr += cat1DY(self.lossFunc.teY, self.teT)
+				if self.teT.shape[1] == 1:
+					teStr += cat1DY(teY, self.teT)
 				else:
-					teStr += catNDY(self.lossFunc.teY, self.teT)
+					teStr += catNDY(teY, self.teT)
 			else:
-				teStr += fitting(self.lossFunc.teY, self.teT, self.lossFunc.lossVec(self.teT, self.lossFunc.teY) - self.lossFunc.baseVec(self.teT))
+				teStr += fitting(teY, self.teT, self.lossFunc.lossVec(self.teT, teY) - self.lossFunc.baseVec(self.teT))
 		return epochStr + trStr + teStr
 
 
 class NodeGraphAdaptive(NodeGraph):
-	def __init__(self):
-		super().__init__()
+	def __init__(self, precision: str = 'float64'):
+		super().__init__(precision)
 
 		self._lr: Union[float, None] = None  # learning rate
 		self.lrInit: Union[float, None] = None
@@ -270,81 +645,160 @@ class NodeGraphAdaptive(NodeGraph):
 		self.lrDown = .9
 		self.appLrs: Union[np.ndarray, None] = None  # applied learning rates
 
-	def __update(self):
-		for fset in self.fitSets:
-			fset.sendCurrToPrev()
+		# search of learning rate in each epoch
+		#	'armijo': backtracking by forward propagation only until the loss decreases sufficiently, at most lrTries times
+		#	'dot': forward and backward propagation until the new gradient is not against the previous one or lr <= lrMin,
+		#		the search of earlier versions, whose cost is unbounded
+		self.lrSearch: str = 'armijo'
+		# sufficient decrease of the loss is armijoC * lr * |gradient|^2
+		self.armijoC: float = 1.0E-4
+		# the maximum number of learning rates tried by 'armijo' in an epoch
+		self.lrTries: int = 20
+		# the number of forward and backward propagations over training data in each epoch
+		self.fwdCounts: Union[np.ndarray, None] = None
+		self.bwdCounts: Union[np.ndarray, None] = None
+		# training loss with the regularizer at the current parameters
+		self.__loss: float = np.inf
+
+	def __update(self) -> Tuple[int, int]:
+		"""
+		:return: the number of forward and backward propagations
+		"""
+		self.flat.sendCurrToPrev()
 		self._lr *= self.lrUp
 		if self._lr > self.lrMax:
 			self._lr = self.lrMax
+		if self.lrSearch == 'armijo':
+			return self.__armijo()
+		elif self.lrSearch == 'dot':
+			return self.__dotSearch()
+		else:
+			raise Exception(f'unknown learning rate search: {self.lrSearch}')
+
+	def __dotSearch(self) -> Tuple[int, int]:
+		tries = 0
 		while True:
-			for fset in self.fitSets:
-				fset.updateAdaptive(self._lr)
+			self.flat.updateAdaptive(self._lr)
 			self.pushTr(self.trX)
 			self.pullGrad()
-			dot = 0.0
-			for fset in self.fitSets:
-				dot += fset.gradDot()
-			if dot >= 0.0 or self._lr <= self.lrMin:
+			tries += 1
+			if self.flat.gradDot() >= 0.0 or self._lr <= self.lrMin:
 				break
 			self._lr *= self.lrDown
-		return dot
+		self.__loss = self.__objective()
+		return tries, tries
+
+	def __objective(self) -> float:
+		"""training loss with the regularizer, which is descended along the gradients"""
+		return self.lossFunc.trLoss() + self.flat.regLoss(self.reg)
+
+	def __armijo(self) -> Tuple[int, int]:
+		"""backtracking with quadratic interpolation of the loss with the regularizer along the previous gradient
+			the gradient is propagated once at the accepted learning rate"""
+		grad = self.flat.vectors['gradPrev']
+		slope = self.flat.dot(grad, grad)
+		loss0 = self.__loss
+		tries = 0
+		while True:
+			self.flat.updateAdaptive(self._lr)
+			self.pushTr(self.trX)
+			loss = self.__objective()
+			tries += 1
+			if loss <= loss0 - self.armijoC * self._lr * slope or self._lr <= self.lrMin or tries >= self.lrTries:
+				break
+			# minimum of the quadratic through loss0, -slope and loss, kept within [0.1 * lr, lrDown * lr]
+			#	it is below lr / 2 if the loss increased, and the rate is cut to 0.1 * lr if the loss overflowed
+			curv = loss - loss0 + self._lr * slope
+			if not np.isfinite(loss):
+				lr = 0.0
+			elif curv > 0.0:
+				lr = self._lr * self._lr * slope / (2 * curv)
+			else:
+				lr = self._lr * self.lrDown
+			self._lr = max(min(lr, self._lr * self.lrDown), self._lr * 0.1, self.lrMin)
+		self.pullGrad()
+		self.__loss = loss
+		return tries, 1
 
 	def __fitTrain(self, verbose: int):
 		# applied learning rates
 		appLrs = np.empty(self.epochMax + 1)
+		fwdCounts = np.empty(self.epochMax + 1, int)
+		bwdCounts = np.empty(self.epochMax + 1, int)
 		trAccuracy = np.empty(self.epochMax + 1)
 		trLosses = np.empty(self.epochMax + 1)
 
 		trLossBase = self.lossFunc.base(self.trT)
 		trSiz = self.trX.shape[0] if isinstance(self.trX, np.ndarray) else self.trX[0].shape[0]
 		self.prePropTr(trSiz)
+		if verbose > 0:
+			print(self.memoryInfo())
 
-		epoch = 0
+		epoch = self.startEpoch(appLrs=appLrs, fwdCounts=fwdCounts, bwdCounts=bwdCounts, trAccuracy=trAccuracy, trLosses=trLosses)
 		while True:
-			self.__update()  # executes pushTr()
+			fwdCounts[epoch], bwdCounts[epoch] = self.__update()  # executes pushTr()
 			appLrs[epoch] = self._lr
 			trAccuracy[epoch] = self.lossFunc.trAccuracy()
 			trLosses[epoch] = (self.lossFunc.trLoss() - trLossBase) / trSiz
 			if verbose > 0:
 				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}')
 				if verbose > 1:
-					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}')
-			if trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}, passes: {fwdCounts[epoch]}/{bwdCounts[epoch]}')
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
 				break
+			self.checkpoint(epoch)
 			epoch += 1
 		self.appLrs = appLrs[:epoch + 1]
+		self.fwdCounts = fwdCounts[:epoch + 1]
+		self.bwdCounts = bwdCounts[:epoch + 1]
 		self.trAccuracy = trAccuracy[:epoch + 1]
 		self.trLosses = trLosses[:epoch + 1]
 
 	def __fitWithTest(self, verbose: int):
 		# applied learning rates
 		appLrs = np.empty(self.epochMax + 1)
+		fwdCounts = np.empty(self.epochMax + 1, int)
+		bwdCounts = np.empty(self.epochMax + 1, int)
 		trAccuracy = np.empty(self.epochMax + 1)
 		teAccuracy = np.empty(self.epochMax + 1)
 		trLosses = np.empty(self.epochMax + 1)
 		teLosses = np.empty(self.epochMax + 1)
 
-		trLossBase, teLossBase = self.lossFunc.base(self.trT), self.lossFunc.base(self.teT)
-		trSiz, teSiz = (self.trX.shape[0], self.teX.shape[0]) if isinstance(self.trX, np.ndarray) else (self.trX[0].shape[0], self.teX[0].shape[0])
-		self.prePropBoth(trSiz, teSiz)
+		teX, teT = self.testSample()
+		trLossBase, teLossBase = self.lossFunc.base(self.trT), self.lossFunc.base(teT)
+		trSiz, teSiz = (self.trX.shape[0], teT.shape[0]) if isinstance(self.trX, np.ndarray) else (self.trX[0].shape[0], teT.shape[0])
+		self.prePropTr(trSiz)
+		self.prePropTe(self.evalSize(teSiz))
+		if verbose > 0:
+			print(self.memoryInfo())
 
-		epoch = 0
+		epoch = self.startEpoch(appLrs=appLrs, fwdCounts=fwdCounts, bwdCounts=bwdCounts, trAccuracy=trAccuracy, teAccuracy=teAccuracy,
+								 trLosses=trLosses, teLosses=teLosses)
 		while True:
-			self.__update()  # executes pushTrain()
+			fwdCounts[epoch], bwdCounts[epoch] = self.__update()  # executes pushTrain()
 			appLrs[epoch] = self._lr
 			trAccuracy[epoch] = self.lossFunc.trAccuracy()
 			trLosses[epoch] = (self.lossFunc.trLoss() - trLossBase) / trSiz
-			self.pushTe(self.teX)
-			teAccuracy[epoch] = self.lossFunc.teAccuracy()
-			teLosses[epoch] = (self.lossFunc.teLoss() - teLossBase) / teSiz
+			if self.evalDue(epoch, trLosses[epoch]):
+				teCount, teLoss = self.evaluate(teX, teT)
+				teAccuracy[epoch] = teCount / teSiz
+				teLosses[epoch] = (teLoss - teLossBase) / teSiz
+			else:
+				teAccuracy[epoch] = teLosses[epoch] = np.nan
 			if verbose > 0:
 				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}, test accuracy: {teAccuracy[epoch]}')
 				if verbose > 1:
-					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}, test loss: {teLosses[epoch]}')
-			if trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}, test loss: {teLosses[epoch]}, '
+						  f'passes: {fwdCounts[epoch]}/{bwdCounts[epoch]}')
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch], teLoss=teLosses[epoch], teAccuracy=teAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
 				break
+			self.checkpoint(epoch)
 			epoch += 1
 		self.appLrs = appLrs[:epoch + 1]
+		self.fwdCounts = fwdCounts[:epoch + 1]
+		self.bwdCounts = bwdCounts[:epoch + 1]
 		self.trAccuracy = trAccuracy[:epoch + 1]
 		self.teAccuracy = teAccuracy[:epoch + 1]
 		self.trLosses = trLosses[:epoch + 1]
@@ -353,23 +807,34 @@ class NodeGraphAdaptive(NodeGraph):
 	def fit(self, trX: Union[np.ndarray, Tuple, List], trT: np.ndarray,
 			teX: Union[np.ndarray, Tuple, List] = None, teT: np.ndarray = None,
 			verbose: int = 0, **kwargs):
+		if isinstance(trX, Dataset):
+			raise Exception(f'{self.__class__.__name__} propagates all training data at once, and can not fit a Dataset')
 		super().fit(trX, trT, teX, teT, **kwargs)
 
 		if self.lrInit is None:
 			self._lr = self.lrMax
 		else:
 			self._lr = self.lrInit
-		for fset in self.fitSets:
-			fset.preFit(regularizer=self.reg, momentum=None)
+		self.preFit()
+		self.__loss = np.inf
 
-		self.lossFunc.trT = trT
-		self.lossFunc.teT = teT
+		self.lossFunc.trT = self.trT
+		self.lossFunc.teT = self.teT
 		if teT is None:
 			# train only
 			self.__fitTrain(verbose)
 		else:
 			# train and test
 			self.__fitWithTest(verbose)
+		self.postFit()
+
+	def trainState(self) -> Dict[str, np.ndarray]:
+		return {**super().trainState(), 'lr': np.array(self._lr), 'loss': np.array(self.__loss)}
+
+	def setTrainState(self, state: Dict[str, np.ndarray]):
+		super().setTrainState(state)
+		self._lr = float(state['lr'])
+		self.__loss = float(state['loss'])
 
 	def graphInfo(self, form: str = 'short') -> str:
 		c = f'{self.__class__.__name__}\n'
@@ -377,12 +842,13 @@ class NodeGraphAdaptive(NodeGraph):
 		c += f'learning rate: {getFloatStr(self._lr)}\n'
 		c += f'learning rate min, max: [{getFloatStr(self.lrMin)}, {getFloatStr(self.lrMax)}]\n'
 		c += f'learning rate up, down: [{getFloatStr(self.lrUp)}, {getFloatStr(self.lrDown)}]\n'
+		c += f'learning rate search: {self.lrSearch}, tries: {self.lrTries}\n'
 		return c + super().graphInfo(form)
 
 
 class NodeGraphAdaptiveMinibatch(NodeGraph):
-	def __init__(self):
-		super().__init__()
+	def __init__(self, precision: str = 'float64'):
+		super().__init__(precision)
 
 		self.batchSize: int = UNKNOWN
 
@@ -394,64 +860,105 @@ class NodeGraphAdaptiveMinibatch(NodeGraph):
 		self.lrDown = .9
 		self.appLrs: Union[np.ndarray, None] = None  # applied learning rates
 
-	def __update(self, currTrX):
-		for fset in self.fitSets:
-			fset.sendCurrToPrev()
+		# the number of batches gathered ahead by a background thread, batches are gathered in turn if 0
+		self.prefetch: int = 2
+		# augment(x, t) modifies a gathered batch in place, called by the prefetch thread
+		self.augment: Union[Callable, None] = None
+		# seconds waited for batches in each epoch
+		self.dataWaits: Union[np.ndarray, None] = None
+		# the number of processes sharing each batch, batches are split over forked replicas of the graph if > 1
+		self.nProcs: int = 1
+		self.__parallel: Union[DataParallel, None] = None
+		# the sum of losses and the number of accurate outputs of the last batch propagated in micro-batches
+		self.__microStats: Tuple[float, int] = (0.0, 0)
+
+	def __propagate(self, currTrX, currTrT):
+		if self.__parallel is not None:
+			self.__parallel.propagate(currTrX, currTrT)
+		elif self.microBatch is None:
+			self.pushTr(currTrX)
+			self.pullGrad()
+		else:
+			self.__microStats = self.propagateGrad(currTrX, currTrT)
+			self.adjustGrad()
+
+	def __stats(self) -> Tuple[float, int]:
+		"""the sum of losses and the number of accurate outputs of the last batch"""
+		if self.__parallel is not None:
+			return self.__parallel.trLoss(), self.__parallel.trAccurateCount()
+		elif self.microBatch is None:
+			return self.lossFunc.trLoss(), self.lossFunc.trAccurateCount()
+		else:
+			return self.__microStats
+
+	def __update(self, currTrX, currTrT):
+		self.flat.sendCurrToPrev()
 		self._lr *= self.lrUp
 		if self._lr > self.lrMax:
 			self._lr = self.lrMax
 		while True:
-			for fset in self.fitSets:
-				fset.updateAdaptive(self._lr)
-			self.pushTr(currTrX)
-			self.pullGrad()
-			dot = 0.0
-			for fset in self.fitSets:
-				dot += fset.gradDot()
+			self.flat.updateAdaptive(self._lr)
+			self.__propagate(currTrX, currTrT)
+			dot = self.flat.gradDot()
 			if dot >= 0.0 or self._lr <= self.lrMin:
 				break
 			self._lr *= self.lrDown
 		return dot
 
+	def __prePropTr(self):
+		"""buffers of training of micro-batches, shared with worker processes if nProcs > 1"""
+		if self.nProcs > 1:
+			self.__parallel = DataParallel(self, self.nProcs, self.batchSize, *self.trainArrays())
+		else:
+			self.prePropTr(self.microSize(self.batchSize))
+
 	def __fitTrain(self, verbose: int):
 		# applied learning rates
 		appLrs = np.zeros(self.epochMax + 1)
 		trAccuracy = np.zeros(self.epochMax + 1)
 		trLosses = np.zeros(self.epochMax + 1)
 
-		trLossBase = self.lossFunc.base(self.trT)
-		trSiz = self.trX.shape[0] if isinstance(self.trX, np.ndarray) else self.trX[0].shape[0]
-		batchCount = trSiz // self.batchSize
+		dataWaits = np.zeros(self.epochMax + 1)
+
+		trLossBase = self.trainLossBase()
+		batchCount = self.batchCount(self.batchSize)
 		# number of data joining each train step
 		trSizNet = batchCount * self.batchSize
-		self.prePropTr(self.batchSize)
+		self.__prePropTr()
+		if verbose > 0:
+			print(self.memoryInfo())
+		prefetcher = Prefetcher(*self.trainArrays(), self.batchSize, self.prefetch, self.augment, self.dtype)
 
-		epoch = 0
+		epoch = self.startEpoch(appLrs=appLrs, trAccuracy=trAccuracy, trLosses=trLosses, dataWaits=dataWaits)
 		while True:
-			perm = np.random.permutation(trSiz)
-			start = 0
 			trAccurateCount = 0
-			for _ in range(batchCount):
-				end = start + self.batchSize
-				self.lossFunc.trT = self.trT[perm[start:end]]
-				self.__update(self.trX[perm[start:end]])
+			prefetcher.waitTime = 0.0
+			for x, t in self.trainBatches(prefetcher):
+				self.lossFunc.trT = t
+				if self.__parallel is not None:
+					self.__parallel.load(x, t)
+				self.__update(x, t)
 				appLrs[epoch] += self._lr
-				trAccurateCount += self.lossFunc.trAccurateCount()
-				trLosses[epoch] += self.lossFunc.trLoss()
-				start = end
+				loss, count = self.__stats()
+				trAccurateCount += count
+				trLosses[epoch] += loss
 			appLrs[epoch] /= batchCount
 			trAccuracy[epoch] = trAccurateCount / trSizNet
 			trLosses[epoch] = (trLosses[epoch] - trLossBase) / trSizNet
+			dataWaits[epoch] = prefetcher.waitTime
 			if verbose > 0:
 				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}')
 				if verbose > 1:
-					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}')
-			if trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}, data wait: {dataWaits[epoch]:.3f}s')
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
 				break
+			self.checkpoint(epoch)
 			epoch += 1
 		self.appLrs = appLrs[:epoch + 1]
 		self.trAccuracy = trAccuracy[:epoch + 1]
 		self.trLosses = trLosses[:epoch + 1]
+		self.dataWaits = dataWaits[:epoch + 1]
 
 	def __fitWithTest(self, verbose: int):
 		# applied learning rates
@@ -460,47 +967,62 @@ class NodeGraphAdaptiveMinibatch(NodeGraph):
 		teAccuracy = np.zeros(self.epochMax + 1)
 		trLosses = np.zeros(self.epochMax + 1)
 		teLosses = np.zeros(self.epochMax + 1)
+		dataWaits = np.zeros(self.epochMax + 1)
 
-		trLossBase, teLossBase = self.lossFunc.base(self.trT), self.lossFunc.base(self.teT)
-		trSiz, teSiz = (self.trX.shape[0], self.teX.shape[0]) if isinstance(self.trX, np.ndarray) else (self.trX[0].shape[0], self.teX[0].shape[0])
-		batchCount = trSiz // self.batchSize
+		teX, teT = self.testSample()
+		trLossBase, teLossBase = self.trainLossBase(), self.lossFunc.base(teT)
+		teSiz = teT.shape[0]
+		batchCount = self.batchCount(self.batchSize)
 		# number of data joining each train step
 		trSizNet = batchCount * self.batchSize
-		self.prePropBoth(self.batchSize, teSiz)
-
-		epoch = 0
+		self.__prePropTr()
+		self.prePropTe(self.evalSize(teSiz))
+		if verbose > 0:
+			print(self.memoryInfo())
+		prefetcher = Prefetcher(*self.trainArrays(), self.batchSize, self.prefetch, self.augment, self.dtype)
+
+		epoch = self.startEpoch(appLrs=appLrs, trAccuracy=trAccuracy, teAccuracy=teAccuracy, trLosses=trLosses, teLosses=teLosses,
+								 dataWaits=dataWaits)
 		while True:
-			perm = np.random.permutation(trSiz)
-			start = 0
 			trAccurateCount = 0
-			for i in range(batchCount):
-				end = start + self.batchSize
-				self.lossFunc.trT = self.trT[perm[start:end]]
-				self.__update(self.trX[perm[start:end]])
+			prefetcher.waitTime = 0.0
+			for x, t in self.trainBatches(prefetcher):
+				self.lossFunc.trT = t
+				if self.__parallel is not None:
+					self.__parallel.load(x, t)
+				self.__update(x, t)
 				appLrs[epoch] += self._lr
-				trAccurateCount += self.lossFunc.trAccurateCount()
-				trLosses[epoch] += self.lossFunc.trLoss()
-				start = end
+				loss, count = self.__stats()
+				trAccurateCount += count
+				trLosses[epoch] += loss
 			appLrs[epoch] /= batchCount
 			trAccuracy[epoch] = trAccurateCount / trSizNet
 			trLosses[epoch] = (trLosses[epoch] - trLossBase) / trSizNet
-			self.pushTe(self.teX)
-			teAccuracy[epoch] = self.lossFunc.teAccuracy()
-			teLosses[epoch] = (self.lossFunc.teLoss() - teLossBase) / teSiz
+			dataWaits[epoch] = prefetcher.waitTime
+			if self.evalDue(epoch, trLosses[epoch]):
+				teCount, teLoss = self.evaluate(teX, teT)
+				teAccuracy[epoch] = teCount / teSiz
+				teLosses[epoch] = (teLoss - teLossBase) / teSiz
+			else:
+				teAccuracy[epoch] = teLosses[epoch] = np.nan
 			if verbose > 0:
 				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}, test accuracy: {teAccuracy[epoch]}')
 				if verbose > 1:
-					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}, test loss: {teLosses[epoch]}')
-			if trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+					print(f'\t\t\tlearning rate: {appLrs[epoch]}, train loss: {trLosses[epoch]}, test loss: {teLosses[epoch]}, '
+						  f'data wait: {dataWaits[epoch]:.3f}s')
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch], teLoss=teLosses[epoch], teAccuracy=teAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
 				break
+			self.checkpoint(epoch)
 			epoch += 1
 		self.appLrs = appLrs[:epoch + 1]
 		self.trAccuracy = trAccuracy[:epoch + 1]
 		self.teAccuracy = teAccuracy[:epoch + 1]
 		self.trLosses = trLosses[:epoch + 1]
 		self.teLosses = teLosses[:epoch + 1]
+		self.dataWaits = dataWaits[:epoch + 1]
 
-	def fit(self, trX: Union[np.ndarray, Tuple, List], trT: np.ndarray,
+	def fit(self, trX: Union[np.ndarray, Tuple, List, Dataset], trT: Union[np.ndarray, None],
 			teX: Union[np.ndarray, Tuple, List] = None, teT: np.ndarray = None,
 			batchSize: int = None, verbose: int = 0, **kwargs):
 		super().fit(trX, trT, teX, teT, **kwargs)
@@ -509,21 +1031,33 @@ class NodeGraphAdaptiveMinibatch(NodeGraph):
 			self._lr = self.lrMax
 		else:
 			self._lr = self.lrInit
-		for fset in self.fitSets:
-			fset.preFit(regularizer=self.reg, momentum=None)
+		self.preFit()
 
 		if batchSize is not None:
 			self.batchSize = batchSize
 		elif self.batchSize == UNKNOWN:
-			self.batchSize = trT.shape[0]
+			self.batchSize = int(trX.sizes.min()) if isinstance(trX, Dataset) else trT.shape[0]
 
 		self.lossFunc.teT = self.teT
-		if teT is None:
-			# train only
-			self.__fitTrain(verbose)
-		else:
-			# train and test
-			self.__fitWithTest(verbose)
+		try:
+			if teT is None:
+				# train only
+				self.__fitTrain(verbose)
+			else:
+				# train and test
+				self.__fitWithTest(verbose)
+		finally:
+			if self.__parallel is not None:
+				self.__parallel.close()
+				self.__parallel = None
+		self.postFit()
+
+	def trainState(self) -> Dict[str, np.ndarray]:
+		return {**super().trainState(), 'lr': np.array(self._lr)}
+
+	def setTrainState(self, state: Dict[str, np.ndarray]):
+		super().setTrainState(state)
+		self._lr = float(state['lr'])
 
 	def graphInfo(self, form: str = 'short') -> str:
 		c = f'{self.__class__.__name__}\n'
@@ -531,29 +1065,48 @@ class NodeGraphAdaptiveMinibatch(NodeGraph):
 		c += f'learning rate: {getFloatStr(self._lr)}\n'
 		c += f'learning rate min, max: [{getFloatStr(self.lrMin)}, {getFloatStr(self.lrMax)}]\n'
 		c += f'learning rate up, down: [{getFloatStr(self.lrUp)}, {getFloatStr(self.lrDown)}]\n'
+		c += f'processes: {self.nProcs}\n'
+		c += f'micro-batch: {self.microBatch}\n'
 		return c + super().graphInfo(form)
 
 
 class NodeGraphBatch(NodeGraph):
-	def __init__(self):
-		super().__init__()
+	def __init__(self, precision: str = 'float64'):
+		super().__init__(precision)
 		self.lr: float = 0.01  # learning rate
 		self.mom: float = 0.0  # momentum
+		# optimizer updating parameters, SGD(lr, mom) if None
+		self.optimizer: Union[Optimizer, None] = None
+		self._optimizer: Union[Optimizer, None] = None
+		# schedule of the learning rate of the optimizer if not None
+		self.schedule: Union[Schedule, None] = None
+		self.appLrs: Union[np.ndarray, None] = None  # applied learning rates
+		self.__lrBase: float = 0.0
+
+	def __applyLr(self, step: int, steps: int) -> float:
+		"""set the learning rate of the optimizer by the schedule
+		:return: the learning rate
+		"""
+		if self.schedule is not None:
+			self._optimizer.lr = self.__lrBase * self.schedule.factor(step, steps)
+		return self._optimizer.lr
 
 	def __update(self):
 		self.pullGrad()
-		for fset in self.fitSets:
-			fset.updateBatch(self.lr)
+		self._optimizer.step(*self.params())
 
 	def __fitTrain(self, verbose: int):
+		appLrs = np.empty(self.epochMax + 1)
 		trAccuracy = np.empty(self.epochMax + 1)
 		trLosses = np.empty(self.epochMax + 1)
 
 		trLossBase = self.lossFunc.base(self.trT)
 		trSiz = self.trX.shape[0] if isinstance(self.trX, np.ndarray) else self.trX[0].shape[0]
 		self.prePropTr(trSiz)
+		if verbose > 0:
+			print(self.memoryInfo())
 
-		epoch = 0
+		epoch = self.startEpoch(appLrs=appLrs, trAccuracy=trAccuracy, trLosses=trLosses)
 		while True:
 			self.pushTr(self.trX)
 			trAccuracy[epoch] = self.lossFunc.trAccuracy()
@@ -562,38 +1115,57 @@ class NodeGraphBatch(NodeGraph):
 				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}')
 				if verbose > 1:
 					print(f'\t\t\ttrain loss: {trLosses[epoch]}')
-			if trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+			# parameters are updated after each epoch but the last one
+			appLrs[epoch] = self.__applyLr(min(epoch, self.epochMax - 1), self.epochMax)
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
 				break
 			self.__update()
+			self.checkpoint(epoch)
 			epoch += 1
+		self.appLrs = appLrs[:epoch + 1]
 		self.trAccuracy = trAccuracy[:epoch + 1]
 		self.trLosses = trLosses[:epoch + 1]
 
 	def __fitWithTest(self, verbose: int):
+		appLrs = np.empty(self.epochMax + 1)
 		trAccuracy = np.empty(self.epochMax + 1)
 		teAccuracy = np.empty(self.epochMax + 1)
 		trLosses = np.empty(self.epochMax + 1)
 		teLosses = np.empty(self.epochMax + 1)  # test
 
-		trLossBase, teLossBase = self.lossFunc.base(self.trT), self.lossFunc.base(self.teT)
-		trSiz, teSiz = (self.trX.shape[0], self.teX.shape[0]) if isinstance(self.trX, np.ndarray) else (self.trX[0].shape[0], self.teX[0].shape[0])
-		self.prePropBoth(trSiz, teSiz)
+		teX, teT = self.testSample()
+		trLossBase, teLossBase = self.lossFunc.base(self.trT), self.lossFunc.base(teT)
+		trSiz, teSiz = (self.trX.shape[0], teT.shape[0]) if isinstance(self.trX, np.ndarray) else (self.trX[0].shape[0], teT.shape[0])
+		self.prePropTr(trSiz)
+		self.prePropTe(self.evalSize(teSiz))
+		if verbose > 0:
+			print(self.memoryInfo())
 
-		epoch = 0
+		epoch = self.startEpoch(appLrs=appLrs, trAccuracy=trAccuracy, teAccuracy=teAccuracy, trLosses=trLosses, teLosses=teLosses)
 		while True:
-			self.pushBoth(self.trX, self.teX)
+			self.pushTr(self.trX)
 			trAccuracy[epoch] = self.lossFunc.trAccuracy()
-			teAccuracy[epoch] = self.lossFunc.teAccuracy()
 			trLosses[epoch] = (self.lossFunc.trLoss() - trLossBase) / trSiz
-			teLosses[epoch] = (self.lossFunc.teLoss() - teLossBase) / teSiz
+			if self.evalDue(epoch, trLosses[epoch]):
+				teCount, teLoss = self.evaluate(teX, teT)
+				teAccuracy[epoch] = teCount / teSiz
+				teLosses[epoch] = (teLoss - teLossBase) / teSiz
+			else:
+				teAccuracy[epoch] = teLosses[epoch] = np.nan
 			if verbose > 0:
 				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}, test accuracy: {teAccuracy[epoch]}')
 				if verbose > 1:
 					print(f'\t\t\ttrain loss: {trLosses[epoch]}, test loss: {teLosses[epoch]}')
-			if trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+			# parameters are updated after each epoch but the last one
+			appLrs[epoch] = self.__applyLr(min(epoch, self.epochMax - 1), self.epochMax)
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch], teLoss=teLosses[epoch], teAccuracy=teAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
 				break
 			self.__update()
+			self.checkpoint(epoch)
 			epoch += 1
+		self.appLrs = appLrs[:epoch + 1]
 		self.trAccuracy = trAccuracy[:epoch + 1]
 		self.teAccuracy = teAccuracy[:epoch + 1]
 		self.trLosses = trLosses[:epoch + 1]
@@ -602,10 +1174,14 @@ class NodeGraphBatch(NodeGraph):
 	def fit(self, trX: Union[np.ndarray, Tuple, List], trT: np.ndarray,
 			teX: Union[np.ndarray, Tuple, List] = None, teT: np.ndarray = None,
 			verbose: int = 0, **kwargs):
+		if isinstance(trX, Dataset):
+			raise Exception(f'{self.__class__.__name__} propagates all training data at once, and can not fit a Dataset')
 		super().fit(trX, trT, teX, teT, **kwargs)
 
-		for fset in self.fitSets:
-			fset.preFit(regularizer=self.reg, momentum=self.mom)
+		self.preFit()
+		self._optimizer = SGD(self.lr, self.mom) if self.optimizer is None else self.optimizer
+		self._optimizer.reset()
+		self.__lrBase = self._optimizer.lr
 
 		self.lossFunc.trT = self.trT
 		self.lossFunc.teT = self.teT
@@ -615,9 +1191,213 @@ class NodeGraphBatch(NodeGraph):
 		else:
 			# train and test
 			self.__fitWithTest(verbose)
+		self._optimizer.lr = self.__lrBase
+		self.postFit()
+
+	def trainState(self) -> Dict[str, np.ndarray]:
+		state = super().trainState()
+		for key, arr in self._optimizer.getState().items():
+			state[f'optimizer.{key}'] = arr
+		return state
+
+	def setTrainState(self, state: Dict[str, np.ndarray]):
+		super().setTrainState(state)
+		self._optimizer.setState({key[len('optimizer.'):]: arr for key, arr in state.items() if key.startswith('optimizer.')})
+
+	def graphInfo(self, form: str = 'short') -> str:
+		c = f'{self.__class__.__name__}\n'
+		if self.optimizer is None:
+			c += f'learning rate: {getFloatStr(self.lr)}\n'
+			c += f'momentum: {getFloatStr(self.mom)}\n'
+		else:
+			c += f'optimizer: {self.optimizer}\n'
+		if self.schedule is not None:
+			c += f'schedule: {self.schedule}\n'
+		return c + super().graphInfo(form)
+
+
+class NodeGraphMinibatch(NodeGraph):
+	def __init__(self, precision: str = 'float64'):
+		super().__init__(precision)
+
+		self.batchSize: int = UNKNOWN
+		self.lr: float = 0.01  # learning rate
+		self.mom: float = 0.0  # momentum
+		# optimizer updating parameters, SGD(lr, mom) if None
+		self.optimizer: Union[Optimizer, None] = None
+		self._optimizer: Union[Optimizer, None] = None
+		# schedule of the learning rate of the optimizer if not None
+		self.schedule: Union[Schedule, None] = None
+		self.appLrs: Union[np.ndarray, None] = None  # applied learning rates
+		self.__lrBase: float = 0.0
+
+		# the number of batches gathered ahead by a background thread, batches are gathered in turn if 0
+		self.prefetch: int = 2
+		# augment(x, t) modifies a gathered batch in place, called by the prefetch thread
+		self.augment: Union[Callable, None] = None
+		# seconds waited for batches in each epoch
+		self.dataWaits: Union[np.ndarray, None] = None
+
+	def __applyLr(self, epoch: int, batch: int, batchCount: int) -> float:
+		"""set the learning rate of the optimizer by the schedule
+		:return: the learning rate
+		"""
+		if self.schedule is not None:
+			if self.schedule.perEpoch:
+				factor = self.schedule.factor(epoch, self.epochMax + 1)
+			else:
+				factor = self.schedule.factor(epoch * batchCount + batch, (self.epochMax + 1) * batchCount)
+			self._optimizer.lr = self.__lrBase * factor
+		return self._optimizer.lr
+
+	def __update(self, currTrX):
+		self.pushTr(currTrX)
+		self.pullGrad()
+		self._optimizer.step(*self.params())
+
+	def __fitTrain(self, verbose: int):
+		appLrs = np.zeros(self.epochMax + 1)
+		trAccuracy = np.zeros(self.epochMax + 1)
+		trLosses = np.zeros(self.epochMax + 1)
+		dataWaits = np.zeros(self.epochMax + 1)
+
+		trLossBase = self.trainLossBase()
+		# number of data joining each train step
+		batchCount = self.batchCount(self.batchSize)
+		trSizNet = batchCount * self.batchSize
+		self.prePropTr(self.batchSize)
+		if verbose > 0:
+			print(self.memoryInfo())
+		prefetcher = Prefetcher(*self.trainArrays(), self.batchSize, self.prefetch, self.augment, self.dtype)
+
+		epoch = self.startEpoch(appLrs=appLrs, trAccuracy=trAccuracy, trLosses=trLosses, dataWaits=dataWaits)
+		while True:
+			trAccurateCount = 0
+			prefetcher.waitTime = 0.0
+			for batch, (x, t) in enumerate(self.trainBatches(prefetcher)):
+				self.lossFunc.trT = t
+				appLrs[epoch] += self.__applyLr(epoch, batch, batchCount)
+				self.__update(x)
+				trAccurateCount += self.lossFunc.trAccurateCount()
+				trLosses[epoch] += self.lossFunc.trLoss()
+			appLrs[epoch] /= batchCount
+			trAccuracy[epoch] = trAccurateCount / trSizNet
+			trLosses[epoch] = (trLosses[epoch] - trLossBase) / trSizNet
+			dataWaits[epoch] = prefetcher.waitTime
+			if verbose > 0:
+				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}')
+				if verbose > 1:
+					print(f'\t\t\ttrain loss: {trLosses[epoch]}, data wait: {dataWaits[epoch]:.3f}s')
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+				break
+			self.checkpoint(epoch)
+			epoch += 1
+		self.appLrs = appLrs[:epoch + 1]
+		self.trAccuracy = trAccuracy[:epoch + 1]
+		self.trLosses = trLosses[:epoch + 1]
+		self.dataWaits = dataWaits[:epoch + 1]
+
+	def __fitWithTest(self, verbose: int):
+		appLrs = np.zeros(self.epochMax + 1)
+		trAccuracy = np.zeros(self.epochMax + 1)
+		teAccuracy = np.zeros(self.epochMax + 1)
+		trLosses = np.zeros(self.epochMax + 1)
+		teLosses = np.zeros(self.epochMax + 1)
+		dataWaits = np.zeros(self.epochMax + 1)
+
+		teX, teT = self.testSample()
+		trLossBase, teLossBase = self.trainLossBase(), self.lossFunc.base(teT)
+		teSiz = teT.shape[0]
+		# number of data joining each train step
+		batchCount = self.batchCount(self.batchSize)
+		trSizNet = batchCount * self.batchSize
+		self.prePropTr(self.batchSize)
+		self.prePropTe(self.evalSize(teSiz))
+		if verbose > 0:
+			print(self.memoryInfo())
+		prefetcher = Prefetcher(*self.trainArrays(), self.batchSize, self.prefetch, self.augment, self.dtype)
+
+		epoch = self.startEpoch(appLrs=appLrs, trAccuracy=trAccuracy, teAccuracy=teAccuracy, trLosses=trLosses, teLosses=teLosses,
+								 dataWaits=dataWaits)
+		while True:
+			trAccurateCount = 0
+			prefetcher.waitTime = 0.0
+			for batch, (x, t) in enumerate(self.trainBatches(prefetcher)):
+				self.lossFunc.trT = t
+				appLrs[epoch] += self.__applyLr(epoch, batch, batchCount)
+				self.__update(x)
+				trAccurateCount += self.lossFunc.trAccurateCount()
+				trLosses[epoch] += self.lossFunc.trLoss()
+			appLrs[epoch] /= batchCount
+			trAccuracy[epoch] = trAccurateCount / trSizNet
+			trLosses[epoch] = (trLosses[epoch] - trLossBase) / trSizNet
+			dataWaits[epoch] = prefetcher.waitTime
+			if self.evalDue(epoch, trLosses[epoch]):
+				teCount, teLoss = self.evaluate(teX, teT)
+				teAccuracy[epoch] = teCount / teSiz
+				teLosses[epoch] = (teLoss - teLossBase) / teSiz
+			else:
+				teAccuracy[epoch] = teLosses[epoch] = np.nan
+			if verbose > 0:
+				print(f'epoch: {epoch}/{self.epochMax}, train accuracy: {trAccuracy[epoch]}, test accuracy: {teAccuracy[epoch]}')
+				if verbose > 1:
+					print(f'\t\t\ttrain loss: {trLosses[epoch]}, test loss: {teLosses[epoch]}, data wait: {dataWaits[epoch]:.3f}s')
+			if self.epochEnd(epoch, trLoss=trLosses[epoch], trAccuracy=trAccuracy[epoch], teLoss=teLosses[epoch], teAccuracy=teAccuracy[epoch]) \
+					or trLosses[epoch] < self.lossMax or epoch == self.epochMax:
+				break
+			self.checkpoint(epoch)
+			epoch += 1
+		self.appLrs = appLrs[:epoch + 1]
+		self.trAccuracy = trAccuracy[:epoch + 1]
+		self.teAccuracy = teAccuracy[:epoch + 1]
+		self.trLosses = trLosses[:epoch + 1]
+		self.teLosses = teLosses[:epoch + 1]
+		self.dataWaits = dataWaits[:epoch + 1]
+
+	def fit(self, trX: Union[np.ndarray, Tuple, List, Dataset], trT: Union[np.ndarray, None],
+			teX: Union[np.ndarray, Tuple, List] = None, teT: np.ndarray = None,
+			batchSize: int = None, verbose: int = 0, **kwargs):
+		super().fit(trX, trT, teX, teT, **kwargs)
+
+		self.preFit()
+		self._optimizer = SGD(self.lr, self.mom) if self.optimizer is None else self.optimizer
+		self._optimizer.reset()
+		self.__lrBase = self._optimizer.lr
+
+		if batchSize is not None:
+			self.batchSize = batchSize
+		elif self.batchSize == UNKNOWN:
+			self.batchSize = int(trX.sizes.min()) if isinstance(trX, Dataset) else trT.shape[0]
+
+		self.lossFunc.teT = self.teT
+		if teT is None:
+			# train only
+			self.__fitTrain(verbose)
+		else:
+			# train and test
+			self.__fitWithTest(verbose)
+		self._optimizer.lr = self.__lrBase
+		self.postFit()
+
+	def trainState(self) -> Dict[str, np.ndarray]:
+		state = super().trainState()
+		for key, arr in self._optimizer.getState().items():
+			state[f'optimizer.{key}'] = arr
+		return state
+
+	def setTrainState(self, state: Dict[str, np.ndarray]):
+		super().setTrainState(state)
+		self._optimizer.setState({key[len('optimizer.'):]: arr for key, arr in state.items() if key.startswith('optimizer.')})
 
 	def graphInfo(self, form: str = 'short') -> str:
 		c = f'{self.__class__.__name__}\n'
-		c += f'learning rate: {getFloatStr(self.lr)}\n'
-		c += f'momentum: {getFloatStr(self.mom)}\n'
+		c += f'batch size: {self.batchSize}\n'
+		if self.optimizer is None:
+			c += f'learning rate: {getFloatStr(self.lr)}\n'
+			c += f'momentum: {getFloatStr(self.mom)}\n'
+		else:
+			c += f'optimizer: {self.optimizer}\n'
+		if self.schedule is not None:
+			c += f'schedule: {self.schedule}\n'
 		return c + super().graphInfo(form)
@@ -43,6 +43,8 @@ class NodeSet(metaclass=ABCMeta):
 
 	def __init__(self, name: str = None):
 		self.name: str = NodeSet.__naming(name, self)
+		# type of buffers, set by NodeGraph.compile()
+		self.dtype: type = float
 		# id is a unique number for each NodeSet object
 		self.__id: int = NodeSet.__nextId
 		NodeSet.__nextId += 1
@@ -0,0 +1,172 @@
+from abc import ABCMeta, abstractmethod
+from typing import Dict, List, Union
+
+import numpy as np
+
+from .Util import getFloatStr
+
+
+class Optimizer(metaclass=ABCMeta):
+	"""update rule of parameters
+		step(params, grads) updates each array of params in place by the array of grads of the same index
+		state of the parameters is kept by index, and is cleared by reset()"""
+
+	def __init__(self, lr: float):
+		"""
+		:param lr: learning rate
+		"""
+		self.lr: float = lr
+
+	def reset(self):
+		"""clear state of parameters, called before fitting"""
+		pass
+
+	@abstractmethod
+	def step(self, params: List[np.ndarray], grads: List[np.ndarray]):
+		pass
+
+	def getState(self) -> Dict[str, np.ndarray]:
+		"""state of parameters as named arrays, restored by setState()"""
+		return {}
+
+	def setState(self, state: Dict[str, np.ndarray]):
+		pass
+
+	@staticmethod
+	def state(state: Union[List[np.ndarray], None], params: List[np.ndarray]) -> List[np.ndarray]:
+		"""state of zeros like params if state is None"""
+		return [np.zeros_like(p) for p in params] if state is None else state
+
+	@staticmethod
+	def stateItems(name: str, state: Union[List[np.ndarray], None]) -> Dict[str, np.ndarray]:
+		"""arrays of state named name0, name1, ..., none if state is None"""
+		return {} if state is None else {f'{name}{i}': a for i, a in enumerate(state)}
+
+	@staticmethod
+	def stateList(name: str, items: Dict[str, np.ndarray]) -> Union[List[np.ndarray], None]:
+		"""copies of the arrays named name0, name1, ... in items, None if there are none"""
+		state = []
+		while f'{name}{len(state)}' in items:
+			state.append(np.array(items[f'{name}{len(state)}']))
+		return state if state else None
+
+
+class SGD(Optimizer):
+	"""stochastic gradient descent with momentum
+		v = momentum * v + lr * grad
+		param -= v, or param -= momentum * v + lr * grad if nesterov"""
+
+	def __init__(self, lr: float = 0.01, momentum: float = 0.0, nesterov: bool = False):
+		super().__init__(lr)
+		self.momentum: float = momentum
+		self.nesterov: bool = nesterov
+		self.__v: Union[List[np.ndarray], None] = None
+
+	def reset(self):
+		self.__v = None
+
+	def getState(self) -> Dict[str, np.ndarray]:
+		return Optimizer.stateItems('v', self.__v)
+
+	def setState(self, state: Dict[str, np.ndarray]):
+		self.__v = Optimizer.stateList('v', state)
+
+	def step(self, params: List[np.ndarray], grads: List[np.ndarray]):
+		if self.momentum == 0.0:
+			for p, g in zip(params, grads):
+				p -= self.lr * g
+			return
+		self.__v = Optimizer.state(self.__v, params)
+		for p, g, v in zip(params, grads, self.__v):
+			v *= self.momentum
+			v += self.lr * g
+			if self.nesterov:
+				p -= self.momentum * v + self.lr * g
+			else:
+				p -= v
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({getFloatStr(self.lr)}, {self.momentum}, {self.nesterov})'
+
+
+class RMSProp(Optimizer):
+	"""s = rho * s + (1 - rho) * grad^2
+		param -= lr * grad / (sqrt(s) + epsilon)"""
+
+	def __init__(self, lr: float = 0.001, rho: float = 0.9, epsilon: float = 1e-8):
+		super().__init__(lr)
+		self.rho: float = rho
+		self.epsilon: float = epsilon
+		self.__s: Union[List[np.ndarray], None] = None
+
+	def reset(self):
+		self.__s = None
+
+	def getState(self) -> Dict[str, np.ndarray]:
+		return Optimizer.stateItems('s', self.__s)
+
+	def setState(self, state: Dict[str, np.ndarray]):
+		self.__s = Optimizer.stateList('s', state)
+
+	def step(self, params: List[np.ndarray], grads: List[np.ndarray]):
+		self.__s = Optimizer.state(self.__s, params)
+		for p, g, s in zip(params, grads, self.__s):
+			s *= self.rho
+			s += (1 - self.rho) * g * g
+			d = np.sqrt(s)
+			d += self.epsilon
+			np.divide(g, d, d)
+			d *= self.lr
+			p -= d
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({getFloatStr(self.lr)}, {self.rho})'
+
+
+class Adam(Optimizer):
+	"""m = beta1 * m + (1 - beta1) * grad
+		v = beta2 * v + (1 - beta2) * grad^2
+		param -= lr * m / (1 - beta1^t) / (sqrt(v / (1 - beta2^t)) + epsilon)"""
+
+	def __init__(self, lr: float = 0.001, beta1: float = 0.9, beta2: float = 0.999, epsilon: float = 1e-8):
+		super().__init__(lr)
+		self.beta1: float = beta1
+		self.beta2: float = beta2
+		self.epsilon: float = epsilon
+		self.__m: Union[List[np.ndarray], None] = None
+		self.__v: Union[List[np.ndarray], None] = None
+		self.__t: int = 0
+
+	def reset(self):
+		self.__m = None
+		self.__v = None
+		self.__t = 0
+
+	def getState(self) -> Dict[str, np.ndarray]:
+		return {**Optimizer.stateItems('m', self.__m), **Optimizer.stateItems('v', self.__v), 't': np.array(self.__t)}
+
+	def setState(self, state: Dict[str, np.ndarray]):
+		self.__m = Optimizer.stateList('m', state)
+		self.__v = Optimizer.stateList('v', state)
+		self.__t = int(state['t']) if 't' in state else 0
+
+	def step(self, params: List[np.ndarray], grads: List[np.ndarray]):
+		self.__m = Optimizer.state(self.__m, params)
+		self.__v = Optimizer.state(self.__v, params)
+		self.__t += 1
+		lr = self.lr / (1 - self.beta1 ** self.__t)
+		scale = 1 / np.sqrt(1 - self.beta2 ** self.__t)
+		for p, g, m, v in zip(params, grads, self.__m, self.__v):
+			m *= self.beta1
+			m += (1 - self.beta1) * g
+			v *= self.beta2
+			v += (1 - self.beta2) * g * g
+			d = np.sqrt(v)
+			d *= scale
+			d += self.epsilon
+			np.divide(m, d, d)
+			d *= lr
+			p -= d
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({getFloatStr(self.lr)}, {self.beta1}, {self.beta2})'
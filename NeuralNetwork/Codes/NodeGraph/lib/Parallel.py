@@ -0,0 +1,139 @@
+import mmap
+import multiprocessing
+from typing import List, Tuple, Union
+
+import numpy as np
+
+
+def sharedArray(shape: tuple, dtype: type = float) -> np.ndarray:
+	"""array on anonymous shared memory, which is shared with processes forked after it is made"""
+	nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+	return np.frombuffer(mmap.mmap(-1, nbytes), dtype, int(np.prod(shape))).reshape(shape)
+
+
+class DataParallel:
+	"""minibatches of a NodeGraph split over forked worker processes holding replicas of the graph
+		the graph propagates the first shard of each batch, and worker k propagates shard k
+		parameters are sent to the workers, and the gradients of the shards are summed into the graph by shared memory,
+		so that the graph updates parameters once for each batch
+		processes are forked, which is supported on Linux, and they end by close()"""
+
+	def __init__(self, ng, nProcs: int, batchSize: int, x: Union[np.ndarray, Tuple, List], t: np.ndarray):
+		"""
+		:param ng: graph after preFit(), it propagates the first shard in micro-batches of ng.microSize()
+		:param nProcs: the number of processes including this one
+		:param x: an array, tuple of arrays or list of arrays with the shapes of the data
+		:param t: target with the shape of the data
+		"""
+		self.ng = ng
+		self.single: bool = isinstance(x, np.ndarray)
+		self.shards: List[Tuple[int, int]] = DataParallel.split(batchSize, nProcs)
+		# inputs and targets of batches, gradients and (loss, accurate count) of shards
+		xs = (x,) if self.single else tuple(x)
+		self.x: tuple = tuple(sharedArray((batchSize,) + a.shape[1:], ng.dtype) for a in xs)
+		self.t: np.ndarray = sharedArray((batchSize,) + t.shape[1:], t.dtype)
+		self.param: np.ndarray = sharedArray(ng.flat.param.shape, ng.flat.dtype)
+		self.grads: np.ndarray = sharedArray((len(self.shards),) + ng.flat.grad.shape, ng.flat.dtype)
+		self.stats: np.ndarray = sharedArray((len(self.shards), 2))
+
+		# worker threads of each process share the cores
+		self.__nThreads: Union[int, None] = ng.executor.nThreads
+		ng.executor.nThreads = max(1, ng.executor.size // len(self.shards))
+		ng.executor.shutdown()
+		context = multiprocessing.get_context('fork')
+		self.__conns = []
+		self.__procs = []
+		for rank in range(1, len(self.shards)):
+			conn, child = context.Pipe()
+			proc = context.Process(target=self.__work, args=(child, rank), daemon=True)
+			proc.start()
+			child.close()
+			self.__conns.append(conn)
+			self.__procs.append(proc)
+		start, end = self.shards[0]
+		ng.prePropTr(ng.microSize(end - start))
+
+	@staticmethod
+	def split(n: int, count: int) -> List[Tuple[int, int]]:
+		"""split range(n) into count shards of nearly equal sizes, no more than n"""
+		count = max(1, min(count, n))
+		siz, rem = divmod(n, count)
+		shards = []
+		start = 0
+		for i in range(count):
+			end = start + siz + (1 if i < rem else 0)
+			shards.append((start, end))
+			start = end
+		return shards
+
+	def __shard(self, rank: int) -> Tuple[Union[np.ndarray, tuple], np.ndarray]:
+		start, end = self.shards[rank]
+		x = tuple(a[start:end] for a in self.x)
+		return x[0] if self.single else x, self.t[start:end]
+
+	def __work(self, conn, rank: int):
+		"""loop of a worker process, ng is the replica copied by fork"""
+		ng = self.ng
+		try:
+			start, end = self.shards[rank]
+			ng.prePropTr(ng.microSize(end - start))
+			while conn.recv() == 'grad':
+				np.copyto(ng.flat.param, self.param)
+				self.stats[rank] = ng.propagateGrad(*self.__shard(rank))
+				np.copyto(self.grads[rank], ng.flat.grad)
+				conn.send(None)
+		except EOFError:
+			# the graph process ended
+			pass
+		except BaseException as e:
+			conn.send(f'{e.__class__.__name__}: {e}')
+		finally:
+			conn.close()
+
+	def load(self, x: Union[np.ndarray, Tuple, List], t: np.ndarray):
+		"""copy a batch to the workers"""
+		start = self.shards[0][1]
+		for a, b in zip((x,) if self.single else x, self.x):
+			np.copyto(b[start:], a[start:])
+		np.copyto(self.t[start:], t[start:])
+
+	def propagate(self, x: Union[np.ndarray, Tuple, List], t: np.ndarray):
+		"""propagate the loaded batch forward and backward at the current parameters of the graph
+			gradients of all shards are summed into the graph, and adjusted by the regularizer and clipping
+		:param x: the batch loaded by load(), its first shard is propagated by the graph
+		"""
+		ng = self.ng
+		np.copyto(self.param, ng.flat.param)
+		for conn in self.__conns:
+			conn.send('grad')
+		start, end = self.shards[0]
+		self.stats[0] = ng.propagateGrad(x[start:end] if self.single else tuple(a[start:end] for a in x), t[start:end])
+		errors = [(rank, conn.recv()) for rank, conn in enumerate(self.__conns, 1)]
+		for rank, error in errors:
+			if error is not None:
+				raise Exception(f'worker {rank} failed, {error}')
+		grad = ng.flat.grad
+		grad += self.grads[1:].sum(0)
+		ng.adjustGrad()
+
+	def trLoss(self) -> float:
+		return self.stats[:, 0].sum()
+
+	def trAccurateCount(self) -> int:
+		return int(self.stats[:, 1].sum())
+
+	def close(self):
+		for conn in self.__conns:
+			try:
+				conn.send('stop')
+			except (BrokenPipeError, OSError):
+				pass
+			conn.close()
+		for proc in self.__procs:
+			proc.join()
+		self.__conns, self.__procs = [], []
+		self.ng.executor.nThreads = self.__nThreads
+		self.ng.executor.shutdown()
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({len(self.shards)}, {[end - start for start, end in self.shards]})'
@@ -0,0 +1,99 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .Regularizer import Regularizer
+
+# attribute names of fit sets in each vector, weights then biases
+NAMES: Dict[str, Tuple[str, str]] = {'param': ('W', 'B'), 'paramPrev': ('WPrev', 'BPrev'),
+									 'grad': ('gradW', 'gradB'), 'gradPrev': ('gradWPrev', 'gradBPrev')}
+
+
+class FlatParams:
+	"""parameters and gradients of fit sets as views of four contiguous vectors
+		param, paramPrev, grad and gradPrev hold W, WPrev, gradW and gradWPrev of every fit set followed by B, BPrev, ...
+		so that weights are vector[:wSize]
+		updates, dot products and snapshots of all fit sets are single operations on the vectors"""
+
+	def __init__(self, fitSets: Tuple, dtype: type = float, accDtype: type = float):
+		"""
+		:param fitSets: fit sets after preFit, their arrays are replaced by views of the vectors keeping values
+		:param dtype: type of the vectors
+		:param accDtype: type in which dot products and norms are accumulated
+		"""
+		self.fitSets: Tuple = fitSets
+		self.dtype: type = dtype
+		self.accDtype: type = accDtype
+		self.wSize: int = sum(fset.W.size for fset in fitSets)
+		self.size: int = self.wSize + sum(fset.B.size for fset in fitSets)
+		self.vectors: Dict[str, np.ndarray] = {}
+		for key, names in NAMES.items():
+			vec = np.empty(self.size, dtype)
+			offset = 0
+			for name in names:
+				for fset in fitSets:
+					arr = getattr(fset, name)
+					view = vec[offset:offset + arr.size].reshape(arr.shape)
+					view[...] = arr
+					setattr(fset, name, view)
+					offset += arr.size
+			self.vectors[key] = vec
+
+	@property
+	def param(self) -> np.ndarray:
+		return self.vectors['param']
+
+	@property
+	def grad(self) -> np.ndarray:
+		return self.vectors['grad']
+
+	def sendCurrToPrev(self):
+		"""swap current and previous parameters and gradients of all fit sets"""
+		for fset in self.fitSets:
+			fset.sendCurrToPrev()
+		v = self.vectors
+		v['param'], v['paramPrev'] = v['paramPrev'], v['param']
+		v['grad'], v['gradPrev'] = v['gradPrev'], v['grad']
+
+	def updateAdaptive(self, lr: float):
+		"""param = paramPrev - lr * gradPrev"""
+		v = self.vectors
+		np.subtract(v['paramPrev'], np.multiply(lr, v['gradPrev'], v['param']), v['param'])
+
+	def dot(self, a: np.ndarray, b: np.ndarray) -> float:
+		"""dot product of vectors accumulated in accDtype"""
+		if np.dtype(self.accDtype) == a.dtype:
+			return np.dot(a, b)
+		return np.sum(np.multiply(a, b, dtype=self.accDtype))
+
+	def gradDot(self) -> float:
+		return self.dot(self.vectors['grad'], self.vectors['gradPrev'])
+
+	def regularize(self, reg: Regularizer):
+		"""add the gradient of reg of weights to grad"""
+		self.grad[:self.wSize] += reg.grad(self.param[:self.wSize])
+
+	def regLoss(self, reg: Regularizer) -> float:
+		"""value of reg of weights, whose gradient is added by regularize()"""
+		return float(reg.loss(self.param[:self.wSize].astype(self.accDtype, copy=False)))
+
+	def clip(self, maxNorm: float) -> float:
+		"""scale grad so that its norm is at most maxNorm
+		:return: the norm before scaling
+		"""
+		grad = self.grad
+		norm = np.sqrt(self.dot(grad, grad))
+		if norm > maxNorm:
+			grad *= maxNorm / norm
+		return norm
+
+	def snapshot(self) -> np.ndarray:
+		"""copy of parameters"""
+		return self.param.copy()
+
+	def restore(self, snapshot: np.ndarray):
+		"""set parameters to a snapshot"""
+		np.copyto(self.param, snapshot)
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({self.size}, {self.wSize})'
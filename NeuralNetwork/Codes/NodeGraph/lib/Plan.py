@@ -0,0 +1,235 @@
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from .Loss import LossFunc1D
+from .Memory import MemoryPlan
+from .MidSet import *
+
+# forward kernels of mid sets and the loss function for each kind of data
+KERNELS = {'tr': 'pushTrX', 'te': 'pushTeX', 'pr': 'pushPrX', 'both': 'pushBothX'}
+
+
+class ExecutionPlan:
+	"""flat execution plan built by NodeGraph.compile()
+		steps are the mid sets in topological order followed by the loss function
+
+		forward propagation of kind 'tr', 'te', 'pr' or 'both' runs over steps in order
+			copy outputs of prevSets into the inputs of the step, then call pushTrX, pushTeX, pushPrX or pushBothX
+		backward propagation runs over mid sets in reverse order
+			sum gradient fragments of nextSets into gradY of the step, then call pullGradY
+
+		the copies are bound to the buffers of node sets by bind(), which must follow every prePropTr, prePropTe, ...
+		then place() moves buffers which are not kept between propagations onto an arena"""
+
+	def __init__(self, startSets: Tuple, midSets: Tuple, lossFunc: LossFunc1D, fuse: bool = True, fuseLoss: bool = True):
+		"""
+		:param fuse: whether elementwise activations are computed in place by the fit sets followed by them
+		:param fuseLoss: whether the loss function computes the activation followed by it only, like Softmax1D and Cce1D
+		"""
+		self.startSets: Tuple = startSets
+		self.lossFunc: LossFunc1D = lossFunc
+		self.steps: Tuple = ExecutionPlan.sort(startSets, midSets + (lossFunc,))
+		if self.steps[-1] is not lossFunc:
+			raise Exception('loss function must be the last node set')
+		self.midSteps: Tuple = self.steps[:-1]
+
+		# activations fused into their prevSets, they have no kernels of their own
+		#	their buffers are the outputs and gradY of their prevSets
+		self.fused: frozenset = ExecutionPlan.fuse(self.midSteps, fuse)
+		# activation fused into the loss function, it has no kernels of its own
+		#	the loss function obtains its outputs and gradX
+		self.lossFused: frozenset = ExecutionPlan.fuseLoss(self.midSteps, lossFunc, fuseLoss)
+
+		# forward copies of each kind
+		#	fwdCopies[kind][k] = [(dst, src), ...] for steps[k]
+		#	src is an array, or an int which is the index of a start set
+		#	outputs written directly into the inputs of the next set have no copy
+		#	fwdCopies['both'] joins 'tr' and 'te', test inputs are indexed after train inputs
+		self.fwdCopies: Dict[str, List[List[tuple]]] = {}
+
+		# backward copies
+		#	bwdCopies[k] = (gradY of midSteps[k], [gradient fragments from nextSets])
+		#	the list is None if gradY is a part of gradX of the next set
+		self.bwdCopies: List[tuple] = []
+
+		# memory plans of the last prePropTr, prePropTe, prePropPr or prePropBoth
+		self.memory: Dict[str, MemoryPlan] = {}
+
+	@staticmethod
+	def sort(startSets: Tuple, nodeSets: Tuple) -> Tuple:
+		"""topological sort of nodeSets, ties are kept in the order of nodeSets"""
+		needs = {nset.Id: sum(1 for pset in nset.prevSets if pset not in startSets) for nset in nodeSets}
+		ready = [nset for nset in nodeSets if needs[nset.Id] == 0]
+		order = []
+		while ready:
+			nset = ready.pop(0)
+			order.append(nset)
+			for mset in getattr(nset, 'nextSets', ()):
+				needs[mset.Id] -= 1
+				if needs[mset.Id] == 0:
+					ready.append(mset)
+		if len(order) != len(nodeSets):
+			raise Exception('node graph is not connected or has a cycle')
+		return tuple(order)
+
+	@staticmethod
+	def fuse(midSets: Tuple, enabled: bool = True) -> frozenset:
+		"""fuse elementwise activations into their prevSets, a single set followed by the activation only
+			fusions of a previous plan are removed first
+		:return: fused activations
+		"""
+		for mset in midSets:
+			mset.fuse(None)
+		fused = []
+		for act in midSets if enabled else ():
+			if getattr(act, 'fusible', False) and len(act.prevSets) == 1:
+				pset = act.prevSets[0]
+				if pset in midSets and len(pset.nextSets) == 1 and pset.fuse(act):
+					fused.append(act)
+		return frozenset(fused)
+
+	@staticmethod
+	def fuseLoss(midSets: Tuple, lossFunc: LossFunc1D, enabled: bool = True) -> frozenset:
+		"""fuse the activation followed by the loss function only into the loss function
+			the fusion of a previous plan is removed first
+		:return: fused activation, empty if none
+		"""
+		lossFunc.fuse(None)
+		if enabled and len(lossFunc.prevSets) == 1:
+			act = lossFunc.prevSets[0]
+			if act in midSets and len(act.nextSets) == 1 and lossFunc.fuse(act):
+				return frozenset((act,))
+		return frozenset()
+
+	def request(self, memory: MemoryPlan, kind: str, start: int = 0):
+		"""request buffers of kind('te', 'pr' or 'grad') of mid sets to memory with their lifetimes
+			steps[k] runs forward at time start + k, and midSteps[k] runs backward at time start + len(midSteps) - 1 - k
+			buffers must be bound, a buffer lives while any view of it is used
+			views bound to buffers of other node sets are not requested"""
+		# uses[k] = (node set, name, times when the buffer is used)
+		uses = []
+		if kind == 'grad':
+			last = len(self.midSteps) - 1
+			times = {mset: start + last - k for k, mset in enumerate(self.midSteps)}
+			for mset in self.midSteps:
+				# gradX is read by prevSets
+				prevs = [times[pset] for pset in mset.prevSets if pset not in self.startSets]
+				uses += [(mset, 'gradY', [times[mset]]), (mset, 'gradX', [times[mset]] + prevs)]
+			prevs = [times[pset] for pset in self.lossFunc.prevSets if pset not in self.startSets]
+			uses.append((self.lossFunc, 'gradY', [start] + prevs))
+		else:
+			times = {nset: start + k for k, nset in enumerate(self.steps)}
+			for mset in self.midSteps:
+				# outputs are read by nextSets
+				uses += [(mset, kind + 'X', [times[mset]]), (mset, kind + 'Y', [times[nset] for nset in (mset,) + mset.nextSets])]
+			uses.append((self.lossFunc, kind + 'Y', [times[self.lossFunc]]))
+		uses = [(getattr(nset, name), ts) for nset, name, ts in uses if getattr(nset, name) is not None]
+
+		for mset in self.midSteps:
+			for name in mset.plannedBuffers(kind):
+				buf = getattr(mset, name)
+				if buf.base is not None:
+					continue
+				ts = [times[mset]] + [t for arr, ts in uses if np.may_share_memory(arr, buf) for t in ts]
+				memory.request(mset, name, min(ts), max(ts))
+
+	def place(self, kind: str):
+		"""place buffers allocated by prePropTr, prePropTe, prePropPr or prePropBoth on an arena, and bind them again
+		:param kind: one of 'tr', 'te', 'pr' and 'both'
+			test buffers are free during backward propagation, so 'both' places them with gradients
+		"""
+		memory = MemoryPlan()
+		if kind in ('te', 'pr', 'both'):
+			self.request(memory, 'te' if kind == 'both' else kind)
+		if kind in ('tr', 'both'):
+			self.request(memory, 'grad', len(self.steps))
+		memory.place()
+		for k in (('tr', 'te') if kind == 'both' else (kind,)):
+			self.bind(k)
+		# plans replaced by this one
+		if kind == 'both':
+			self.memory.pop('tr', None)
+			self.memory.pop('te', None)
+		elif kind != 'pr':
+			self.memory.pop('both', None)
+		self.memory[kind] = memory
+
+	def bind(self, kind: str):
+		"""bind copies to the buffers of kind 'tr', 'te' or 'pr'
+			binding 'tr' also binds the backward copies
+			a mid set with a single next set writes its outputs directly into the input buffer of the next set,
+			and reads its gradY directly from gradX of the next set, if it can"""
+		for act in self.fused:
+			# outputs of a fused activation are the outputs of its prevSet
+			y = getattr(act.prevSets[0], kind + 'Y')
+			setattr(act, kind + 'X', y)
+			setattr(act, kind + 'Y', y)
+			if kind == 'tr':
+				act.gradX = act.gradY = act.prevSets[0].gradY
+		copies = []
+		# next sets are bound before their previous sets so that inputs of a next set are final
+		for step in reversed(self.steps):
+			stepCopies = []
+			for i, pset in enumerate(step.prevSets):
+				dst = step.xFrag(kind, i)
+				if pset in self.startSets:
+					stepCopies.append((dst, self.startSets.index(pset)))
+				elif len(pset.nextSets) > 1 or not pset.bindY(kind, dst):
+					stepCopies.append((dst, getattr(pset, kind + 'Y')))
+			copies.append(stepCopies)
+		self.fwdCopies[kind] = copies[::-1]
+		if kind in ('tr', 'te') and 'tr' in self.fwdCopies and 'te' in self.fwdCopies:
+			count = len(self.startSets)
+			self.fwdCopies['both'] = [tr + [(dst, src + count if isinstance(src, int) else src) for dst, src in te]
+									  for tr, te in zip(self.fwdCopies['tr'], self.fwdCopies['te'])]
+		if kind == 'tr':
+			bwdCopies = []
+			# next sets are bound before their previous sets so that gradX of a next set is final
+			for mset in reversed(self.midSteps):
+				if len(mset.nextSets) == 1 and mset.bindGradY(mset.nextSets[0].gradXFrag(mset.nextInd[0])):
+					frags = None
+				else:
+					frags = [nset.gradXFrag(nind) for nset, nind in zip(mset.nextSets, mset.nextInd)]
+				bwdCopies.append((mset.gradY, frags))
+			self.bwdCopies = bwdCopies[::-1]
+
+	def push(self, kind: str, x: Union[np.ndarray, Tuple, List], y: Union[np.ndarray, Tuple, List] = None):
+		"""forward propagation
+		:param kind: one of 'tr', 'te', 'pr' and 'both'
+		:param x: inputs of start sets, an array is given to every start set
+		:param y: test inputs if kind == 'both'
+		"""
+		xs = (x,) * len(self.startSets) if isinstance(x, np.ndarray) else tuple(x)
+		if kind == 'both':
+			xs += (y,) * len(self.startSets) if isinstance(y, np.ndarray) else tuple(y)
+		copies = self.fwdCopies[kind]
+		kernel = KERNELS[kind]
+		for step, stepCopies in zip(self.midSteps, copies):
+			for dst, src in stepCopies:
+				np.copyto(dst, xs[src] if isinstance(src, int) else src)
+			if step not in self.fused and step not in self.lossFused:
+				getattr(step, kernel)()
+		for dst, src in copies[-1]:
+			np.copyto(dst, xs[src] if isinstance(src, int) else src)
+		getattr(self.lossFunc, kernel)()
+
+	def pull(self):
+		"""backward propagation"""
+		self.lossFunc.evalGrad()
+		for step, (gradY, frags) in zip(reversed(self.midSteps), reversed(self.bwdCopies)):
+			if frags is None:
+				# gradY is a part of gradX of the next set
+				pass
+			elif frags:
+				np.copyto(gradY, frags[0])
+				for frag in frags[1:]:
+					gradY += frag
+			else:
+				# step does not reach the loss function
+				gradY.fill(0.0)
+			if step not in self.fused and step not in self.lossFused:
+				step.pullGradY()
+
+	def __str__(self) -> str:
+		return ' > '.join(step.name + ('*' if step in self.fused or step in self.lossFused else '') for step in self.steps)
@@ -3,12 +3,18 @@ from .NodeGraph import *
 from .DataTools import *
 
 
+def plotSparse(values: np.ndarray, label: str):
+	"""plot values of the epochs where they are not NaN, like test losses evaluated every evalEvery epochs"""
+	epochs = np.flatnonzero(~np.isnan(values))
+	plt.plot(epochs, values[epochs], label=label)
+
+
 def plotLoss(ng: NodeGraph, zero=False, legend=True):
 	if zero:
 		plt.plot([0, len(ng.trLosses)], [0, 0], label='zeros')
 	plt.plot(ng.trLosses, label='train loss')
 	if ng.teLosses is not None:
-		plt.plot(ng.teLosses, label='test loss')
+		plotSparse(ng.teLosses, 'test loss')
 	if legend:
 		plt.legend()
 
@@ -18,7 +24,7 @@ def plotAccuracy(ng: NodeGraph, one=False, legend=True):
 		plt.plot([0, len(ng.trAccuracy)], [1, 1], label='ones')
 	plt.plot(ng.trAccuracy, label='train accuracy')
 	if ng.teAccuracy is not None:
-		plt.plot(ng.teAccuracy, label='test accuracy')
+		plotSparse(ng.teAccuracy, 'test accuracy')
 	if legend:
 		plt.legend()
 
@@ -1,71 +1,100 @@
 from .MidSet import *
+from .Util import windows1D, windows2D
+
+
+def poolDim(xdim: int, step: int, stride: int) -> int:
+	"""the number of pools of size step at distance stride, which start before xdim
+		pools cover xdim if stride <= step, and the last pool may be partial"""
+	return min((max(xdim - step, 0) + stride - 1) // stride, (xdim - 1) // stride) + 1
 
 
 class MaxPool1D(MidSet1D):
-	def __init__(self, step: int, name: str = None):
+	"""max of pools of size step at distance stride
+		pools overlap if stride < step
+		inputs are views of buffers padded with -inf so that every pool is full"""
+
+	def __init__(self, step: int, name: str = None, stride: int = None):
+		"""
+		:param step: size of pools
+		:param stride: distance between pools, step if None
+		"""
 		super().__init__(UNKNOWN, UNKNOWN, name)
 		self.step: int = step
-		# index of maximum
+		self.stride: int = step if stride is None else stride
+		# length of padded inputs
+		self.padDim: int = UNKNOWN
+		# index of maximum in each pool
 		self.ind: Union[np.ndarray, None] = None
 
 	def compile(self) -> bool:
 		if super(MaxPool1D, self).compile():
-			self.ydim = (self.xdim - 1) // self.step + 1
+			self.ydim = poolDim(self.xdim, self.step, self.stride)
+			self.padDim = max((self.ydim - 1) * self.stride + self.step, self.xdim)
 			self.ychs = self.xchs
 			return True
 		else:
 			return False
 
+	def __buffer(self, siz: int, fill: float) -> np.ndarray:
+		"""buffer of inputs, a view of the buffer padded with fill if padding is needed
+			windows of the view reach the padding, so the memory planner must not replace it"""
+		if self.padDim == self.xdim:
+			return np.empty((siz, self.xdim, self.xchs), self.dtype)
+		return np.full((siz, self.padDim, self.xchs), fill, self.dtype)[:, :self.xdim]
+
+	def __windows(self, x: np.ndarray, writeable: bool = False) -> np.ndarray:
+		"""view of x with shape (n, ydim, step, chs), x is a buffer made by __buffer()"""
+		if self.stride == self.step and self.padDim == self.xdim:
+			# inputs are divided evenly
+			return x.reshape((x.shape[0], self.ydim, self.step, self.xchs))
+		return windows1D(x, self.step, self.stride, self.ydim, writeable)
+
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.trX = np.empty((trSiz, self.xdim, self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
-		self.gradX = np.empty_like(self.trX)
-		self.gradY = np.empty_like(self.trY)
-		self.teX = np.empty((teSiz, self.xdim, self.xchs))
-		self.teY = np.empty((teSiz, self.ydim, self.ychs))
-		self.ind = np.empty_like(self.trY, int)
+		self.prePropTr(trSiz)
+		self.prePropTe(teSiz)
 
 	def prePropTr(self, trSiz: int):
-		self.trX = np.empty((trSiz, self.xdim, self.xchs))
-		self.trY = np.empty((trSiz, self.ydim, self.ychs))
-		self.gradX = np.empty_like(self.trX)
+		self.trX = self.__buffer(trSiz, -np.inf)
+		self.trY = np.empty((trSiz, self.ydim, self.ychs), self.dtype)
+		self.gradX = self.__buffer(trSiz, 0.0)
 		self.gradY = np.empty_like(self.trY)
-		self.ind = np.empty_like(self.trY, int)
+		self.ind = np.empty((trSiz, self.ydim, self.ychs), int)
+
+	def prePropTe(self, teSiz: int):
+		self.teX = self.__buffer(teSiz, -np.inf)
+		self.teY = np.empty((teSiz, self.ydim, self.ychs), self.dtype)
+
+	def prePropPr(self, prSiz: int):
+		self.prX = self.__buffer(prSiz, -np.inf)
+		self.prY = np.empty((prSiz, self.ydim, self.ychs), self.dtype)
 
 	def pushBothX(self):
-		start = 0
-		for i in range(self.ydim):
-			end = start + self.step
-			self.ind[:, i] = np.argmax(self.trX[:, start:end], 1) + start
-			self.teY[:, i] = np.max(self.teX[:, start:end], 1)
-			start = end
-		self.trY[:] = np.take_along_axis(self.trX, self.ind, 1)
+		self.pushTrX()
+		self.pushTeX()
 
 	def pushTrX(self):
-		start = 0
-		for i in range(self.ydim):
-			end = start + self.step
-			self.ind[:, i] = np.argmax(self.trX[:, start:end], 1) + start
-			start = end
-		self.trY[:] = np.take_along_axis(self.trX, self.ind, 1)
+		win = self.__windows(self.trX)
+		win.argmax(2, self.ind)
+		np.copyto(self.trY, np.take_along_axis(win, self.ind[:, :, np.newaxis], 2)[:, :, 0])
 
 	def pushTeX(self):
-		start = 0
-		for i in range(self.ydim):
-			end = start + self.step
-			self.teY[:, i] = np.max(self.teX[:, start:end], 1)
-			start = end
+		self.__windows(self.teX).max(2, self.teY)
 
 	def pushPrX(self):
-		start = 0
-		for i in range(self.ydim):
-			end = start + self.step
-			self.prY[:, i] = np.max(self.prX[:, start:end], 1)
-			start = end
+		self.__windows(self.prX).max(2, self.prY)
 
 	def pullGradY(self):
-		self.gradX.fill(0.0)
-		np.put_along_axis(self.gradX, self.ind, self.gradY, 1)
+		if self.stride >= self.step:
+			# pools do not overlap
+			self.gradX.fill(0.0)
+			np.put_along_axis(self.__windows(self.gradX, True), self.ind[:, :, np.newaxis], self.gradY[:, :, np.newaxis], 2)
+		else:
+			# sum gradients of pools sharing their maximum
+			siz = self.gradY.shape[0]
+			pos = self.ind + np.arange(0, self.ydim * self.stride, self.stride)[:, np.newaxis]
+			flat = (np.arange(siz)[:, np.newaxis, np.newaxis] * self.padDim + pos) * self.xchs + np.arange(self.xchs)
+			grad = np.bincount(flat.reshape(-1), self.gradY.reshape(-1), siz * self.padDim * self.xchs)
+			np.copyto(self.gradX, grad.reshape((siz, self.padDim, self.xchs))[:, :self.xdim])
 
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.ydim})'
@@ -77,130 +106,112 @@ class MaxPool1D(MidSet1D):
 		return s[:-1] + ')'
 
 	def saveStr(self) -> str:
-		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.step};'
+		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.step}, {self.stride};'
 		for pset in self.prevSets:
 			s += f' {pset.Id},'
 		return s[:-1] + ')'
 
 
 class MaxPool2D(MidSet2D):
-	def __init__(self, step: Union[tuple, list], name: str = None):
+	"""max of pools of size step at distance stride
+		pools overlap if stride < step
+		inputs are views of buffers padded with -inf so that every pool is full"""
+
+	def __init__(self, step: Union[tuple, list], name: str = None, stride: Union[tuple, list] = None):
+		"""
+		:param step: size of pools
+		:param stride: distance between pools, step if None
+		"""
 		super().__init__(UNKNOWN, UNKNOWN, name)
 		self.step: tuple = tuple(step)
-		# index of maximum
-		self.ind0: Union[np.ndarray, None] = None
-		self.ind1: Union[np.ndarray, None] = None
-		self.trMed: Union[np.ndarray, None] = None
-		self.teMed: Union[np.ndarray, None] = None
-		self.prMed: Union[np.ndarray, None] = None
+		self.stride: tuple = self.step if stride is None else tuple(stride)
+		# size of padded inputs
+		self.padDim: tuple = (UNKNOWN, UNKNOWN)
+		# index of maximum in each pool flattened
+		self.ind: Union[np.ndarray, None] = None
+		# pools of trX flattened, shape (n, ydim[0], ydim[1], chs, step[0] * step[1])
+		self.trWin: Union[np.ndarray, None] = None
 
 	def compile(self) -> bool:
 		if super().compile():
-			self.ydim = ((self.xdim[0] - 1) // self.step[0] + 1, (self.xdim[1] - 1) // self.step[1] + 1)
+			self.ydim = tuple(poolDim(self.xdim[k], self.step[k], self.stride[k]) for k in range(2))
+			self.padDim = tuple(max((self.ydim[k] - 1) * self.stride[k] + self.step[k], self.xdim[k]) for k in range(2))
 			self.ychs = self.xchs
 			return True
 		else:
 			return False
 
+	def __buffer(self, siz: int, fill: float) -> np.ndarray:
+		"""buffer of inputs, a view of the buffer padded with fill if padding is needed
+			windows of the view reach the padding, so the memory planner must not replace it"""
+		if self.padDim == self.xdim:
+			return np.empty((siz, self.xdim[0], self.xdim[1], self.xchs), self.dtype)
+		return np.full((siz, self.padDim[0], self.padDim[1], self.xchs), fill, self.dtype)[:, :self.xdim[0], :self.xdim[1]]
+
+	def __windows(self, x: np.ndarray, writeable: bool = False) -> np.ndarray:
+		"""view of x with shape (n, ydim[0], ydim[1], step[0], step[1], chs), x is a buffer made by __buffer()"""
+		if self.stride == self.step and self.padDim == self.xdim:
+			# inputs are divided evenly
+			return x.reshape((x.shape[0], self.ydim[0], self.step[0], self.ydim[1], self.step[1], self.xchs)).transpose((0, 1, 3, 2, 4, 5))
+		return windows2D(x, self.step, self.stride, self.ydim, writeable)
+
+	def __flatWindows(self) -> np.ndarray:
+		"""view of trWin with the shape of __windows()"""
+		return self.trWin.reshape(self.trWin.shape[:4] + self.step).transpose((0, 1, 2, 4, 5, 3))
+
 	def prePropBoth(self, trSiz: int, teSiz: int):
-		self.trX = np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs))
-		# self.trY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
-		self.gradX = np.empty_like(self.trX)
-		self.gradY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
-		self.teX = np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.teY = np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs))
-
-		# self.trMed = np.empty((trSiz, self.ydim[0], self.xdim[1], self.xchs))
-		self.teMed = np.empty((teSiz, self.ydim[0], self.xdim[1], self.xchs))
-		self.ind0 = np.empty((trSiz, self.ydim[0], self.xdim[1], self.xchs), int)
-		self.ind1 = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), int)
+		self.prePropTr(trSiz)
+		self.prePropTe(teSiz)
 
 	def prePropTr(self, trSiz: int):
-		self.trX = np.empty((trSiz, self.xdim[0], self.xdim[1], self.xchs))
-		# self.trY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
-		self.gradX = np.empty_like(self.trX)
-		self.gradY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs))
-
-		# self.trMed = np.empty((trSiz, self.ydim[0], self.xdim[1], self.xchs))
-		self.ind0 = np.empty((trSiz, self.ydim[0], self.xdim[1], self.xchs), int)
-		self.ind1 = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), int)
+		self.trX = self.__buffer(trSiz, -np.inf)
+		self.trY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
+		self.gradX = self.__buffer(trSiz, 0.0)
+		self.gradY = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
+		self.ind = np.empty((trSiz, self.ydim[0], self.ydim[1], self.ychs), int)
+		self.trWin = np.empty((trSiz, self.ydim[0], self.ydim[1], self.xchs, self.step[0] * self.step[1]), self.dtype)
 
 	def prePropTe(self, teSiz: int):
-		self.teX = np.empty((teSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.teY = np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs))
-		self.teMed = np.empty((teSiz, self.ydim[0], self.xdim[1], self.xchs))
+		self.teX = self.__buffer(teSiz, -np.inf)
+		self.teY = np.empty((teSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
 	def prePropPr(self, prSiz: int):
-		self.prX = np.empty((prSiz, self.xdim[0], self.xdim[1], self.xchs))
-		self.prY = np.empty((prSiz, self.ydim[0], self.ydim[1], self.ychs))
-		self.prMed = np.empty((prSiz, self.ydim[0], self.xdim[1], self.xchs))
+		self.prX = self.__buffer(prSiz, -np.inf)
+		self.prY = np.empty((prSiz, self.ydim[0], self.ydim[1], self.ychs), self.dtype)
 
 	def pushBothX(self):
-		start = 0
-		for i in range(self.ydim[0]):
-			end = start + self.step[0]
-			self.trX[:, start:end].argmax(1, self.ind0[:, i])
-			self.ind0[:, i] += start
-			self.teX[:, start:end].max(1, self.teMed[:, i])
-			start = end
-
-		self.trMed = np.take_along_axis(self.trX, self.ind0, 1)
-		start = 0
-		for i in range(self.ydim[1]):
-			end = start + self.step[1]
-			self.trMed[:, :, start:end].argmax(2, self.ind1[:, :, i])
-			self.ind1[:, :, i] += start
-			self.teMed[:, :, start:end].max(2, self.teY[:, :, i])
-			start = end
-		self.trY = np.take_along_axis(self.trMed, self.ind1, 2)
+		self.pushTrX()
+		self.pushTeX()
 
 	def pushTrX(self):
-		start = 0
-		for i in range(self.ydim[0]):
-			end = start + self.step[0]
-			self.trX[:, start:end].argmax(1, self.ind0[:, i])
-			self.ind0[:, i] += start
-			start = end
-
-		self.trMed = np.take_along_axis(self.trX, self.ind0, 1)
-		start = 0
-		for i in range(self.ydim[1]):
-			end = start + self.step[1]
-			self.trMed[:, :, start:end].argmax(2, self.ind1[:, :, i])
-			self.ind1[:, :, i] += start
-			start = end
-		self.trY = np.take_along_axis(self.trMed, self.ind1, 2)
+		# pools are flattened to find the index of maximum at once
+		np.copyto(self.__flatWindows(), self.__windows(self.trX))
+		self.trWin.argmax(4, self.ind)
+		np.copyto(self.trY, np.take_along_axis(self.trWin, self.ind[..., np.newaxis], 4)[..., 0])
 
 	def pushTeX(self):
-		start = 0
-		for i in range(self.ydim[0]):
-			end = start + self.step[0]
-			self.teX[:, start:end].max(1, self.teMed[:, i])
-			start = end
-		start = 0
-		for i in range(self.ydim[1]):
-			end = start + self.step[1]
-			self.teMed[:, :, start:end].max(2, self.teY[:, :, i])
-			start = end
+		self.__windows(self.teX).max((3, 4), self.teY)
 
 	def pushPrX(self):
-		start = 0
-		for i in range(self.ydim[0]):
-			end = start + self.step[0]
-			self.prX[:, start:end].max(1, self.prMed[:, i])
-			start = end
-		start = 0
-		for i in range(self.ydim[1]):
-			end = start + self.step[1]
-			self.prMed[:, :, start:end].max(2, self.prY[:, :, i])
-			start = end
+		self.__windows(self.prX).max((3, 4), self.prY)
 
 	def pullGradY(self):
-		self.gradX.fill(0.0)
-		self.trMed.fill(0.0)
-
-		np.put_along_axis(self.trMed, self.ind1, self.gradY, 2)
-		np.put_along_axis(self.gradX, self.ind0, self.trMed, 1)
+		if self.stride[0] >= self.step[0] and self.stride[1] >= self.step[1]:
+			# pools do not overlap, gradients are scattered in flattened pools
+			if self.stride != self.step:
+				self.gradX.fill(0.0)
+			self.trWin.fill(0.0)
+			np.put_along_axis(self.trWin, self.ind[..., np.newaxis], self.gradY[..., np.newaxis], 4)
+			np.copyto(self.__windows(self.gradX, True), self.__flatWindows())
+		else:
+			# sum gradients of pools sharing their maximum
+			siz = self.gradY.shape[0]
+			row = self.ind // self.step[1] + np.arange(0, self.ydim[0] * self.stride[0], self.stride[0])[:, np.newaxis, np.newaxis]
+			col = self.ind % self.step[1] + np.arange(0, self.ydim[1] * self.stride[1], self.stride[1])[:, np.newaxis]
+			flat = ((np.arange(siz)[:, np.newaxis, np.newaxis, np.newaxis] * self.padDim[0] + row) * self.padDim[1] + col) * self.xchs \
+				   + np.arange(self.xchs)
+			grad = np.bincount(flat.reshape(-1), self.gradY.reshape(-1), siz * self.padDim[0] * self.padDim[1] * self.xchs)
+			np.copyto(self.gradX, grad.reshape((siz,) + self.padDim + (self.xchs,))[:, :self.xdim[0], :self.xdim[1]])
 
 	def shortStr(self) -> str:
 		return f'{self.__class__.__name__}({self.name}, {self.ydim})'
@@ -212,7 +223,7 @@ class MaxPool2D(MidSet2D):
 		return s[:-1] + ')'
 
 	def saveStr(self) -> str:
-		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.step};'
+		s = f'{self.__class__.__name__}({self.Id}, {self.name}, {self.step}, {self.stride};'
 		for pset in self.prevSets:
 			s += f' {pset.Id},'
 		return s[:-1] + ')'
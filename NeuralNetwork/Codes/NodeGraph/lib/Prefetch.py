@@ -0,0 +1,96 @@
+import queue
+import threading
+import time
+from typing import Callable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+
+class Prefetcher:
+	"""minibatches gathered by a background thread into a ring of preallocated buffers
+		while a batch is trained, the next depth batches are gathered, cast to dtype and augmented
+		waitTime is the time in seconds the training thread waited for batches"""
+
+	def __init__(self, x: Union[np.ndarray, Tuple, List], t: np.ndarray, batchSize: int, depth: int = 2,
+				 augment: Callable = None, dtype: type = float):
+		"""
+		:param x: either array, tuple of arrays or list of arrays
+		:param t: target
+		:param depth: the number of batches gathered ahead, batches are gathered by the training thread if 0
+		:param augment: augment(x, t) modifies a gathered batch in place, x is an array or a tuple of arrays
+		:param dtype: type of x of batches
+		"""
+		self.single: bool = isinstance(x, np.ndarray)
+		self.x: tuple = (x,) if self.single else tuple(x)
+		self.t: np.ndarray = t
+		self.batchSize: int = batchSize
+		self.depth: int = max(0, depth)
+		self.augment: Union[Callable, None] = augment
+		# ring of depth + 1 buffers, one of which is trained while the others are gathered
+		self.__ring: List[tuple] = [(tuple(np.empty((batchSize,) + a.shape[1:], dtype) for a in self.x),
+									 np.empty((batchSize,) + t.shape[1:], t.dtype)) for _ in range(self.depth + 1)]
+		self.waitTime: float = 0.0
+
+	def __gather(self, slot: int, ind: np.ndarray) -> Tuple[Union[np.ndarray, tuple], np.ndarray]:
+		xs, t = self.__ring[slot]
+		for a, b in zip(self.x, xs):
+			if a.dtype == b.dtype:
+				# mode 'clip' writes into b directly
+				np.take(a, ind, 0, b, 'clip')
+			else:
+				np.copyto(b, a[ind])
+		if self.t.dtype == t.dtype:
+			np.take(self.t, ind, 0, t, 'clip')
+		else:
+			np.copyto(t, self.t[ind])
+		x = xs[0] if self.single else xs
+		if self.augment is not None:
+			self.augment(x, t)
+		return x, t
+
+	def source(self, x: Union[np.ndarray, Tuple, List], t: np.ndarray):
+		"""gather batches from other data of the same shapes, like the next shard of a Dataset
+			called when no batches are being gathered"""
+		self.x = (x,) if self.single else tuple(x)
+		self.t = t
+
+	def batches(self, perm: np.ndarray) -> Iterator[Tuple[Union[np.ndarray, tuple], np.ndarray]]:
+		"""batches (x, t) of data perm[k * batchSize:(k + 1) * batchSize], an incomplete last batch is dropped
+			a batch is valid until the next one is requested"""
+		count = len(perm) // self.batchSize
+		if self.depth == 0:
+			for k in range(count):
+				yield self.__gather(0, perm[k * self.batchSize:(k + 1) * self.batchSize])
+			return
+
+		free, ready = queue.Queue(), queue.Queue()
+		for slot in range(len(self.__ring)):
+			free.put(slot)
+		stop = threading.Event()
+
+		def produce():
+			try:
+				for k in range(count):
+					slot = free.get()
+					if slot is None or stop.is_set():
+						return
+					ready.put((slot, self.__gather(slot, perm[k * self.batchSize:(k + 1) * self.batchSize])))
+			except BaseException as e:
+				ready.put((None, e))
+
+		thread = threading.Thread(target=produce, daemon=True)
+		thread.start()
+		try:
+			for _ in range(count):
+				start = time.perf_counter()
+				slot, batch = ready.get()
+				self.waitTime += time.perf_counter() - start
+				if slot is None:
+					raise batch
+				yield batch
+				# the batch is trained, its buffers are gathered again
+				free.put(slot)
+		finally:
+			stop.set()
+			free.put(None)
+			thread.join()
@@ -8,10 +8,10 @@ class Regularizer(metaclass=ABCMeta):
 	def __init__(self):
 		pass
 
-	#
-	# @abstractmethod
-	# def loss(self, fitSets: Iterable[FitSet]) -> Union[float, np.ndarray]:
-	# 	pass
+	@abstractmethod
+	def loss(self, K: np.ndarray) -> float:
+		"""value added to the loss, whose gradient is grad(K)"""
+		pass
 
 	@abstractmethod
 	def grad(self, K: np.ndarray) -> Union[float, np.ndarray]:
@@ -22,9 +22,8 @@ class RegNone(Regularizer):
 	def __init__(self):
 		super().__init__()
 
-	#
-	# def loss(self, fitSets: Iterable[FitSet]) -> float:
-	# 	return 0.0
+	def loss(self, K: np.ndarray) -> float:
+		return 0.0
 
 	def grad(self, K: np.ndarray) -> float:
 		return 0.0
@@ -38,11 +37,8 @@ class Ridge(Regularizer):
 		super().__init__()
 		self.rate = rate
 
-	# def loss(self, fitSets: Iterable[FitSet]) -> float:
-	# 	value = 0.0
-	# 	for fset in fitSets:
-	# 		value += 0.5 * self.rate * np.sum(fset.Kernel * fset.Kernel)
-	# 	return value
+	def loss(self, K: np.ndarray) -> float:
+		return 0.5 * self.rate * np.sum(K * K)
 
 	def grad(self, K: np.ndarray) -> np.ndarray:
 		return self.rate * K
@@ -56,11 +52,8 @@ class Lasso(Regularizer):
 		super().__init__()
 		self.rate = rate
 
-	# def loss(self, fitSets: Iterable[FitSet]) -> float:
-	# 	value = 0.0
-	# 	for fset in fitSets:
-	# 		value += self.rate * np.sum(np.abs(fset.Kernel))
-	# 	return value
+	def loss(self, K: np.ndarray) -> float:
+		return self.rate * np.sum(np.abs(K))
 
 	def grad(self, K: np.ndarray) -> np.ndarray:
 		return self.rate * np.sign(K)
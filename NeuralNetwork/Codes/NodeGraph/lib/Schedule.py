@@ -0,0 +1,91 @@
+from abc import ABCMeta, abstractmethod
+
+import numpy as np
+
+from .Util import getFloatStr
+
+
+class Schedule(metaclass=ABCMeta):
+	"""learning rate of each step as a factor of the learning rate of the optimizer
+		steps are updates of parameters, or epochs if perEpoch
+		factor(step, steps) is evaluated for step in range(steps)"""
+
+	def __init__(self, perEpoch: bool = False):
+		self.perEpoch: bool = perEpoch
+
+	@abstractmethod
+	def factor(self, step: int, steps: int) -> float:
+		pass
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({"epoch" if self.perEpoch else "update"})'
+
+
+class StepDecay(Schedule):
+	"""factor = gamma ** (step // size)"""
+
+	def __init__(self, size: int, gamma: float = 0.1, perEpoch: bool = True):
+		super().__init__(perEpoch)
+		self.size: int = size
+		self.gamma: float = gamma
+
+	def factor(self, step: int, steps: int) -> float:
+		return self.gamma ** (step // self.size)
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({self.size}, {getFloatStr(self.gamma)})'
+
+
+class CosineDecay(Schedule):
+	"""factor decreases from 1 to minFactor along a half cosine"""
+
+	def __init__(self, minFactor: float = 0.0, perEpoch: bool = False):
+		super().__init__(perEpoch)
+		self.minFactor: float = minFactor
+
+	def factor(self, step: int, steps: int) -> float:
+		return self.minFactor + (1 - self.minFactor) * .5 * (1 + np.cos(np.pi * step / max(1, steps - 1)))
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({getFloatStr(self.minFactor)})'
+
+
+class Warmup(Schedule):
+	"""factor increases linearly to 1 in the first size steps, then follows schedule over the rest steps"""
+
+	def __init__(self, size: int, schedule: Schedule = None, perEpoch: bool = False):
+		"""
+		:param schedule: schedule after warming up, constant if None, perEpoch of this schedule is used
+		"""
+		super().__init__(perEpoch)
+		self.size: int = size
+		self.schedule: Schedule = schedule
+
+	def factor(self, step: int, steps: int) -> float:
+		if step < self.size:
+			return (step + 1) / self.size
+		return 1.0 if self.schedule is None else self.schedule.factor(step - self.size, steps - self.size)
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({self.size}, {self.schedule})'
+
+
+class OneCycle(Schedule):
+	"""factor increases from 1 to maxFactor along a half cosine in the first part of steps,
+		then decreases to finalFactor along a half cosine"""
+
+	def __init__(self, maxFactor: float = 10.0, part: float = 0.3, finalFactor: float = 1.0E-3, perEpoch: bool = False):
+		super().__init__(perEpoch)
+		self.maxFactor: float = maxFactor
+		self.part: float = part
+		self.finalFactor: float = finalFactor
+
+	def factor(self, step: int, steps: int) -> float:
+		up = max(1, int(self.part * steps))
+		if step < up:
+			return self.maxFactor + (1 - self.maxFactor) * .5 * (1 + np.cos(np.pi * step / up))
+		down = max(1, steps - 1 - up)
+		return self.finalFactor + (self.maxFactor - self.finalFactor) * .5 * (1 + np.cos(np.pi * (step - up) / down))
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({getFloatStr(self.maxFactor)}, {self.part}, {getFloatStr(self.finalFactor)})'
@@ -20,25 +20,6 @@ class StartSet1D(NodeSet):
 		# index of self in each next MidSets
 		self.nextInd: np.ndarray = np.array([], int)
 
-	def pushBoth(self, trXFrag: np.ndarray, teXFrag: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushBoth(nind, trXFrag, teXFrag)
-
-	def pushTr(self, trXFrag: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushTr(nind, trXFrag)
-
-	def pushTe(self, teXFrag: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushTe(nind, teXFrag)
-
-	def pushPr(self, prX: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushPr(nind, prX)
-
-	def pullGrad(self, gradYFrag: np.ndarray):
-		pass
-
 	def __str__(self) -> str:
 		return f'{self.__class__.__name__}({self.Id}, {self.name}, {self.ydim}, {self.ychs})'
 
@@ -64,25 +45,6 @@ class StartSet2D(NodeSet):
 		# index of self in each next MidSets
 		self.nextInd: np.ndarray = np.array([], int)
 
-	def pushBoth(self, trXFrag: np.ndarray, teXFrag: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushBoth(nind, trXFrag, teXFrag)
-
-	def pushTr(self, trXFrag: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushTr(nind, trXFrag)
-
-	def pushTe(self, teXFrag: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushTe(nind, teXFrag)
-
-	def pushPr(self, prX: np.ndarray):
-		for nset, nind in zip(self.nextSets, self.nextInd):
-			nset.pushPr(nind, prX)
-
-	def pullGrad(self, gradYFrag: np.ndarray):
-		pass
-
 	def __str__(self) -> str:
 		return f'{self.__class__.__name__}({self.Id}, {self.name}, ({self.ydim[0]},{self.ydim[1]}), {self.ychs})'
 
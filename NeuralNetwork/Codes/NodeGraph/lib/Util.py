@@ -1,3 +1,6 @@
+import os
+from typing import Dict, List, Tuple, Union
+
 import numpy as np
 
 
@@ -17,3 +20,65 @@ def getClass(name: str):
 	for pkg in parts[1:]:
 		c = getattr(c, pkg)
 	return c
+
+
+def parseSaveStr(s: str) -> Tuple[str, List[str], List[int]]:
+	"""split saveStr() of a node set, like 'Conv2D(5, cv2_0, (3, 3), 8, True, (1, 1), (1, 1); 2, 3,)'
+	:return: class name, arguments as strings, Ids of prevSets
+	"""
+	name, body = s.strip().split('(', 1)
+	body = body[:body.rindex(')')]
+	head, _, tail = body.partition(';')
+	args, depth, start = [], 0, 0
+	for i, ch in enumerate(head):
+		if ch == '(':
+			depth += 1
+		elif ch == ')':
+			depth -= 1
+		elif ch == ',' and depth == 0:
+			args.append(head[start:i].strip())
+			start = i + 1
+	args.append(head[start:].strip())
+	return name.strip(), args, [int(i) for i in tail.split(',') if i.strip()]
+
+
+def savezAtomic(path: str, arrays: Dict[str, np.ndarray]):
+	"""np.savez to a temporary file renamed to path after written, so that path is either the old file or the new one"""
+	tmp = f'{path}.tmp'
+	with open(tmp, 'wb') as f:
+		np.savez(f, **arrays)
+		f.flush()
+		os.fsync(f.fileno())
+	os.replace(tmp, path)
+
+
+def dataSize(x: Union[np.ndarray, Tuple, List]) -> int:
+	"""the number of data of an array, or of the arrays of a tuple or a list"""
+	return x.shape[0] if isinstance(x, np.ndarray) else x[0].shape[0]
+
+
+def dataSlice(x: Union[np.ndarray, Tuple, List], start: int, end: int) -> Union[np.ndarray, Tuple]:
+	"""data from start to end of an array, or of the arrays of a tuple or a list"""
+	return x[start:end] if isinstance(x, np.ndarray) else tuple(a[start:end] for a in x)
+
+
+def dataTake(x: Union[np.ndarray, Tuple, List], ind: np.ndarray) -> Union[np.ndarray, Tuple]:
+	"""data of indices ind of an array, or of the arrays of a tuple or a list"""
+	return x[ind] if isinstance(x, np.ndarray) else tuple(a[ind] for a in x)
+
+
+def windows1D(x: np.ndarray, filSiz: int, stride: int, ydim: int, writeable: bool = False) -> np.ndarray:
+	"""read only strided view of x with shape (n, ydim, filSiz, chs)
+		windows1D(x, ...)[:, j] == x[:, j * stride:j * stride + filSiz]
+		the view may be writeable only if windows do not overlap"""
+	s = x.strides
+	return np.lib.stride_tricks.as_strided(x, (x.shape[0], ydim, filSiz, x.shape[2]), (s[0], s[1] * stride, s[1], s[2]), writeable=writeable)
+
+
+def windows2D(x: np.ndarray, filSiz: tuple, stride: tuple, ydim: tuple, writeable: bool = False) -> np.ndarray:
+	"""read only strided view of x with shape (n, ydim[0], ydim[1], filSiz[0], filSiz[1], chs)
+		windows2D(x, ...)[:, i, j] == x[:, i * stride[0]:i * stride[0] + filSiz[0], j * stride[1]:j * stride[1] + filSiz[1]]
+		the view may be writeable only if windows do not overlap"""
+	s = x.strides
+	return np.lib.stride_tricks.as_strided(x, (x.shape[0], ydim[0], ydim[1], filSiz[0], filSiz[1], x.shape[3]),
+										   (s[0], s[1] * stride[0], s[2] * stride[1], s[1], s[2], s[3]), writeable=writeable)